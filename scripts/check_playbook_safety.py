@@ -9,6 +9,11 @@ except ImportError:
     print("Missing dependency: pip install pyyaml")
     sys.exit(1)
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 REQUIRED_SAFETY_KEYWORDS = [
     "DO NOT",
@@ -17,16 +22,24 @@ REQUIRED_SAFETY_KEYWORDS = [
 ]
 
 
+def _has_do_not(constraints):
+    """True if any constraint contains 'DO NOT' (skips str() for string items)."""
+    return any(
+        ("DO NOT" in c) if isinstance(c, str) else ("DO NOT" in str(c))
+        for c in constraints
+    )
+
+
 def check_safety_constraints():
     """Check all playbooks have safety constraints."""
     base_dir = Path(__file__).parent.parent
     playbooks_dir = base_dir / "src" / "bhd_cli" / "assistant" / "playbooks" / "library"
 
+    playbook_files = sorted(playbooks_dir.glob("*.yaml"))
     errors = []
-    for playbook_file in playbooks_dir.glob("*.yaml"):
+    for playbook_file in playbook_files:
         try:
-            with open(playbook_file) as f:
-                playbook_data = yaml.safe_load(f)
+            playbook_data = yaml.load(playbook_file.read_bytes(), Loader=YamlLoader)
 
             # Check safety_constraints field exists
             if "safety_constraints" not in playbook_data:
@@ -39,8 +52,7 @@ def check_safety_constraints():
                 continue
 
             # Check for DO NOT constraints
-            has_do_not = any("DO NOT" in str(c) for c in constraints)
-            if not has_do_not:
+            if not _has_do_not(constraints):
                 errors.append(f"✗ {playbook_file.name}: Missing 'DO NOT' constraints")
 
             print(f"✓ {playbook_file.name} ({len(constraints)} safety constraints)")
@@ -54,7 +66,7 @@ def check_safety_constraints():
             print(f"  {error}")
         return False
 
-    print(f"\n✓ All playbooks have safety constraints")
+    print(f"\n✓ All playbooks have safety constraints ({len(playbook_files)} checked)")
     return True
 
 
@@ -14,46 +14,23 @@ def validate_policy_patterns():
         print(f"Policy guard file not found: {guard_file}")
         return False
 
-    with open(guard_file) as f:
-        content = f.read()
-
-    # Extract pattern lists
-    errors = []
-
-    # Find ALWAYS_BLOCKED_PATTERNS
-    always_match = re.search(r'ALWAYS_BLOCKED_PATTERNS = \[(.*?)\]', content, re.DOTALL)
-    if always_match:
-        patterns_text = always_match.group(1)
-        patterns = re.findall(r'r"([^"]+)"', patterns_text)
-
-        print(f"Checking {len(patterns)} always-blocked patterns...")
-        for pattern in patterns:
-            try:
-                re.compile(pattern, re.IGNORECASE)
-                print(f"  ✓ {pattern[:50]}")
-            except re.error as e:
-                errors.append(f"✗ Invalid regex: {pattern}: {e}")
-
-    # Find VALIDATION_ONLY_BLOCKED_PATTERNS
-    level0_match = re.search(r'VALIDATION_ONLY_BLOCKED_PATTERNS = \[(.*?)\]', content, re.DOTALL)
-    if level0_match:
-        patterns_text = level0_match.group(1)
-        patterns = re.findall(r'r"([^"]+)"', patterns_text)
-
-        print(f"\nChecking {len(patterns)} validation-only patterns...")
-        for pattern in patterns:
-            try:
-                re.compile(pattern, re.IGNORECASE)
-                print(f"  ✓ {pattern[:50]}")
-            except re.error as e:
-                errors.append(f"✗ Invalid regex: {pattern}: {e}")
-
-    if errors:
+    # The guard compiles its patterns at import, so importing it is the check
+    sys.path.insert(0, str(base_dir / "src"))
+    try:
+        from bhd_cli.assistant.policy.guard import PolicyGuard
+    except re.error as e:
         print("\nValidation errors:")
-        for error in errors:
-            print(f"  {error}")
+        print(f"  ✗ Invalid regex: {e.pattern}: {e}")
         return False
 
+    print(f"Checking {len(PolicyGuard.ALWAYS_BLOCKED_COMPILED)} always-blocked patterns...")
+    for compiled in PolicyGuard.ALWAYS_BLOCKED_COMPILED:
+        print(f"  ✓ {compiled.pattern[:50]}")
+
+    print(f"\nChecking {len(PolicyGuard.VALIDATION_ONLY_BLOCKED_COMPILED)} validation-only patterns...")
+    for compiled in PolicyGuard.VALIDATION_ONLY_BLOCKED_COMPILED:
+        print(f"  ✓ {compiled.pattern[:50]}")
+
     print("\n✓ All policy patterns valid")
     return True
 
@@ -11,6 +11,16 @@ except ImportError:
     print("Missing dependencies: pip install jsonschema pyyaml")
     sys.exit(1)
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def validate_playbooks():
     """Validate all playbooks against schema."""
@@ -22,19 +32,28 @@ def validate_playbooks():
         print(f"Schema file not found: {schema_file}")
         return False
 
-    with open(schema_file) as f:
-        schema = json.load(f)
+    schema = json_loads(schema_file.read_bytes())
+
+    # Build the validator once ($schema picks the draft) and reuse it for every file
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
 
+    playbook_files = sorted(playbooks_dir.glob("*.yaml"))
     errors = []
-    for playbook_file in playbooks_dir.glob("*.yaml"):
+    for playbook_file in playbook_files:
         try:
             with open(playbook_file) as f:
-                playbook_data = yaml.safe_load(f)
+                playbook_data = yaml.load(f, Loader=YamlLoader)
 
-            jsonschema.validate(playbook_data, schema)
-            print(f"✓ {playbook_file.name}")
-        except jsonschema.ValidationError as e:
-            errors.append(f"✗ {playbook_file.name}: {e.message}")
+            file_errors = [
+                f"✗ {playbook_file.name}: {e.message}"
+                for e in validator.iter_errors(playbook_data)
+            ]
+            if file_errors:
+                errors.extend(file_errors)
+            else:
+                print(f"✓ {playbook_file.name}")
         except Exception as e:
             errors.append(f"✗ {playbook_file.name}: {e}")
 
@@ -44,7 +63,7 @@ def validate_playbooks():
             print(f"  {error}")
         return False
 
-    print(f"\n✓ All playbooks valid ({len(list(playbooks_dir.glob('*.yaml')))} checked)")
+    print(f"\n✓ All playbooks valid ({len(playbook_files)} checked)")
     return True
 
 
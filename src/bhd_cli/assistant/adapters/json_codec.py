@@ -0,0 +1,62 @@
+"""JSON encoding/decoding helpers shared by the adapters.
+
+JSONL records are written compact and key-sorted: by orjson when it is
+installed, and by the stdlib encoder otherwise or whenever orjson rejects a
+value (e.g. non-str dict keys, which json coerces to strings). Lines from
+either encoder parse back to the same records.
+"""
+import json
+from typing import Any, Union
+
+# orjson is an optional speedup (pip install bhd-cli[fast]); its decode error
+# subclasses json.JSONDecodeError, so callers catch the same exception either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_compact(data: Any) -> bytes:
+    """Compact, key-sorted stdlib encoding."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_sorted(data: Any) -> bytes:
+    """Serialize to compact, key-sorted JSON (a stable key for equal content)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # orjson.JSONEncodeError; let the stdlib encoder try
+    return _dumps_compact(data)
+
+
+def dumps_line(data: Any) -> bytes:
+    """Serialize to one key-sorted JSON line (newline-terminated) for JSONL files."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # orjson.JSONEncodeError; let the stdlib encoder try
+    return _dumps_compact(data) + b"\n"
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """Serialize to 2-space indented, key-sorted JSON for human-facing output.
+
+    Non-ASCII text is escaped (\\u00e9) as json.dumps does; orjson can't
+    escape, so its output is only used when it is pure ASCII. Either way
+    the bytes don't depend on whether orjson is installed.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        if payload.isascii():
+            return payload
+    return json.dumps(data, indent=2, sort_keys=True).encode()
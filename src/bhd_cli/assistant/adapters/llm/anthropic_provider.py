@@ -1,9 +1,12 @@
 """Anthropic provider (cloud)."""
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from ...core.ports import ILLMPort
+from ..json_codec import loads
+from .prompts import render_system_prompt
+from .safety import is_safe_text
 
 
 class AnthropicProvider(ILLMPort):
@@ -20,6 +23,19 @@ class AnthropicProvider(ILLMPort):
             raise ValueError("Anthropic API key required (set ANTHROPIC_API_KEY env var)")
         self.model = model
         self.timeout = timeout
+        self._client = None
+
+    @property
+    def client(self):
+        """Anthropic client, created on first use and reused across calls."""
+        if self._client is None:
+            try:
+                import anthropic
+            except ImportError:
+                raise ImportError("anthropic package required. Install with: pip install anthropic")
+
+            self._client = anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout)
+        return self._client
 
     def generate_structured(
         self,
@@ -28,24 +44,20 @@ class AnthropicProvider(ILLMPort):
         temperature: float = 0.0
     ) -> Dict[str, Any]:
         """Generate structured JSON output conforming to schema."""
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError("anthropic package required. Install with: pip install anthropic")
-
-        client = anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout)
+        return self._complete(prompt, render_system_prompt(schema), temperature)
 
-        system_prompt = f"""You are a security analysis assistant. You MUST respond with ONLY valid JSON that matches this schema:
-
-{json.dumps(schema, indent=2)}
+    def bind_schema(
+        self,
+        schema: Dict[str, Any],
+        temperature: float = 0.0
+    ) -> Callable[[str], Dict[str, Any]]:
+        """Return prompt -> result with the system prompt rendered once."""
+        system_prompt = render_system_prompt(schema)
+        return lambda prompt: self._complete(prompt, system_prompt, temperature)
 
-Rules:
-- Output ONLY the JSON object, no markdown, no explanations
-- Follow the schema exactly
-- All required fields must be present
-- Do not include exploit code, payloads, or bypass instructions
-- Focus on validation, evidence collection, and risk assessment
-"""
+    def _complete(self, prompt: str, system_prompt: str, temperature: float) -> Dict[str, Any]:
+        """Send one prompt with a prepared system prompt and parse the JSON reply."""
+        client = self.client
 
         try:
             response = client.messages.create(
@@ -59,7 +71,7 @@ Rules:
             )
 
             content = response.content[0].text
-            return json.loads(content)
+            return loads(content)
 
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse Anthropic response as JSON: {e}")
@@ -69,16 +81,7 @@ Rules:
     def validate_safety(self, text: str) -> bool:
         """Check if text passes safety validation."""
         # Anthropic has built-in safety, but do basic check
-        dangerous_patterns = [
-            "exploit code",
-            "payload generation",
-            "bypass authentication",
-            "reverse shell",
-            "backdoor",
-            "malware"
-        ]
-        text_lower = text.lower()
-        return not any(pattern in text_lower for pattern in dangerous_patterns)
+        return is_safe_text(text)
 
     def is_available(self) -> bool:
         """Check if Anthropic is available."""
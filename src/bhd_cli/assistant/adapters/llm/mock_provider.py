@@ -1,8 +1,30 @@
 """Mock LLM provider for testing."""
 import json
+from types import MappingProxyType
 from typing import Any, Dict
 
 from ...core.ports import ILLMPort
+from .safety import is_safe_text
+
+
+# Built once at import; generate_structured hands out copies
+_MOCK_HYPOTHESIS = MappingProxyType({
+    "id": "mock123456789abc",
+    "related_observations": ("obs-1", "obs-2"),
+    "title": "Mock Hypothesis: Service Exposure Risk",
+    "description": (
+        "Analysis indicates potential service exposure based on open ports and service "
+        "detection results. This warrants validation to confirm actual risk level."
+    ),
+    "risk_tags": ("exposure", "network", "validation-needed"),
+    "confidence": 0.75,
+    "rationale": (
+        "Based on observations obs-1 and obs-2 showing open administrative services, this "
+        "hypothesis suggests potential unauthorized access risk if proper authentication "
+        "controls are not in place."
+    ),
+    "requires_validation": True
+})
 
 
 class MockLLMProvider(ILLMPort):
@@ -33,30 +55,16 @@ class MockLLMProvider(ILLMPort):
         if self.should_fail:
             raise RuntimeError("Mock provider configured to fail")
 
-        # Return a valid hypothesis structure
+        # Return a valid hypothesis structure (lists, as JSON schema arrays require)
         return {
-            "id": "mock123456789abc",
-            "related_observations": ["obs-1", "obs-2"],
-            "title": "Mock Hypothesis: Service Exposure Risk",
-            "description": "Analysis indicates potential service exposure based on open ports and service detection results. This warrants validation to confirm actual risk level.",
-            "risk_tags": ["exposure", "network", "validation-needed"],
-            "confidence": 0.75,
-            "rationale": "Based on observations obs-1 and obs-2 showing open administrative services, this hypothesis suggests potential unauthorized access risk if proper authentication controls are not in place.",
-            "requires_validation": True
+            **_MOCK_HYPOTHESIS,
+            "related_observations": list(_MOCK_HYPOTHESIS["related_observations"]),
+            "risk_tags": list(_MOCK_HYPOTHESIS["risk_tags"]),
         }
 
     def validate_safety(self, text: str) -> bool:
         """Mock safety validation."""
-        dangerous_patterns = [
-            "exploit code",
-            "payload generation",
-            "bypass authentication",
-            "reverse shell",
-            "backdoor",
-            "malware"
-        ]
-        text_lower = text.lower()
-        return not any(pattern in text_lower for pattern in dangerous_patterns)
+        return is_safe_text(text)
 
     def is_available(self) -> bool:
         """Mock is always available."""
@@ -1,11 +1,21 @@
 """Ollama provider for local LLM inference."""
 import json
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Callable, Dict, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...core.ports import ILLMPort
+from ..json_codec import loads
+from .prompts import render_system_prompt
+from .safety import is_safe_text
+
+# Seconds an availability probe result is reused. Kept per base URL at module
+# level so routers built per request (e.g. in a CLI loop) share one probe.
+AVAILABILITY_TTL = 30.0
+_availability: Dict[str, Tuple[float, bool]] = {}
 
 
 class OllamaProvider(ILLMPort):
@@ -21,6 +31,12 @@ class OllamaProvider(ILLMPort):
         self.model = model
         self.timeout = timeout
 
+        # One pooled session so repeated calls reuse the keep-alive connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def generate_structured(
         self,
         prompt: str,
@@ -28,19 +44,19 @@ class OllamaProvider(ILLMPort):
         temperature: float = 0.0
     ) -> Dict[str, Any]:
         """Generate structured JSON output conforming to schema."""
-        # Build system prompt with schema requirement
-        system_prompt = f"""You are a security analysis assistant. You MUST respond with ONLY valid JSON that matches this schema:
-
-{json.dumps(schema, indent=2)}
+        return self._complete(prompt, render_system_prompt(schema), temperature)
 
-Rules:
-- Output ONLY the JSON object, no markdown, no explanations
-- Follow the schema exactly
-- All required fields must be present
-- Do not include exploit code, payloads, or bypass instructions
-- Focus on validation, evidence collection, and risk assessment
-"""
+    def bind_schema(
+        self,
+        schema: Dict[str, Any],
+        temperature: float = 0.0
+    ) -> Callable[[str], Dict[str, Any]]:
+        """Return prompt -> result with the system prompt rendered once."""
+        system_prompt = render_system_prompt(schema)
+        return lambda prompt: self._complete(prompt, system_prompt, temperature)
 
+    def _complete(self, prompt: str, system_prompt: str, temperature: float) -> Dict[str, Any]:
+        """Send one prompt with a prepared system prompt and parse the JSON reply."""
         payload = {
             "model": self.model,
             "prompt": prompt,
@@ -51,17 +67,17 @@ Rules:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            result = loads(response.content)
 
             # Parse the response
             response_text = result.get("response", "")
-            return json.loads(response_text)
+            return loads(response_text)
 
         except requests.exceptions.ConnectionError:
             raise ConnectionError(f"Could not connect to Ollama at {self.base_url}")
@@ -75,21 +91,27 @@ Rules:
     def validate_safety(self, text: str) -> bool:
         """Check if text passes safety validation."""
         # Basic safety check - look for obvious weaponized content
-        dangerous_patterns = [
-            "exploit code",
-            "payload generation",
-            "bypass authentication",
-            "reverse shell",
-            "backdoor",
-            "malware"
-        ]
-        text_lower = text.lower()
-        return not any(pattern in text_lower for pattern in dangerous_patterns)
+        return is_safe_text(text)
 
     def is_available(self) -> bool:
-        """Check if Ollama is available."""
+        """Check if Ollama is available (probe result cached for AVAILABILITY_TTL)."""
+        now = time.monotonic()
+        cached = _availability.get(self.base_url)
+        if cached is not None and now - cached[0] < AVAILABILITY_TTL:
+            return cached[1]
+
+        available = self._probe()
+        _availability[self.base_url] = (now, available)
+        return available
+
+    def _probe(self) -> bool:
+        """Ask the Ollama server whether it is up."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except:
             return False
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
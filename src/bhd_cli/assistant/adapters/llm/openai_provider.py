@@ -1,9 +1,31 @@
 """OpenAI provider (cloud)."""
+import asyncio
+import importlib.util
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from ...core.ports import ILLMPort
+from ..json_codec import loads
+from .prompts import render_system_prompt
+from .safety import is_safe_text
+
+
+# Pool limits shared by the sync and async HTTP clients
+_POOL_LIMITS = dict(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30)
+
+
+def _http_client_kwargs() -> Dict[str, Any]:
+    """
+    Extra client kwargs for the openai SDK's httpx transport. HTTP/2 needs the
+    optional h2 package (pip install 'httpx[http2]'); without it the SDK
+    default HTTP/1.1 pool is used.
+    """
+    if importlib.util.find_spec("h2") is None:
+        return {}
+    import httpx
+
+    return {"http2": True, "limits": httpx.Limits(**_POOL_LIMITS)}
 
 
 class OpenAIProvider(ILLMPort):
@@ -20,6 +42,25 @@ class OpenAIProvider(ILLMPort):
             raise ValueError("OpenAI API key required (set OPENAI_API_KEY env var)")
         self.model = model
         self.timeout = timeout
+        self._client = None
+        # (event loop, AsyncOpenAI) - the async client's connections belong to one loop
+        self._async_client = None
+
+    @property
+    def client(self):
+        """OpenAI client, created on first use and reused across calls."""
+        if self._client is None:
+            try:
+                import openai
+            except ImportError:
+                raise ImportError("openai package required. Install with: pip install openai")
+
+            kwargs = _http_client_kwargs()
+            http_client = openai.DefaultHttpxClient(**kwargs) if kwargs else None
+            self._client = openai.OpenAI(
+                api_key=self.api_key, timeout=self.timeout, http_client=http_client
+            )
+        return self._client
 
     def generate_structured(
         self,
@@ -28,24 +69,20 @@ class OpenAIProvider(ILLMPort):
         temperature: float = 0.0
     ) -> Dict[str, Any]:
         """Generate structured JSON output conforming to schema."""
-        try:
-            import openai
-        except ImportError:
-            raise ImportError("openai package required. Install with: pip install openai")
+        return self._complete(prompt, render_system_prompt(schema), temperature)
 
-        client = openai.OpenAI(api_key=self.api_key, timeout=self.timeout)
-
-        system_prompt = f"""You are a security analysis assistant. You MUST respond with ONLY valid JSON that matches this schema:
-
-{json.dumps(schema, indent=2)}
+    def bind_schema(
+        self,
+        schema: Dict[str, Any],
+        temperature: float = 0.0
+    ) -> Callable[[str], Dict[str, Any]]:
+        """Return prompt -> result with the system prompt rendered once."""
+        system_prompt = render_system_prompt(schema)
+        return lambda prompt: self._complete(prompt, system_prompt, temperature)
 
-Rules:
-- Output ONLY the JSON object, no markdown, no explanations
-- Follow the schema exactly
-- All required fields must be present
-- Do not include exploit code, payloads, or bypass instructions
-- Focus on validation, evidence collection, and risk assessment
-"""
+    def _complete(self, prompt: str, system_prompt: str, temperature: float) -> Dict[str, Any]:
+        """Send one prompt with a prepared system prompt and parse the JSON reply."""
+        client = self.client
 
         try:
             response = client.chat.completions.create(
@@ -59,7 +96,46 @@ Rules:
             )
 
             content = response.choices[0].message.content
-            return json.loads(content)
+            return loads(content)
+
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse OpenAI response as JSON: {e}")
+        except Exception as e:
+            raise RuntimeError(f"OpenAI generation failed: {e}")
+
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        temperature: float = 0.0
+    ) -> Dict[str, Any]:
+        """Generate structured JSON using the native async client."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client[0] is not loop:
+            try:
+                import openai
+            except ImportError:
+                raise ImportError("openai package required. Install with: pip install openai")
+            kwargs = _http_client_kwargs()
+            http_client = openai.DefaultAsyncHttpxClient(**kwargs) if kwargs else None
+            self._async_client = (loop, openai.AsyncOpenAI(
+                api_key=self.api_key, timeout=self.timeout, http_client=http_client
+            ))
+        client = self._async_client[1]
+
+        try:
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": render_system_prompt(schema)},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                response_format={"type": "json_object"}
+            )
+
+            content = response.choices[0].message.content
+            return loads(content)
 
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse OpenAI response as JSON: {e}")
@@ -69,16 +145,7 @@ Rules:
     def validate_safety(self, text: str) -> bool:
         """Check if text passes safety validation."""
         # OpenAI has built-in safety, but do basic check
-        dangerous_patterns = [
-            "exploit code",
-            "payload generation",
-            "bypass authentication",
-            "reverse shell",
-            "backdoor",
-            "malware"
-        ]
-        text_lower = text.lower()
-        return not any(pattern in text_lower for pattern in dangerous_patterns)
+        return is_safe_text(text)
 
     def is_available(self) -> bool:
         """Check if OpenAI is available."""
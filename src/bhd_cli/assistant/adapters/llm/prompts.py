@@ -0,0 +1,35 @@
+"""System prompt shared by the LLM providers."""
+import json
+from typing import Any, Dict
+
+from ..json_codec import dumps_sorted
+
+_SYSTEM_PROMPT = (
+    "You are a security analysis assistant. "
+    "You MUST respond with ONLY valid JSON that matches this schema:\n"
+    "\n"
+    "%s\n"
+    "\n"
+    "Rules:\n"
+    "- Output ONLY the JSON object, no markdown, no explanations\n"
+    "- Follow the schema exactly\n"
+    "- All required fields must be present\n"
+    "- Do not include exploit code, payloads, or bypass instructions\n"
+    "- Focus on validation, evidence collection, and risk assessment\n"
+)
+
+# Rendered prompts keyed by the schema's sorted JSON, so equal schemas share
+# one entry; the text itself keeps the schema's own property order
+_RENDERED_MAX = 32
+_rendered: Dict[bytes, str] = {}
+
+
+def render_system_prompt(schema: Dict[str, Any]) -> str:
+    """Return the JSON-only system prompt for a schema, memoized per schema content."""
+    key = dumps_sorted(schema)
+    prompt = _rendered.get(key)
+    if prompt is None:
+        if len(_rendered) >= _RENDERED_MAX:
+            _rendered.clear()
+        prompt = _rendered[key] = _SYSTEM_PROMPT % json.dumps(schema, indent=2)
+    return prompt
@@ -1,8 +1,16 @@
 """LLM provider router with fallback logic."""
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import jsonschema
 
 from ...core.ports import ILLMPort
+from ...core.schema_validator import SchemaValidator
+from ..json_codec import dumps_sorted
 from .ollama import OllamaProvider
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
@@ -14,49 +22,149 @@ logger = logging.getLogger(__name__)
 class LLMRouter(ILLMPort):
     """Routes LLM requests with fallback support."""
 
-    def __init__(self, provider_order: Optional[List[str]] = None):
+    def __init__(self, provider_order: Optional[List[str]] = None, cache_size: int = 256):
         """
         Initialize router with provider order.
 
         Args:
             provider_order: List of provider names in order of preference
                           Default: ["ollama", "openai", "anthropic"]
+            cache_size: Max responses kept in the LRU response cache (0 disables it)
         """
         self.provider_order = provider_order or ["ollama", "openai", "anthropic"]
         self.providers: Dict[str, ILLMPort] = {}
         self.last_used_provider: Optional[str] = None
 
-        # Initialize providers
-        self._init_providers()
+        # Deterministic (temperature 0) responses, keyed on prompt/schema/temperature
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, Tuple[str, Dict[str, Any]]] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
-    def _init_providers(self):
-        """Initialize available providers."""
-        # Try Ollama (local)
-        try:
-            ollama = OllamaProvider()
-            if ollama.is_available():
-                self.providers["ollama"] = ollama
-                logger.info("Ollama provider initialized")
-        except Exception as e:
-            logger.debug(f"Ollama provider not available: {e}")
-
-        # Try OpenAI (cloud)
-        try:
-            openai = OpenAIProvider()
-            if openai.is_available():
-                self.providers["openai"] = openai
-                logger.info("OpenAI provider initialized")
-        except Exception as e:
-            logger.debug(f"OpenAI provider not available: {e}")
-
-        # Try Anthropic (cloud)
+        # Providers are built and probed on first use, so constructing a router
+        # costs no network round-trips and unused providers are never touched
+        self._factories: Dict[str, Callable[[], ILLMPort]] = {
+            "ollama": OllamaProvider,
+            "openai": OpenAIProvider,
+            "anthropic": AnthropicProvider,
+        }
+        self._unavailable: Set[str] = set()
+
+    def _get_provider(self, provider_name: str) -> Optional[ILLMPort]:
+        """Return an available provider, instantiating and probing it on first use."""
+        provider = self.providers.get(provider_name)
+        if provider is not None or provider_name in self._unavailable:
+            return provider
+
+        factory = self._factories.get(provider_name)
+        if factory is not None:
+            try:
+                provider = factory()
+                if provider.is_available():
+                    self.providers[provider_name] = provider
+                    logger.info(f"{provider_name} provider initialized")
+                    return provider
+            except Exception as e:
+                logger.debug(f"{provider_name} provider not available: {e}")
+
+        self._unavailable.add(provider_name)
+        return None
+
+    async def _aget_provider(self, provider_name: str) -> Optional[ILLMPort]:
+        """_get_provider for coroutines: a first-use probe runs in a worker thread.
+
+        Probes are blocking calls (an HTTP request for Ollama), so they must
+        not run on the event loop.
+        """
+        if provider_name in self.providers or provider_name in self._unavailable:
+            return self.providers.get(provider_name)
+        return await asyncio.to_thread(self._get_provider, provider_name)
+
+    def _cache_key(self, prompt: str, schema: Dict[str, Any], temperature: float) -> Optional[str]:
+        """Return the cache key for a request, or None if it must not be cached."""
+        # Sampled (temperature > 0) responses are meant to vary between calls
+        if self.cache_size <= 0 or temperature > 0:
+            return None
+        key = hashlib.blake2b(f"{temperature}|{prompt}|".encode(), digest_size=16)
+        key.update(dumps_sorted(schema))
+        return key.hexdigest()
+
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached response and mark it recently used."""
+        if key is None:
+            return None
+        entry = self._cache.get(key)
+        if entry is None:
+            self._cache_misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._cache_hits += 1
+        provider_name, result = entry
+        self.last_used_provider = provider_name
+        logger.info(f"Served generation from cache ({provider_name})")
+        return copy.deepcopy(result)
+
+    def _cache_put(
+        self,
+        key: Optional[str],
+        provider_name: str,
+        result: Dict[str, Any],
+        schema: Dict[str, Any]
+    ):
+        """Store a schema-valid response, evicting the least recently used entry when full.
+
+        Invalid responses are never cached: a caller retrying the same prompt
+        must reach the provider again rather than get the same bad answer.
+        """
+        if key is None:
+            return
         try:
-            anthropic = AnthropicProvider()
-            if anthropic.is_available():
-                self.providers["anthropic"] = anthropic
-                logger.info("Anthropic provider initialized")
-        except Exception as e:
-            logger.debug(f"Anthropic provider not available: {e}")
+            SchemaValidator.compiled(schema)(result)
+        except (jsonschema.ValidationError, jsonschema.SchemaError):
+            logger.info(f"Not caching {provider_name} response that fails its schema")
+            return
+        self._cache[key] = (provider_name, copy.deepcopy(result))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached responses and reset hit/miss counters."""
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get response cache size and hit/miss counters."""
+        return {
+            "size": len(self._cache),
+            "maxsize": self.cache_size,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+        }
+
+    def _succeeded(
+        self,
+        cache_key: Optional[str],
+        provider_name: str,
+        result: Dict[str, Any],
+        schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Record a provider's successful response and return it."""
+        self.last_used_provider = provider_name
+        self._cache_put(cache_key, provider_name, result, schema)
+        logger.info(f"Successfully generated with {provider_name}")
+        return result
+
+    @staticmethod
+    def _exhausted(last_error: Optional[Exception]) -> RuntimeError:
+        """The error raised once every provider in the order has been tried."""
+        if last_error:
+            return RuntimeError(f"All LLM providers failed. Last error: {last_error}")
+        return RuntimeError(
+            "No LLM providers available. Configure at least one of: "
+            "Ollama (local), OpenAI API key, or Anthropic API key"
+        )
 
     def generate_structured(
         self,
@@ -65,47 +173,151 @@ class LLMRouter(ILLMPort):
         temperature: float = 0.0
     ) -> Dict[str, Any]:
         """Generate structured JSON with fallback support."""
-        last_error = None
+        cache_key = self._cache_key(prompt, schema, temperature)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
+        # The blocking twin of _agenerate_in_order
+        last_error = None
         for provider_name in self.provider_order:
-            provider = self.providers.get(provider_name)
+            provider = self._get_provider(provider_name)
             if not provider:
                 logger.debug(f"Provider {provider_name} not available, skipping")
                 continue
-
             try:
                 logger.info(f"Attempting generation with {provider_name}")
                 result = provider.generate_structured(prompt, schema, temperature)
-                self.last_used_provider = provider_name
-                logger.info(f"Successfully generated with {provider_name}")
-                return result
             except Exception as e:
                 logger.warning(f"Provider {provider_name} failed: {e}")
                 last_error = e
                 continue
+            return self._succeeded(cache_key, provider_name, result, schema)
+        raise self._exhausted(last_error)
 
-        # All providers failed
-        if last_error:
-            raise RuntimeError(
-                f"All LLM providers failed. Last error: {last_error}"
-            )
-        else:
-            raise RuntimeError(
-                "No LLM providers available. Configure at least one of: "
-                "Ollama (local), OpenAI API key, or Anthropic API key"
-            )
+    async def _agenerate_in_order(
+        self,
+        provider_names: Iterable[str],
+        prompt: str,
+        schema: Dict[str, Any],
+        temperature: float,
+        cache_key: Optional[str],
+        last_error: Optional[Exception] = None
+    ) -> Dict[str, Any]:
+        """Try providers one at a time, returning the first success.
+
+        Raises the _exhausted() error if none succeeds; last_error carries a
+        failure from before the call (e.g. the raced providers).
+        """
+        for provider_name in provider_names:
+            provider = await self._aget_provider(provider_name)
+            if not provider:
+                logger.debug(f"Provider {provider_name} not available, skipping")
+                continue
+            try:
+                logger.info(f"Attempting async generation with {provider_name}")
+                result = await provider.agenerate_structured(prompt, schema, temperature)
+            except Exception as e:
+                logger.warning(f"Provider {provider_name} failed: {e}")
+                last_error = e
+                continue
+            return self._succeeded(cache_key, provider_name, result, schema)
+        raise self._exhausted(last_error)
+
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        temperature: float = 0.0
+    ) -> Dict[str, Any]:
+        """Async generate_structured with the same fallback order."""
+        cache_key = self._cache_key(prompt, schema, temperature)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._agenerate_in_order(
+            self.provider_order, prompt, schema, temperature, cache_key
+        )
+
+    async def agenerate_race(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        temperature: float = 0.0,
+        k: int = 2
+    ) -> Dict[str, Any]:
+        """
+        Race the first k available providers and return the first success.
+
+        Losing requests are cancelled, but any tokens they already used are
+        still billed, so this is opt-in. If all k fail, the remaining
+        providers are tried in order as usual. k=1 is the sequential path.
+        """
+        if k <= 1:
+            return await self.agenerate_structured(prompt, schema, temperature)
+
+        cache_key = self._cache_key(prompt, schema, temperature)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Probe providers in order only until k racers are found; the rest are
+        # probed later, and only if every racer fails
+        remaining = iter(self.provider_order)
+        racers = []
+        for name in remaining:
+            provider = await self._aget_provider(name)
+            if provider is not None:
+                racers.append((name, provider))
+                if len(racers) == k:
+                    break
+
+        last_error = None
+        if racers:
+            logger.info(f"Racing generation across {', '.join(name for name, _ in racers)}")
+        tasks = {
+            asyncio.create_task(provider.agenerate_structured(prompt, schema, temperature)): name
+            for name, provider in racers
+        }
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Settle ties in provider order
+                for task, provider_name in tasks.items():
+                    if task not in done:
+                        continue
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"Provider {provider_name} failed: {e}")
+                        last_error = e
+                        continue
+                    return self._succeeded(cache_key, provider_name, result, schema)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let the losers observe cancellation before we return
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return await self._agenerate_in_order(
+            remaining, prompt, schema, temperature, cache_key, last_error
+        )
 
     def validate_safety(self, text: str) -> bool:
         """Check if text passes safety validation."""
         # Use first available provider for safety check
         for provider_name in self.provider_order:
-            provider = self.providers.get(provider_name)
+            provider = self._get_provider(provider_name)
             if provider:
                 return provider.validate_safety(text)
         return True  # If no provider available, allow (policy guard will still check)
 
     def get_available_providers(self) -> List[str]:
         """Get list of available provider names."""
+        for provider_name in dict.fromkeys([*self.provider_order, *self._factories]):
+            self._get_provider(provider_name)
         return list(self.providers.keys())
 
     def get_last_used_provider(self) -> Optional[str]:
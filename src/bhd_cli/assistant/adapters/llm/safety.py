@@ -0,0 +1,19 @@
+"""Basic safety screen shared by the LLM providers."""
+import re
+
+DANGEROUS_PATTERNS = (
+    "exploit code",
+    "payload generation",
+    "bypass authentication",
+    "reverse shell",
+    "backdoor",
+    "malware",
+)
+
+# One case-insensitive alternation: a single scan, no lowercased copy of the text
+_DANGER_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATTERNS)), re.IGNORECASE)
+
+
+def is_safe_text(text: str) -> bool:
+    """Return True if text contains none of the dangerous patterns."""
+    return _DANGER_RE.search(text) is None
@@ -1,17 +1,137 @@
 """Nmap XML output parser."""
 import hashlib
-import xml.etree.ElementTree as ET
-from datetime import datetime
+import io
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import IO, Callable, Iterator, List, Optional, Union
+
+# lxml is an optional speedup (C tree walk + compiled XPath); the stdlib
+# ElementTree API it mirrors is used otherwise
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
 
 from ...core.entities import Observation, ObservationCategory
 from ...core.ports import IParserPort
 
 
+def _compile_path(path: str) -> Callable[[ET.Element], list]:
+    """Return element -> matches for a path (a compiled XPath under lxml)."""
+    if HAVE_LXML:
+        return ET.XPath(path)
+    return lambda elem: elem.findall(path)
+
+
+# Anchored at the <host> element so each query walks only the children it
+# needs; open ports are selected by the query itself (the "/.." step keeps
+# the path valid for both XPath and ElementTree)
+_OPEN_PORTS = _compile_path("./ports/port/state[@state='open']/..")
+_IPV4_ADDRESSES = _compile_path("./address[@addrtype='ipv4']")
+_IPV6_ADDRESSES = _compile_path("./address[@addrtype='ipv6']")
+_HOSTNAMES = _compile_path("./hostnames/hostname")
+
+_OPEN = sys.intern("open")
+
+
+def _iterparse(source: IO, encoding: Optional[str] = None):
+    """ElementTree-style iterparse over start/end events.
+
+    Scan files are untrusted input: under lxml, entities are never expanded,
+    nothing is fetched over the network, and libxml2's size and depth limits
+    stay on.
+    """
+    if HAVE_LXML:
+        # Only surface the elements the parser acts on; lxml filters the rest in C
+        return ET.iterparse(
+            source, events=("start", "end"), tag=("nmaprun", "host"),
+            encoding=encoding, resolve_entities=False, no_network=True
+        )
+    return ET.iterparse(source, events=("start", "end"))
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """sys.intern for optional XML attribute values."""
+    return sys.intern(value) if value else value
+
+
+# Service-name aliases and product substrings, by canonical name
+_SERVICE_MAP = {
+    "ssh": "ssh",
+    "ms-wbt-server": "rdp",
+    "msrdp": "rdp",
+    "rdp": "rdp",
+    "vnc": "vnc",
+    "rfb": "vnc",
+    "telnet": "telnet",
+}
+_PRODUCT_RULES = (
+    ("remote desktop", "rdp"),
+    ("terminal services", "rdp"),
+    ("vnc", "vnc"),
+    ("telnet", "telnet"),
+)
+# When the service name and product disagree, the higher-priority match wins
+_SERVICE_PRIORITY = {"ssh": 0, "rdp": 1, "vnc": 2, "telnet": 3}
+
+
+@lru_cache(maxsize=1024)
+def _canonical_service(service_lower: Optional[str], product_lower: Optional[str]) -> Optional[str]:
+    """Map lowercased service/product strings to a canonical service name."""
+    by_service = _SERVICE_MAP.get(service_lower) if service_lower else None
+    by_product = None
+    if product_lower:
+        for needle, canonical in _PRODUCT_RULES:
+            if needle in product_lower:
+                by_product = canonical
+                break
+
+    if by_service and by_product:
+        return min(by_service, by_product, key=_SERVICE_PRIORITY.__getitem__)
+    # If no canonical mapping, return original (lowercased if exists)
+    return by_service or by_product or service_lower
+
+
+# Parallel parsing only starts once a scan has this many hosts (small scans
+# finish before a pool would spin up), and ships hosts to workers in batches
+PARALLEL_MIN_HOSTS = 64
+PARALLEL_BATCH_SIZE = 64
+
+
+# Parser for serialized <host> elements in workers, hardened like _iterparse
+# (None selects the stdlib default parser)
+_HOST_XML_PARSER = (
+    ET.XMLParser(resolve_entities=False, no_network=True) if HAVE_LXML else None
+)
+
+
+def _parse_host_batch(hosts_xml: List[bytes], artifact_id: str) -> List[Observation]:
+    """Worker entry point: parse serialized <host> elements into observations."""
+    parser = NmapParser()
+    observations = []
+    for host_xml in hosts_xml:
+        host = ET.fromstring(host_xml, _HOST_XML_PARSER)
+        observations.extend(parser._host_observations(host, artifact_id))
+    return observations
+
+
 class NmapParser(IParserPort):
     """Parser for Nmap XML output."""
 
+    def __init__(self, workers: int = 1):
+        """
+        Args:
+            workers: Worker processes for large scans (1 parses in-process).
+                Observations are yielded in document order either way.
+        """
+        self.workers = workers
+
     @staticmethod
     def _canonicalize_service(
         service_name: Optional[str],
@@ -36,34 +156,9 @@ class NmapParser(IParserPort):
         Returns:
             Canonical service name (lowercase) or None
         """
-        # Normalize inputs
         service_lower = service_name.lower() if service_name else None
         product_lower = product.lower() if product else None
-
-        # SSH detection
-        if service_lower in {"ssh"}:
-            return "ssh"
-
-        # RDP detection
-        if service_lower in {"ms-wbt-server", "msrdp", "rdp"}:
-            return "rdp"
-        if product_lower and any(x in product_lower for x in ["remote desktop", "terminal services"]):
-            return "rdp"
-
-        # VNC detection
-        if service_lower in {"vnc", "rfb"}:
-            return "vnc"
-        if product_lower and "vnc" in product_lower:
-            return "vnc"
-
-        # Telnet detection
-        if service_lower in {"telnet"}:
-            return "telnet"
-        if product_lower and "telnet" in product_lower:
-            return "telnet"
-
-        # If no canonical mapping, return original (lowercased if exists)
-        return service_lower
+        return _canonical_service(service_lower, product_lower)
 
     def can_parse(self, tool_name: str, output: str) -> bool:
         """Check if this parser can handle the given tool output."""
@@ -81,128 +176,184 @@ class NmapParser(IParserPort):
         - Deterministic IDs based on hash(host+port)
         - Confidence scores based on service detection confidence
         """
-        observations = []
-
-        try:
-            root = ET.fromstring(output)
-        except ET.ParseError as e:
-            raise ValueError(f"Failed to parse Nmap XML: {e}")
-
-        # Get scan metadata
-        scan_args = root.get("args", "nmap")
-        scan_start = root.get("start", str(int(datetime.utcnow().timestamp())))
-
-        # Artifact ID for source_artifact field
-        artifact_id = hashlib.sha256(f"nmap:{scan_start}:{scan_args}".encode()).hexdigest()[:16]
-
-        # Parse each host
-        for host in root.findall(".//host"):
-            # Get host address
-            address_elem = host.find(".//address[@addrtype='ipv4']")
-            if address_elem is None:
-                address_elem = host.find(".//address[@addrtype='ipv6']")
-            if address_elem is None:
-                continue
+        return list(self.iter_parse(tool_name, output))
 
-            host_addr = address_elem.get("addr")
-
-            # Get hostname if available
-            hostname_elem = host.find(".//hostname")
-            hostname = hostname_elem.get("name") if hostname_elem is not None else None
-
-            # Parse each port
-            for port in host.findall(".//port"):
-                protocol = port.get("protocol", "tcp")
-                portid = port.get("portid")
-
-                state_elem = port.find("state")
-                if state_elem is None:
-                    continue
-
-                state = state_elem.get("state")
-                if state != "open":
-                    continue  # Only create observations for open ports
-
-                # Generate deterministic ID
-                obs_id = hashlib.sha256(f"{host_addr}:{protocol}:{portid}".encode()).hexdigest()[:16]
-
-                # Get service information
-                service_elem = port.find("service")
-                service_name = None
-                service_product = None
-                service_version = None
-                service_conf = 5  # Default confidence
-
-                if service_elem is not None:
-                    service_name = service_elem.get("name")
-                    service_product = service_elem.get("product")
-                    service_version = service_elem.get("version")
-                    service_conf = int(service_elem.get("conf", "5"))
-
-                # Canonicalize service name
-                canonical_service = self._canonicalize_service(
-                    service_name,
-                    service_product
-                )
-
-                # Determine category and confidence
-                if service_product or service_version:
-                    # If we have version info, this is a service observation
-                    category = ObservationCategory.SERVICE
-                    confidence = service_conf / 10.0  # Convert 0-10 to 0.0-1.0
-                    tags = ["service", canonical_service] if canonical_service else ["service"]
-                else:
-                    # Just an open port
-                    category = ObservationCategory.PORT
-                    confidence = 0.95  # High confidence for open ports
-                    tags = ["open", protocol]
-                    if canonical_service:
-                        tags.append(canonical_service)
-
-                # Build observation data
-                data = {
-                    "host": host_addr,
-                    "port": int(portid),
-                    "protocol": protocol,
-                    "state": state
-                }
-
-                if hostname:
-                    data["hostname"] = hostname
-
-                # Store canonical service name and preserve raw if different
-                if canonical_service:
-                    data["service"] = canonical_service
-                    if service_name and service_name.lower() != canonical_service:
-                        data["service_raw"] = service_name
-
-                if service_product:
-                    data["product"] = service_product
-
-                if service_version:
-                    data["version"] = service_version
-
-                # Create observation
-                obs = Observation(
-                    id=obs_id,
-                    source_artifact=artifact_id,
-                    category=category,
-                    tags=tags,
-                    confidence=confidence,
-                    data=data
-                )
-
-                observations.append(obs)
-
-        return observations
+    def iter_parse(self, tool_name: str, output: str) -> Iterator[Observation]:
+        """Yield observations from Nmap XML output one host at a time."""
+        if HAVE_LXML:
+            # lxml reads bytes; the text is already decoded, so override any declared encoding
+            return self._iter_observations(io.BytesIO(output.encode()), encoding="utf-8")
+        return self._iter_observations(io.StringIO(output))
 
     def parse_file(self, file_path: Union[str, Path]) -> List[Observation]:
         """Parse Nmap XML file into observations."""
+        return list(self.iter_parse_file(file_path))
+
+    def iter_parse_file(self, file_path: Union[str, Path]) -> Iterator[Observation]:
+        """Stream an Nmap XML file, yielding observations one host at a time."""
         path = Path(file_path)
         if not path.exists():
+            # Raised here rather than on first next(), before any consumer setup
             raise FileNotFoundError(f"Nmap file not found: {file_path}")
+        return self._iter_file(path)
+
+    def _iter_file(self, path: Path) -> Iterator[Observation]:
+        with open(path, "rb") as f:
+            yield from self._iter_observations(f)
+
+    def _iter_observations(
+        self,
+        source: IO,
+        encoding: Optional[str] = None
+    ) -> Iterator[Observation]:
+        """Stream-parse Nmap XML, keeping at most one <host> element in memory."""
+        root = None
+        artifact_id = None
+        hosts_seen = 0
+
+        # Hosts past PARALLEL_MIN_HOSTS go to worker processes in batches;
+        # results are yielded in submission (document) order
+        pool: Optional[ProcessPoolExecutor] = None
+        in_flight: deque = deque()
+        batch: List[bytes] = []
 
-        with open(path) as f:
-            xml_content = f.read()
+        try:
+            for event, elem in _iterparse(source, encoding):
+                if root is None:
+                    # Get scan metadata from the <nmaprun> start tag
+                    root = elem
+                    scan_args = root.get("args", "nmap")
+                    scan_start = root.get("start", str(int(time.time())))
+
+                    # Artifact ID for source_artifact field
+                    artifact_key = f"nmap:{scan_start}:{scan_args}".encode()
+                    artifact_id = hashlib.sha256(artifact_key).hexdigest()[:16]
+                    continue
 
-        return self.parse("nmap", xml_content)
+                if event == "end" and elem.tag == "host":
+                    if self.workers <= 1 or hosts_seen < PARALLEL_MIN_HOSTS:
+                        yield from self._host_observations(elem, artifact_id)
+                    else:
+                        batch.append(ET.tostring(elem))
+                    hosts_seen += 1
+                    # Drop the finished host (and any siblings) from the tree
+                    root.clear()
+
+                    if len(batch) >= PARALLEL_BATCH_SIZE:
+                        if pool is None:
+                            pool = ProcessPoolExecutor(max_workers=self.workers)
+                        in_flight.append(pool.submit(_parse_host_batch, batch, artifact_id))
+                        batch = []
+                        # Cap outstanding batches so serialized hosts don't pile up
+                        while len(in_flight) > 2 * self.workers:
+                            yield from in_flight.popleft().result()
+
+            if batch:
+                if pool is None:
+                    yield from _parse_host_batch(batch, artifact_id)
+                else:
+                    in_flight.append(pool.submit(_parse_host_batch, batch, artifact_id))
+            while in_flight:
+                yield from in_flight.popleft().result()
+        except ET.ParseError as e:
+            raise ValueError(f"Failed to parse Nmap XML: {e}")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _host_observations(self, host: ET.Element, artifact_id: str) -> Iterator[Observation]:
+        """Yield one observation per open port on a <host> element."""
+        # Get host address
+        addresses = _IPV4_ADDRESSES(host) or _IPV6_ADDRESSES(host)
+        if not addresses:
+            return
+
+        host_addr = addresses[0].get("addr")
+
+        # Get hostname if available
+        hostnames = _HOSTNAMES(host)
+        hostname = hostnames[0].get("name") if hostnames else None
+
+        # Observation IDs are sha256("<host>:<protocol>:<port>")[:16]; hash the
+        # host prefix once and copy its state for each port
+        id_base = hashlib.sha256(f"{host_addr}:".encode())
+
+        # Only open ports produce observations
+        for port in _OPEN_PORTS(host):
+            # Protocol/product strings repeat across every port of a scan;
+            # interning keeps one copy of each in the observations' data
+            protocol = sys.intern(port.get("protocol", "tcp"))
+            portid = port.get("portid")
+
+            # Generate deterministic ID
+            id_hash = id_base.copy()
+            id_hash.update(f"{protocol}:{portid}".encode())
+            obs_id = id_hash.hexdigest()[:16]
+
+            # Get service information
+            service_elem = port.find("service")
+            service_name = None
+            service_product = None
+            service_version = None
+            service_conf = 5  # Default confidence
+
+            if service_elem is not None:
+                service_name = _intern(service_elem.get("name"))
+                service_product = _intern(service_elem.get("product"))
+                service_version = _intern(service_elem.get("version"))
+                service_conf = int(service_elem.get("conf", "5"))
+
+            # Canonicalize service name
+            canonical_service = self._canonicalize_service(
+                service_name,
+                service_product
+            )
+
+            # Determine category and confidence
+            if service_product or service_version:
+                # If we have version info, this is a service observation
+                category = ObservationCategory.SERVICE
+                confidence = service_conf / 10.0  # Convert 0-10 to 0.0-1.0
+                tags = ["service", canonical_service] if canonical_service else ["service"]
+            else:
+                # Just an open port
+                category = ObservationCategory.PORT
+                confidence = 0.95  # High confidence for open ports
+                tags = ["open", protocol]
+                if canonical_service:
+                    tags.append(canonical_service)
+
+            # Build observation data
+            data = {
+                "host": host_addr,
+                "port": int(portid),
+                "protocol": protocol,
+                "state": _OPEN
+            }
+
+            if hostname:
+                data["hostname"] = hostname
+
+            # Store canonical service name and preserve raw if different
+            if canonical_service:
+                data["service"] = canonical_service
+                if service_name and service_name.lower() != canonical_service:
+                    data["service_raw"] = service_name
+
+            if service_product:
+                data["product"] = service_product
+
+            if service_version:
+                data["version"] = service_version
+
+            # Create observation
+            obs = Observation(
+                id=obs_id,
+                source_artifact=artifact_id,
+                category=category,
+                tags=tags,
+                confidence=confidence,
+                data=data
+            )
+
+            yield obs
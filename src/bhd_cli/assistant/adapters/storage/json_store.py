@@ -1,33 +1,170 @@
 """JSON-based storage adapter (stub implementation)."""
-import json
-from datetime import datetime
+import mmap
+import os
+import sys
+from dataclasses import fields
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterable, List, Optional
 from uuid import uuid4
 
-from ...core.entities import FindingDraft, Observation
+from ...core.entities import FindingDraft, Observation, ObservationCategory
 from ...core.ports import IStoragePort
+from ..json_codec import dumps_line, loads
+
+# Stored category value -> enum member, skipping Enum.__call__ per record
+_CATEGORY_BY_VALUE = {c.value: c for c in ObservationCategory}
+
+# Observation fields stored as they are; category and created_at are encoded
+# separately. Derived from the dataclass so new fields are stored too
+_PLAIN_FIELDS = tuple(
+    f.name for f in fields(Observation) if f.name not in ("category", "created_at")
+)
+
+# Naive UTC datetimes are stored as integer microseconds since this epoch
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Appends go through one buffered handle per adapter, flushed in chunks of this
+# size; bulk saves also coalesce encoded records into chunks of this size
+WRITE_CHUNK_SIZE = 1 << 20
+
+# Observation logs at least this large are split into lines straight from a
+# read-only mmap, skipping the read() buffer copy; smaller files are read directly
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _read_lines(path: Path) -> List[bytes]:
+    """Return a file's lines, split straight off a sequential mmap when it is large.
+
+    mmap.readline copies each line out of the mapping once; the file is never
+    copied whole first.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_MIN_BYTES or not size:
+            return f.readlines()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                m.madvise(mmap.MADV_SEQUENTIAL)
+            return list(iter(m.readline, b""))
+
+
+def _load_records(path: Path) -> list:
+    """Parse a JSONL file with a single loads() call over the whole buffer.
+
+    Each line keeps its newline, which JSON reads as whitespace, so one
+    comma join with brackets around the ends yields a JSON array equal to
+    the per-line parses. The join is the only copy of the file made.
+    """
+    lines = _read_lines(path)
+    while lines and lines[-1] == b"\n":
+        lines.pop()
+    if not lines:
+        return []
+    lines[0] = b"[" + lines[0]
+    lines[-1] += b"]"
+    return loads(b",".join(lines))
+
+
+def _observation_record(obs: Observation) -> dict:
+    """Observation.to_dict() as stored on disk: created_at as epoch microseconds.
+
+    Integers skip isoformat()/fromisoformat() per record. Timezone-aware
+    datetimes keep the ISO string so their offset survives the round trip.
+    """
+    record = {name: getattr(obs, name) for name in _PLAIN_FIELDS}
+    category = obs.category
+    record["category"] = category.value if isinstance(category, ObservationCategory) else category
+    created_at = obs.created_at or datetime.utcnow()
+    if created_at.tzinfo is None:
+        record["created_at_us"] = (created_at - _EPOCH) // _MICROSECOND
+    else:
+        record["created_at"] = created_at.isoformat()
+    return record
 
 
 class JSONStorageAdapter(IStoragePort):
-    """JSON file-based storage adapter."""
+    """JSON file-based storage adapter.
+
+    Observation appends share one open handle; call flush() (or close(), or
+    use the adapter as a context manager) before reading the file elsewhere.
+    """
 
     def __init__(self, storage_dir: Path):
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.observations_file = storage_dir / "observations.jsonl"
         self.findings_file = storage_dir / "findings.jsonl"
+        self._obs_fp: Optional[BinaryIO] = None
+
+    def __enter__(self) -> "JSONStorageAdapter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        # Adapters are often dropped without close(); don't lose buffered records
+        if getattr(self, "_obs_fp", None) is not None:
+            self.close()
+
+    def _observations_fp(self) -> BinaryIO:
+        """Open the observations log for appending on first use."""
+        if self._obs_fp is None:
+            self._obs_fp = open(self.observations_file, "ab", buffering=WRITE_CHUNK_SIZE)
+        return self._obs_fp
+
+    def flush(self) -> None:
+        """Write buffered observation records through to the file."""
+        if self._obs_fp is not None:
+            self._obs_fp.flush()
+
+    def close(self) -> None:
+        """Flush and close the observations handle."""
+        if self._obs_fp is not None:
+            self._obs_fp.close()
+            self._obs_fp = None
 
     def save_observation(self, observation: Observation) -> str:
         """Save an observation and return its ID."""
-        obs_data = observation.to_dict()
-
-        # Append to JSONL file
-        with open(self.observations_file, "a") as f:
-            f.write(json.dumps(obs_data, sort_keys=True) + "\n")
+        # Append to JSONL file (buffered; see flush())
+        self._observations_fp().write(dumps_line(_observation_record(observation)))
 
         return observation.id
 
+    def save_observations(
+        self,
+        observations: Iterable[Observation],
+        sync: bool = True
+    ) -> List[str]:
+        """Append a stream of observations and flush them once at the end.
+
+        All-or-nothing: if the stream raises part way (e.g. a malformed scan),
+        lines already written by this call are truncated away. With sync, the
+        batch is fsync'd once after the final flush (never per record).
+        """
+        saved_ids = []
+        f = self._observations_fp()
+        f.flush()
+        start = f.tell()
+        try:
+            buf = bytearray()
+            for obs in observations:
+                buf += dumps_line(_observation_record(obs))
+                saved_ids.append(obs.id)
+                if len(buf) >= WRITE_CHUNK_SIZE:
+                    f.write(buf)
+                    buf.clear()
+            f.write(buf)
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+        except BaseException:
+            f.truncate(start)
+            raise
+        return saved_ids
+
     def load_observations(self, session_id: str) -> List[Observation]:
         """Load observations for a session.
 
@@ -36,26 +173,34 @@ class JSONStorageAdapter(IStoragePort):
         # Stub: In a real implementation, filter by session_id
         observations = []
 
+        self.flush()
         if not self.observations_file.exists():
             return observations
 
-        with open(self.observations_file) as f:
-            for line in f:
-                data = json.loads(line)
-                # Convert category string back to enum
-                from ...core.entities import ObservationCategory
-                category = ObservationCategory(data["category"])
-
-                obs = Observation(
-                    id=data["id"],
-                    source_artifact=data["source_artifact"],
-                    category=category,
-                    tags=data["tags"],
-                    confidence=data["confidence"],
-                    data=data["data"],
-                    created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
-                )
-                observations.append(obs)
+        fromisoformat = datetime.fromisoformat
+        # The same few tags ("open", "tcp", "ssh", ...) repeat on most records;
+        # intern them so every observation shares one string per tag
+        intern = sys.intern
+        for data in _load_records(self.observations_file):
+            # Convert category string back to enum
+            category = _CATEGORY_BY_VALUE.get(data["category"])
+            if category is None:
+                category = ObservationCategory(data["category"])  # raises ValueError
+
+            created_us = data.get("created_at_us")
+            if created_us is not None:
+                created_at = _EPOCH + created_us * _MICROSECOND
+            else:
+                # Records written before created_at_us, or timezone-aware times
+                created_at = data.get("created_at")
+                created_at = fromisoformat(created_at) if created_at else None
+
+            values = {name: data[name] for name in _PLAIN_FIELDS}
+            values["tags"] = [intern(tag) for tag in values["tags"]]
+
+            # Records were validated when saved
+            obs = Observation.from_trusted(category=category, created_at=created_at, **values)
+            observations.append(obs)
 
         return observations
 
@@ -65,7 +210,23 @@ class JSONStorageAdapter(IStoragePort):
         draft_data["created_at"] = datetime.utcnow().isoformat()
 
         # Append to JSONL file
-        with open(self.findings_file, "a") as f:
-            f.write(json.dumps(draft_data, sort_keys=True) + "\n")
+        with open(self.findings_file, "ab") as f:
+            f.write(dumps_line(draft_data))
 
         return draft.id
+
+    def save_finding_drafts(self, drafts: Iterable[FindingDraft]) -> List[str]:
+        """Append several finding drafts with one open and write."""
+        created_at = datetime.utcnow().isoformat()
+        buf = bytearray()
+        saved_ids = []
+        for draft in drafts:
+            draft_data = draft.to_dict()
+            draft_data["created_at"] = created_at
+            buf += dumps_line(draft_data)
+            saved_ids.append(draft.id)
+
+        with open(self.findings_file, "ab") as f:
+            f.write(buf)
+
+        return saved_ids
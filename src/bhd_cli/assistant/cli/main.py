@@ -1,12 +1,40 @@
 """Main CLI entrypoint for bhd-assist."""
 import argparse
+import codecs
 import json
 import sys
 from pathlib import Path
 
-from ..core.entities import AssistanceLevel
-from ..playbooks.loader import PlaybookLoader
-from ..policy.guard import PolicyGuard
+from ..adapters.json_codec import dumps_pretty
+
+
+def _stdout_is_utf8() -> bool:
+    """True if stdout encodes text as UTF-8 (so UTF-8 bytes can bypass it)."""
+    try:
+        return codecs.lookup(sys.stdout.encoding or "").name == "utf-8"
+    except (AttributeError, LookupError):
+        return False
+
+
+def _write(payload: bytes) -> None:
+    """Write one UTF-8 output document plus newline to stdout.
+
+    Goes straight to stdout's byte stream when stdout is UTF-8; otherwise
+    (e.g. a cp1252 console, or a text-only stream such as io.StringIO) the
+    text goes through print() so the stream's own encoding applies.
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None or not _stdout_is_utf8():
+        print(payload.decode())
+        return
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    out.write(payload + b"\n")
+    out.flush()
+
+
+def _emit(data) -> None:
+    """Print data as 2-space indented, key-sorted JSON."""
+    _write(dumps_pretty(data))
 
 
 def cmd_init(args):
@@ -25,12 +53,12 @@ def cmd_init(args):
     with open(config_file, "w") as f:
         json.dump(config, f, indent=2, sort_keys=True)
 
-    print(json.dumps({
+    _emit({
         "status": "initialized",
         "workspace": str(workspace_dir.absolute()),
         "config_file": str(config_file),
         "assistance_level": "VALIDATION_ONLY"
-    }, indent=2, sort_keys=True))
+    })
 
 
 def cmd_ingest(args):
@@ -42,10 +70,10 @@ def cmd_ingest(args):
     file_path = args.file
 
     if not file_path:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": "File path required for ingest"
-        }, indent=2, sort_keys=True))
+        })
         return
 
     # Get workspace directory
@@ -55,49 +83,47 @@ def cmd_ingest(args):
 
     # Initialize parser and storage
     if tool.lower() == "nmap":
-        parser = NmapParser()
+        parser = NmapParser(workers=args.workers)
     else:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": f"Unsupported tool: {tool}. Only 'nmap' is currently supported."
-        }, indent=2, sort_keys=True))
+        })
         return
 
     storage = JSONStorageAdapter(storage_dir)
 
     try:
-        # Parse file
-        observations = parser.parse_file(file_path)
-
-        # Save observations
-        saved_ids = []
-        for obs in observations:
-            obs_id = storage.save_observation(obs)
-            saved_ids.append(obs_id)
+        # Parse and save observations as a stream, one host at a time
+        saved_ids = storage.save_observations(parser.iter_parse_file(file_path))
 
-        print(json.dumps({
+        _emit({
             "status": "ingested",
             "tool": tool,
             "file": file_path,
-            "observations_created": len(observations),
+            "observations_created": len(saved_ids),
             "observation_ids": saved_ids,
             "storage_path": str(storage_dir)
-        }, indent=2, sort_keys=True))
+        })
 
     except FileNotFoundError as e:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": str(e)
-        }, indent=2, sort_keys=True))
+        })
     except ValueError as e:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": f"Parse error: {e}"
-        }, indent=2, sort_keys=True))
+        })
+    finally:
+        storage.close()
 
 
 def cmd_playbook_list(args):
     """List available playbooks."""
+    from ..playbooks.loader import PlaybookLoader
+
     # Get playbooks directory
     playbooks_dir = Path(__file__).parent.parent / "playbooks" / "library"
     schemas_dir = Path(__file__).parent.parent / "playbooks" / "schemas"
@@ -110,23 +136,37 @@ def cmd_playbook_list(args):
 
     playbooks = loader.list_playbooks(filters)
 
-    print(json.dumps({
+    _emit({
         "playbooks": playbooks,
         "count": len(playbooks)
-    }, indent=2, sort_keys=True))
+    })
+
+
+# Fixed stub responses, pre-rendered in json.dumps(indent=2, sort_keys=True)
+# layout; only the JSON-encoded variable field is spliced in per call
+_SELECT_TEMPLATE = b"""{
+  "message": "Playbook selection stub",
+  "playbook_id": %s,
+  "status": "selected"
+}"""
+_EXPORT_TEMPLATE = b"""{
+  "findings_count": 0,
+  "format": "bhd-cli",
+  "message": "Export stub - no drafts to export",
+  "output_file": %s,
+  "status": "exported"
+}"""
 
 
 def cmd_playbook_select(args):
     """Select playbook (stub)."""
-    print(json.dumps({
-        "status": "selected",
-        "playbook_id": args.playbook_id or "auto",
-        "message": "Playbook selection stub"
-    }, indent=2, sort_keys=True))
+    _write(_SELECT_TEMPLATE % json.dumps(args.playbook_id or "auto").encode())
 
 
 def cmd_playbook_render(args):
     """Render playbook as checklist or evidence plan."""
+    from ..playbooks.loader import PlaybookLoader
+
     playbooks_dir = Path(__file__).parent.parent / "playbooks" / "library"
     schemas_dir = Path(__file__).parent.parent / "playbooks" / "schemas"
 
@@ -140,7 +180,7 @@ def cmd_playbook_render(args):
             print(output)
         elif args.format == "evidence":
             evidence_plan = loader.create_evidence_plan(playbook_data)
-            print(json.dumps(evidence_plan.to_dict(), indent=2, sort_keys=True))
+            _emit(evidence_plan.to_dict())
         elif args.format == "finding":
             # Stub: would need evidence refs
             finding_draft = loader.create_finding_draft(
@@ -148,13 +188,13 @@ def cmd_playbook_render(args):
                 affected_asset=args.asset or "target_system",
                 evidence_refs=[]
             )
-            print(json.dumps(finding_draft.to_dict(), indent=2, sort_keys=True))
+            _emit(finding_draft.to_dict())
         else:
-            print(json.dumps({"error": f"Unknown format: {args.format}"}, indent=2))
+            _emit({"error": f"Unknown format: {args.format}"})
             sys.exit(1)
 
     except FileNotFoundError as e:
-        print(json.dumps({"error": str(e)}, indent=2))
+        _emit({"error": str(e)})
         sys.exit(1)
 
 
@@ -168,10 +208,10 @@ def cmd_suggest_playbooks(args):
     storage_dir = workspace_dir / ".bhd-assist" / "storage"
 
     if not storage_dir.exists():
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": "No observations found. Run 'bhd-assist ingest' first."
-        }, indent=2, sort_keys=True))
+        })
         return
 
     # Load observations
@@ -179,11 +219,11 @@ def cmd_suggest_playbooks(args):
     observations = storage.load_observations(session_id="default")
 
     if not observations:
-        print(json.dumps({
+        _emit({
             "status": "no_observations",
             "message": "No observations found in storage. Ingest tool output first.",
             "observations_count": 0
-        }, indent=2, sort_keys=True))
+        })
         return
 
     # Run selector
@@ -215,7 +255,7 @@ def cmd_suggest_playbooks(args):
             "message": f"Selected playbook: {result}" if result else "No matching playbook found"
         }
 
-    print(json.dumps(output, indent=2, sort_keys=True))
+    _emit(output)
 
 
 def cmd_hypothesis_draft(args):
@@ -224,16 +264,17 @@ def cmd_hypothesis_draft(args):
     from ..adapters.storage.json_store import JSONStorageAdapter
     from ..core.adaptive_mode import AssistContext, Environment, TargetOwner, EffectiveAssistLevel
     from ..core.hypothesis_drafter import HypothesisDrafter
+    from ..policy.guard import PolicyGuard
 
     # Get workspace directory
     workspace_dir = Path(args.workspace or ".")
     storage_dir = workspace_dir / ".bhd-assist" / "storage"
 
     if not storage_dir.exists():
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": "No observations found. Run 'bhd-assist ingest' first."
-        }, indent=2, sort_keys=True))
+        })
         return
 
     # Load observations
@@ -241,39 +282,39 @@ def cmd_hypothesis_draft(args):
     observations = storage.load_observations(session_id="default")
 
     if not observations:
-        print(json.dumps({
+        _emit({
             "status": "no_observations",
             "message": "No observations found in storage. Ingest tool output first.",
             "observations_count": 0
-        }, indent=2, sort_keys=True))
+        })
         return
 
     # Build context from args
     try:
         env = Environment(args.environment)
     except ValueError:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": f"Invalid environment: {args.environment}. Use: prod_client, lab, or ctf"
-        }, indent=2, sort_keys=True))
+        })
         return
 
     try:
         owner = TargetOwner(args.target_owner)
     except ValueError:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": f"Invalid target_owner: {args.target_owner}. Use: self, client, or unknown"
-        }, indent=2, sort_keys=True))
+        })
         return
 
     try:
         requested_level = EffectiveAssistLevel(args.assist_level)
     except ValueError:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": f"Invalid assist_level: {args.assist_level}. Use: standard or deep_lab"
-        }, indent=2, sort_keys=True))
+        })
         return
 
     context = AssistContext(
@@ -303,96 +344,114 @@ def cmd_hypothesis_draft(args):
             context=context,
             max_hypotheses=args.max
         )
-        print(json.dumps(result, indent=2, sort_keys=True))
+        _emit(result)
     except Exception as e:
-        print(json.dumps({
+        _emit({
             "status": "error",
             "message": str(e)
-        }, indent=2, sort_keys=True))
+        })
         sys.exit(1)
 
 
 def cmd_export(args):
     """Export finding drafts (stub)."""
-    print(json.dumps({
-        "status": "exported",
-        "output_file": args.output or "findings_export.json",
-        "format": "bhd-cli",
-        "findings_count": 0,
-        "message": "Export stub - no drafts to export"
-    }, indent=2, sort_keys=True))
+    _write(_EXPORT_TEMPLATE % json.dumps(args.output or "findings_export.json").encode())
+
+
+def _add_init_args(p):
+    p.add_argument("--workspace", help="Workspace directory", default=".")
 
 
-def main():
+def _add_ingest_args(p):
+    p.add_argument("--tool", help="Tool name (nmap, burp, etc.)", default="nmap")
+    p.add_argument("--file", help="Input file", required=True)
+    p.add_argument("--workspace", help="Workspace directory", default=".")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Worker processes for parsing large scans (default: 1)")
+
+
+def _add_playbook_list_args(p):
+    p.add_argument("--test-type", help="Filter by test type")
+
+
+def _add_playbook_select_args(p):
+    p.add_argument("--playbook-id", help="Playbook ID")
+
+
+def _add_playbook_render_args(p):
+    p.add_argument("playbook_id", help="Playbook ID")
+    p.add_argument(
+        "--format",
+        choices=["checklist", "evidence", "finding"],
+        default="checklist",
+        help="Output format"
+    )
+    p.add_argument("--asset", help="Affected asset (for finding format)")
+
+
+def _add_suggest_args(p):
+    p.add_argument("--test-type", help="Test type (web, network, ics, etc.)", default="network")
+    p.add_argument("--workspace", help="Workspace directory", default=".")
+    p.add_argument("--explain", action="store_true",
+                   help="Show detailed rule evaluation for debugging")
+
+
+def _add_hypothesis_args(p):
+    p.add_argument("--workspace", help="Workspace directory", default=".")
+    p.add_argument("--environment", choices=["prod_client", "lab", "ctf"], default="prod_client",
+                   help="Environment context")
+    p.add_argument("--authorized", action="store_true",
+                   help="Assert written authorization (required for deep_lab)")
+    p.add_argument("--target-owner", choices=["self", "client", "unknown"], default="client",
+                   help="Target ownership")
+    p.add_argument("--assist-level", choices=["standard", "deep_lab"], default="standard",
+                   help="Requested assistance level")
+    p.add_argument("--provider-order",
+                   help="Comma-separated provider order (e.g., 'ollama,openai')")
+    p.add_argument("--max", type=int, default=3, help="Maximum hypotheses to generate")
+
+
+def _add_export_args(p):
+    p.add_argument("--output", help="Output file", default="findings_export.json")
+
+
+# Subcommand -> (help, argument builder, handler)
+COMMANDS = {
+    "init": ("Initialize bhd-assist workspace", _add_init_args, cmd_init),
+    "ingest": ("Ingest tool output", _add_ingest_args, cmd_ingest),
+    "playbook-list": ("List available playbooks", _add_playbook_list_args, cmd_playbook_list),
+    "playbook-select": ("Select playbook", _add_playbook_select_args, cmd_playbook_select),
+    "playbook-render": ("Render playbook", _add_playbook_render_args, cmd_playbook_render),
+    "suggest-playbooks": (
+        "Suggest playbooks based on observations", _add_suggest_args, cmd_suggest_playbooks
+    ),
+    "hypothesis-draft": (
+        "Draft hypotheses from observations using LLM", _add_hypothesis_args, cmd_hypothesis_draft
+    ),
+    "export": ("Export finding drafts", _add_export_args, cmd_export),
+}
+
+
+def main(argv=None):
     """Main CLI entrypoint."""
+    argv = sys.argv[1:] if argv is None else argv
     parser = argparse.ArgumentParser(
         prog="bhd-assist",
         description="AI-Powered Penetration Testing Assistant (Documentation-centric)"
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # init command
-    p_init = subparsers.add_parser("init", help="Initialize bhd-assist workspace")
-    p_init.add_argument("--workspace", help="Workspace directory", default=".")
-    p_init.set_defaults(func=cmd_init)
-
-    # ingest command
-    p_ingest = subparsers.add_parser("ingest", help="Ingest tool output")
-    p_ingest.add_argument("--tool", help="Tool name (nmap, burp, etc.)", default="nmap")
-    p_ingest.add_argument("--file", help="Input file", required=True)
-    p_ingest.add_argument("--workspace", help="Workspace directory", default=".")
-    p_ingest.set_defaults(func=cmd_ingest)
-
-    # playbook list command
-    p_pb_list = subparsers.add_parser("playbook-list", help="List available playbooks")
-    p_pb_list.add_argument("--test-type", help="Filter by test type")
-    p_pb_list.set_defaults(func=cmd_playbook_list)
-
-    # playbook select command
-    p_pb_select = subparsers.add_parser("playbook-select", help="Select playbook")
-    p_pb_select.add_argument("--playbook-id", help="Playbook ID")
-    p_pb_select.set_defaults(func=cmd_playbook_select)
-
-    # playbook render command
-    p_pb_render = subparsers.add_parser("playbook-render", help="Render playbook")
-    p_pb_render.add_argument("playbook_id", help="Playbook ID")
-    p_pb_render.add_argument(
-        "--format",
-        choices=["checklist", "evidence", "finding"],
-        default="checklist",
-        help="Output format"
-    )
-    p_pb_render.add_argument("--asset", help="Affected asset (for finding format)")
-    p_pb_render.set_defaults(func=cmd_playbook_render)
-
-    # suggest-playbooks command
-    p_suggest = subparsers.add_parser("suggest-playbooks", help="Suggest playbooks based on observations")
-    p_suggest.add_argument("--test-type", help="Test type (web, network, ics, etc.)", default="network")
-    p_suggest.add_argument("--workspace", help="Workspace directory", default=".")
-    p_suggest.add_argument("--explain", action="store_true", help="Show detailed rule evaluation for debugging")
-    p_suggest.set_defaults(func=cmd_suggest_playbooks)
-
-    # hypothesis-draft command
-    p_hyp = subparsers.add_parser("hypothesis-draft", help="Draft hypotheses from observations using LLM")
-    p_hyp.add_argument("--workspace", help="Workspace directory", default=".")
-    p_hyp.add_argument("--environment", choices=["prod_client", "lab", "ctf"], default="prod_client",
-                       help="Environment context")
-    p_hyp.add_argument("--authorized", action="store_true",
-                       help="Assert written authorization (required for deep_lab)")
-    p_hyp.add_argument("--target-owner", choices=["self", "client", "unknown"], default="client",
-                       help="Target ownership")
-    p_hyp.add_argument("--assist-level", choices=["standard", "deep_lab"], default="standard",
-                       help="Requested assistance level")
-    p_hyp.add_argument("--provider-order", help="Comma-separated provider order (e.g., 'ollama,openai')")
-    p_hyp.add_argument("--max", type=int, default=3, help="Maximum hypotheses to generate")
-    p_hyp.set_defaults(func=cmd_hypothesis_draft)
-
-    # export command
-    p_export = subparsers.add_parser("export", help="Export finding drafts")
-    p_export.add_argument("--output", help="Output file", default="findings_export.json")
-    p_export.set_defaults(func=cmd_export)
-
-    args = parser.parse_args()
+    # The top-level parser takes no options, so the first bare word is the
+    # command. Only its arguments are built; every command is still registered
+    # so usage, --help and typos report the full list.
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    for name, (help_text, add_args, handler) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if command not in COMMANDS or name == command:
+            add_args(sub)
+        sub.set_defaults(func=handler)
+
+    args = parser.parse_args(argv)
     args.func(args)
 
 
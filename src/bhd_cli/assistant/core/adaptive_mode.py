@@ -1,7 +1,8 @@
 """ADAPTIVE mode - context-aware assistance level evaluation."""
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Any
+from itertools import product
+from typing import Dict, List, Any, Tuple
 
 
 class Environment(Enum):
@@ -56,6 +57,43 @@ class AssistEvaluation:
         }
 
 
+def _deep_lab_decision(
+    environment: Environment,
+    authorization: bool,
+    target_owner: TargetOwner
+) -> Tuple[EffectiveAssistLevel, str]:
+    """Decide a deep_lab request for one context; returns (level, reason)."""
+    if environment not in (Environment.LAB, Environment.CTF):
+        return (
+            EffectiveAssistLevel.STANDARD,
+            f"clamped: environment={environment.value} (requires lab or ctf)"
+        )
+
+    if not authorization:
+        return EffectiveAssistLevel.STANDARD, "clamped: authorization=false"
+
+    if target_owner != TargetOwner.SELF:
+        return (
+            EffectiveAssistLevel.STANDARD,
+            f"clamped: target_owner={target_owner.value} (requires self)"
+        )
+
+    # All conditions met for deep_lab
+    return (
+        EffectiveAssistLevel.DEEP_LAB,
+        "deep_lab_enabled: environment=lab/ctf, authorized=true, target_owner=self"
+    )
+
+
+# Every (environment, authorization, target_owner) outcome for a deep_lab
+# request, decided once at import (3 x 2 x 3 contexts)
+_DeepLabKey = Tuple[Environment, bool, TargetOwner]
+_DEEP_LAB_DECISIONS: Dict[_DeepLabKey, Tuple[EffectiveAssistLevel, str]] = {
+    key: _deep_lab_decision(*key)
+    for key in product(Environment, (False, True), TargetOwner)
+}
+
+
 def evaluate_assist_level(context: AssistContext) -> AssistEvaluation:
     """
     Evaluate effective assistance level based on context.
@@ -68,46 +106,16 @@ def evaluate_assist_level(context: AssistContext) -> AssistEvaluation:
         - AND target_owner == self
     - Otherwise clamp to STANDARD and explain why
     """
-    reasons = []
-
     # If not requesting deep_lab, just return standard
     if context.requested_level == EffectiveAssistLevel.STANDARD:
-        reasons.append("requested_level=standard")
-        return AssistEvaluation(
-            effective_level=EffectiveAssistLevel.STANDARD,
-            reasons=reasons,
-            context=context
-        )
-
-    # User requested deep_lab - check if allowed
-    if context.environment not in {Environment.LAB, Environment.CTF}:
-        reasons.append(f"clamped: environment={context.environment.value} (requires lab or ctf)")
-        return AssistEvaluation(
-            effective_level=EffectiveAssistLevel.STANDARD,
-            reasons=reasons,
-            context=context
-        )
-
-    if not context.authorization:
-        reasons.append("clamped: authorization=false")
         return AssistEvaluation(
             effective_level=EffectiveAssistLevel.STANDARD,
-            reasons=reasons,
+            reasons=["requested_level=standard"],
             context=context
         )
 
-    if context.target_owner != TargetOwner.SELF:
-        reasons.append(f"clamped: target_owner={context.target_owner.value} (requires self)")
-        return AssistEvaluation(
-            effective_level=EffectiveAssistLevel.STANDARD,
-            reasons=reasons,
-            context=context
-        )
-
-    # All conditions met for deep_lab
-    reasons.append("deep_lab_enabled: environment=lab/ctf, authorized=true, target_owner=self")
-    return AssistEvaluation(
-        effective_level=EffectiveAssistLevel.DEEP_LAB,
-        reasons=reasons,
-        context=context
-    )
+    # User requested deep_lab - look up whether it is allowed
+    level, reason = _DEEP_LAB_DECISIONS[
+        (context.environment, bool(context.authorization), context.target_owner)
+    ]
+    return AssistEvaluation(effective_level=level, reasons=[reason], context=context)
@@ -1,5 +1,5 @@
 """Core domain entities for the assistant - schema-compliant."""
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -32,11 +32,12 @@ class ObservationCategory(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """Normalized observation from tool output or manual input.
 
-    Schema-compliant with observation.schema.json
+    Schema-compliant with observation.schema.json. Slotted: scans produce
+    one per open port, so the per-instance __dict__ is worth dropping.
     """
     id: str  # Deterministic UUID or hash-based ID
     source_artifact: str  # Reference to ingested artifact ID
@@ -52,6 +53,25 @@ class Observation:
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError("Confidence must be between 0.0 and 1.0")
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "Observation":
+        """Build an observation from already-validated data (e.g. our own storage).
+
+        Takes the constructor's keyword arguments but skips __post_init__
+        validation; only use for values that passed it before.
+        """
+        obs = object.__new__(cls)
+        for f in fields(cls):
+            value = values.pop(f.name, f.default)
+            if value is MISSING:
+                raise TypeError(f"from_trusted() missing field: {f.name!r}")
+            setattr(obs, f.name, value)
+        if values:
+            raise TypeError(f"from_trusted() got unexpected fields: {sorted(values)}")
+        if obs.created_at is None:
+            obs.created_at = datetime.utcnow()
+        return obs
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to schema-compliant dict."""
         return {
@@ -65,7 +85,7 @@ class Observation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Hypothesis:
     """Reasoning layer hypothesis.
 
@@ -98,7 +118,7 @@ class Hypothesis:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidencePlan:
     """Plan for what evidence to collect.
 
@@ -117,7 +137,16 @@ class EvidencePlan:
         }
 
 
-@dataclass
+# Allowed FindingDraft enum values, in display order, and as sets for membership
+VALID_IMPACTS = ("low", "medium", "high", "critical")
+VALID_LIKELIHOODS = ("low", "medium", "high", "very_high")
+VALID_STATUSES = ("draft", "validated", "closed")
+_IMPACT_SET = frozenset(VALID_IMPACTS)
+_LIKELIHOOD_SET = frozenset(VALID_LIKELIHOODS)
+_STATUS_SET = frozenset(VALID_STATUSES)
+
+
+@dataclass(slots=True)
 class FindingDraft:
     """Draft finding ready for export to bhd-cli.
 
@@ -139,16 +168,12 @@ class FindingDraft:
 
     def __post_init__(self):
         # Validate enum values
-        valid_impacts = ["low", "medium", "high", "critical"]
-        valid_likelihoods = ["low", "medium", "high", "very_high"]
-        valid_statuses = ["draft", "validated", "closed"]
-
-        if self.impact not in valid_impacts:
-            raise ValueError(f"impact must be one of {valid_impacts}")
-        if self.likelihood not in valid_likelihoods:
-            raise ValueError(f"likelihood must be one of {valid_likelihoods}")
-        if self.status not in valid_statuses:
-            raise ValueError(f"status must be one of {valid_statuses}")
+        if self.impact not in _IMPACT_SET:
+            raise ValueError(f"impact must be one of {list(VALID_IMPACTS)}")
+        if self.likelihood not in _LIKELIHOOD_SET:
+            raise ValueError(f"likelihood must be one of {list(VALID_LIKELIHOODS)}")
+        if self.status not in _STATUS_SET:
+            raise ValueError(f"status must be one of {list(VALID_STATUSES)}")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to schema-compliant dict."""
@@ -167,7 +192,7 @@ class FindingDraft:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportBundle:
     """Export bundle for bhd-cli integration.
 
@@ -194,7 +219,7 @@ class ExportBundle:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionLogEntry:
     """Entry in the decision log."""
     timestamp: datetime
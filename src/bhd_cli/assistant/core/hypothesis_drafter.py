@@ -2,6 +2,7 @@
 import hashlib
 import json
 import logging
+from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -10,10 +11,79 @@ import jsonschema
 from .adaptive_mode import AssistContext, EffectiveAssistLevel, evaluate_assist_level
 from .entities import Hypothesis, Observation
 from .ports import ILLMPort, IPolicyGuard
+from .schema_validator import SchemaValidator
 
 
 logger = logging.getLogger(__name__)
 
+# Clusters drafted per LLM call; larger prompts trade away per-item accuracy
+BATCH_SIZE = 8
+
+# orjson is an optional speedup (pip install bhd-cli[fast]) for the
+# per-observation data dumps in prompts
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_data(data: Dict[str, Any]) -> str:
+    """Observation data as 2-space indented JSON for a prompt.
+
+    Always the text json.dumps(indent=2) gives, so prompts don't depend on
+    whether orjson is installed: orjson can't escape non-ASCII (\\u00e9), so
+    its output is only used when it is pure ASCII.
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. non-string keys; json.dumps coerces them
+        else:
+            if payload.isascii():
+                return payload.decode()
+    return json.dumps(data, indent=2)
+
+
+# Fixed prompt text, built once; only observations, IDs and counts vary per call
+_LAB_CONSTRAINTS = """
+Safety Constraints (LAB MODE):
+- Focus on validation techniques and evidence collection
+- Provide testing methodologies appropriate for lab environments
+- Include risk framing and threat modeling
+- Suggest safe verification strategies
+- DO NOT provide actual exploit code or weaponized payloads
+- DO NOT provide bypass steps or persistence mechanisms
+- Cite observation IDs in the rationale
+"""
+
+_STD_CONSTRAINTS = """
+Safety Constraints (STANDARD MODE):
+- Focus ONLY on validation checklists and evidence collection
+- Provide safe, non-destructive testing guidance
+- Include risk framing suitable for client environments
+- DO NOT provide exploitation guidance
+- DO NOT provide exploit code, payloads, or bypass instructions
+- Cite observation IDs in the rationale
+"""
+
+_FIELD_LINES = """- title: Short hypothesis title (max 100 chars)
+- description: Technical description of the potential security issue (2-4 sentences)
+- risk_tags: List of relevant risk tags (e.g., ["exposure", "misconfiguration", "authentication"])
+- confidence: Float 0-1 representing confidence in this hypothesis
+- rationale: Why this hypothesis was formed based on the %s (cite observation IDs)
+- requires_validation: boolean (default true)
+
+Output ONLY valid JSON matching the schema. No markdown formatting."""
+
+_SINGLE_PROMPT_TAIL = _FIELD_LINES % "observations"
+
+_BATCH_PROMPT_TAIL = """ hypotheses,
+the i-th for the cluster marked [index=i], each with:
+- id: the cluster's id above
+- related_observations: the cluster's related_observations above
+""" + _FIELD_LINES % "cluster's observations"
+
 
 class HypothesisDrafter:
     """Service for drafting hypotheses from observations using LLM."""
@@ -34,6 +104,19 @@ class HypothesisDrafter:
         with open(schema_path) as f:
             self.schema = json.load(f)
 
+        # Check the schema and build its validator once, shared with SchemaValidator
+        self._validate = SchemaValidator.compiled(self.schema)
+
+        # Batched calls ask for {"hypotheses": [...]}; each item is validated
+        # against self.schema on its own so one bad item doesn't sink the batch
+        self.batch_schema = {
+            "type": "object",
+            "required": ["hypotheses"],
+            "properties": {
+                "hypotheses": {"type": "array", "items": self.schema}
+            }
+        }
+
     def draft_hypotheses(
         self,
         observations: List[Observation],
@@ -58,19 +141,30 @@ class HypothesisDrafter:
         # Group observations (simple heuristic: by category + host)
         clusters = self._cluster_observations(observations)
 
-        # Generate hypotheses for each cluster (up to max_hypotheses)
+        # Generate hypotheses for each cluster (up to max_hypotheses),
+        # up to BATCH_SIZE clusters per LLM call
+        selected = clusters[:max_hypotheses]
         hypotheses = []
-        for i, cluster in enumerate(clusters[:max_hypotheses]):
-            try:
-                hyp = self._draft_single_hypothesis(
-                    cluster,
-                    evaluation.effective_level
-                )
-                if hyp:
-                    hypotheses.append(hyp.to_dict())
-            except Exception as e:
-                logger.error(f"Failed to draft hypothesis for cluster {i}: {e}")
-                continue
+        for start in range(0, len(selected), BATCH_SIZE):
+            batch = selected[start:start + BATCH_SIZE]
+            drafted = [None]
+            if len(batch) > 1:
+                drafted = self._draft_batch(batch, evaluation.effective_level)
+
+            for i, (cluster, hyp) in enumerate(zip(batch, drafted), start):
+                try:
+                    if hyp is None:
+                        # Not batched, or the batch item was missing/invalid:
+                        # draft this cluster alone with the repair loop
+                        hyp = self._draft_single_hypothesis(
+                            cluster,
+                            evaluation.effective_level
+                        )
+                    if hyp:
+                        hypotheses.append(hyp.to_dict())
+                except Exception as e:
+                    logger.error(f"Failed to draft hypothesis for cluster {i}: {e}")
+                    continue
 
         # Get provider name if available
         provider_used = None
@@ -91,19 +185,104 @@ class HypothesisDrafter:
 
         Simple heuristic: group by (category, host) where host exists in data.
         """
-        clusters: Dict[Tuple[str, str], List[Observation]] = {}
+        clusters: Dict[Tuple[str, str], List[Observation]] = defaultdict(list)
+        # Category -> its key string, resolved once per distinct category
+        category_keys: Dict[Any, str] = {}
 
         for obs in observations:
-            category = obs.category.value if hasattr(obs.category, 'value') else str(obs.category)
-            host = obs.data.get("host", obs.data.get("hostname", "unknown"))
-            key = (category, host)
+            category = category_keys.get(obs.category)
+            if category is None:
+                category = (
+                    obs.category.value if hasattr(obs.category, 'value') else str(obs.category)
+                )
+                category_keys[obs.category] = category
 
-            if key not in clusters:
-                clusters[key] = []
-            clusters[key].append(obs)
+            data = obs.data
+            host = data["host"] if "host" in data else data.get("hostname", "unknown")
+            clusters[(category, host)].append(obs)
 
         return list(clusters.values())
 
+    def _draft_batch(
+        self,
+        clusters: List[List[Observation]],
+        assist_level: EffectiveAssistLevel
+    ) -> List[Any]:
+        """
+        Draft one hypothesis per cluster with a single LLM call.
+
+        Items are matched to clusters by their deterministic id, and must
+        cite exactly the cluster's observations, so reordered, merged or
+        duplicated items can't attach to the wrong cluster. Returns a list
+        aligned with clusters: a Hypothesis, False if the policy guard
+        blocked it, or None where no matching valid item came back (the
+        caller retries those one at a time).
+        """
+        drafted: List[Any] = [None] * len(clusters)
+        try:
+            result = self.llm.generate_structured(
+                self._build_batch_prompt(clusters, assist_level),
+                self.batch_schema,
+                temperature=0.0
+            )
+        except Exception as e:
+            logger.warning(f"Batched hypothesis call failed, drafting clusters individually: {e}")
+            return drafted
+
+        items = result.get("hypotheses") if isinstance(result, dict) else None
+        if not isinstance(items, list):
+            logger.warning(
+                "Batched response has no hypotheses array, drafting clusters individually"
+            )
+            return drafted
+
+        index_by_id = {self._hypothesis_id(cluster): i for i, cluster in enumerate(clusters)}
+        for item in items:
+            item_id = item.get("id") if isinstance(item, dict) else None
+            i = index_by_id.get(item_id) if isinstance(item_id, str) else None
+            if i is None or drafted[i] is not None:
+                logger.warning("Batched hypothesis has an unknown or repeated id, ignoring it")
+                continue
+            try:
+                self._validate(item)
+            except jsonschema.ValidationError as e:
+                logger.warning(f"Batched hypothesis {item['id']} failed validation: {e}")
+                continue
+            if sorted(item["related_observations"]) != sorted(obs.id for obs in clusters[i]):
+                logger.warning(
+                    f"Batched hypothesis {item['id']} cites other observations, ignoring it"
+                )
+                continue
+            hyp = self._accept(item)
+            drafted[i] = hyp if hyp is not None else False
+
+        return drafted
+
+    def _accept(self, result: Dict[str, Any]) -> Optional[Hypothesis]:
+        """Policy-check a schema-valid result and convert it, or None if blocked."""
+        # Policy guard check on text fields
+        text_content = "\n".join([
+            result.get("title", ""),
+            result.get("description", ""),
+            result.get("rationale", "")
+        ])
+
+        if not self.policy_guard.check_content(text_content, {"source": "hypothesis_draft"}):
+            logger.warning("Hypothesis blocked by policy guard")
+            return None
+
+        # Convert to Hypothesis entity
+        return Hypothesis(
+            id=result["id"],
+            related_observations=result["related_observations"],
+            title=result["title"],
+            description=result["description"],
+            risk_tags=result["risk_tags"],
+            confidence=result["confidence"],
+            rationale=result["rationale"],
+            requires_validation=result.get("requires_validation", True)
+        )
+
     def _draft_single_hypothesis(
         self,
         observations: List[Observation],
@@ -112,6 +291,7 @@ class HypothesisDrafter:
         """Draft a single hypothesis from clustered observations."""
         # Build prompt
         prompt = self._build_prompt(observations, assist_level)
+        generate = self.llm.bind_schema(self.schema, temperature=0.0)
 
         # Try to generate with repair loop (up to 2 repair attempts)
         max_attempts = 3
@@ -121,11 +301,7 @@ class HypothesisDrafter:
             try:
                 if attempt == 0:
                     # First attempt: normal prompt
-                    result = self.llm.generate_structured(
-                        prompt,
-                        self.schema,
-                        temperature=0.0
-                    )
+                    result = generate(prompt)
                 else:
                     # Repair attempt: include validation error
                     repair_prompt = f"""{prompt}
@@ -134,37 +310,12 @@ PREVIOUS ATTEMPT FAILED VALIDATION:
 {last_error}
 
 Please provide a corrected JSON response that exactly matches the schema."""
-                    result = self.llm.generate_structured(
-                        repair_prompt,
-                        self.schema,
-                        temperature=0.0
-                    )
-
-                # Validate against schema
-                jsonschema.validate(instance=result, schema=self.schema)
-
-                # Policy guard check on text fields
-                text_content = "\n".join([
-                    result.get("title", ""),
-                    result.get("description", ""),
-                    result.get("rationale", "")
-                ])
-
-                if not self.policy_guard.check_content(text_content, {"source": "hypothesis_draft"}):
-                    logger.warning("Hypothesis blocked by policy guard")
-                    return None
+                    result = generate(repair_prompt)
 
-                # Convert to Hypothesis entity
-                return Hypothesis(
-                    id=result["id"],
-                    related_observations=result["related_observations"],
-                    title=result["title"],
-                    description=result["description"],
-                    risk_tags=result["risk_tags"],
-                    confidence=result["confidence"],
-                    rationale=result["rationale"],
-                    requires_validation=result.get("requires_validation", True)
-                )
+                # Validate against schema (same error jsonschema.validate would raise)
+                self._validate(result)
+
+                return self._accept(result)
 
             except jsonschema.ValidationError as e:
                 last_error = str(e)
@@ -179,69 +330,77 @@ Please provide a corrected JSON response that exactly matches the schema."""
 
         return None
 
+    @staticmethod
+    def _format_observations(observations: List[Observation]) -> str:
+        """Serialize observations for a prompt."""
+        parts = []
+        for obs in observations:
+            category = obs.category.value if hasattr(obs.category, 'value') else obs.category
+            parts += (
+                "Observation ", obs.id, ":\n",
+                "  Category: ", str(category), "\n",
+                "  Tags: ", ", ".join(obs.tags), "\n",
+                "  Data: ", _dumps_data(obs.data), "\n",
+                "  Confidence: ", str(obs.confidence), "\n"
+            )
+        # No newline after the last observation
+        return "".join(parts[:-1])
+
+    @staticmethod
+    def _hypothesis_id(observations: List[Observation]) -> str:
+        """Deterministic hypothesis ID for a cluster."""
+        obs_ids_str = "-".join(sorted(obs.id for obs in observations))
+        return hashlib.sha256(obs_ids_str.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _constraints(assist_level: EffectiveAssistLevel) -> str:
+        """Safety constraints block for the assistance level."""
+        if assist_level == EffectiveAssistLevel.DEEP_LAB:
+            return _LAB_CONSTRAINTS
+        return _STD_CONSTRAINTS
+
     def _build_prompt(
         self,
         observations: List[Observation],
         assist_level: EffectiveAssistLevel
     ) -> str:
         """Build prompt for hypothesis generation."""
-        # Serialize observations
-        obs_text = "\n".join([
-            f"Observation {obs.id}:\n"
-            f"  Category: {obs.category.value if hasattr(obs.category, 'value') else obs.category}\n"
-            f"  Tags: {', '.join(obs.tags)}\n"
-            f"  Data: {json.dumps(obs.data, indent=2)}\n"
-            f"  Confidence: {obs.confidence}"
-            for obs in observations
-        ])
-
-        # Get observation IDs for reference
-        obs_ids = [obs.id for obs in observations]
-
-        # Generate deterministic hypothesis ID
-        obs_ids_str = "-".join(sorted(obs_ids))
-        hyp_id = hashlib.sha256(obs_ids_str.encode()).hexdigest()[:16]
-
-        # Build prompt based on assistance level
-        if assist_level == EffectiveAssistLevel.DEEP_LAB:
-            constraints = """
-Safety Constraints (LAB MODE):
-- Focus on validation techniques and evidence collection
-- Provide testing methodologies appropriate for lab environments
-- Include risk framing and threat modeling
-- Suggest safe verification strategies
-- DO NOT provide actual exploit code or weaponized payloads
-- DO NOT provide bypass steps or persistence mechanisms
-- Cite observation IDs in the rationale
-"""
-        else:  # STANDARD
-            constraints = """
-Safety Constraints (STANDARD MODE):
-- Focus ONLY on validation checklists and evidence collection
-- Provide safe, non-destructive testing guidance
-- Include risk framing suitable for client environments
-- DO NOT provide exploitation guidance
-- DO NOT provide exploit code, payloads, or bypass instructions
-- Cite observation IDs in the rationale
-"""
-
-        prompt = f"""Based on the following observations, draft a security hypothesis.
-
-Observations:
-{obs_text}
-
-{constraints}
-
-Generate a JSON hypothesis with:
-- id: "{hyp_id}"
-- related_observations: {json.dumps(obs_ids)}
-- title: Short hypothesis title (max 100 chars)
-- description: Technical description of the potential security issue (2-4 sentences)
-- risk_tags: List of relevant risk tags (e.g., ["exposure", "misconfiguration", "authentication"])
-- confidence: Float 0-1 representing confidence in this hypothesis
-- rationale: Why this hypothesis was formed based on the observations (cite observation IDs)
-- requires_validation: boolean (default true)
-
-Output ONLY valid JSON matching the schema. No markdown formatting."""
-
-        return prompt
+        return "".join((
+            "Based on the following observations, draft a security hypothesis.\n\n"
+            "Observations:\n",
+            self._format_observations(observations),
+            "\n\n",
+            self._constraints(assist_level),
+            "\n\nGenerate a JSON hypothesis with:\n"
+            "- id: \"", self._hypothesis_id(observations), "\"\n"
+            "- related_observations: ", json.dumps([obs.id for obs in observations]), "\n",
+            _SINGLE_PROMPT_TAIL
+        ))
+
+    def _build_batch_prompt(
+        self,
+        clusters: List[List[Observation]],
+        assist_level: EffectiveAssistLevel
+    ) -> str:
+        """Build one prompt asking for a hypothesis per cluster, in order."""
+        parts = [
+            "Based on the following observation clusters, "
+            "draft one security hypothesis per cluster.\n\n"
+            "Clusters:\n"
+        ]
+        for i, cluster in enumerate(clusters):
+            if i:
+                parts.append("\n\n")
+            parts += (
+                "[index=", str(i), "]\n"
+                "id: \"", self._hypothesis_id(cluster), "\"\n"
+                "related_observations: ", json.dumps([obs.id for obs in cluster]), "\n",
+                self._format_observations(cluster)
+            )
+        parts += (
+            "\n\n",
+            self._constraints(assist_level),
+            "\n\nGenerate a JSON object {\"hypotheses\": [...]} with exactly ", str(len(clusters)),
+            _BATCH_PROMPT_TAIL
+        )
+        return "".join(parts)
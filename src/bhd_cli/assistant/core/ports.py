@@ -1,6 +1,7 @@
 """Ports/interfaces for adapters (hexagonal architecture)."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from .entities import (
     AssistanceLevel,
@@ -19,6 +20,10 @@ class IStoragePort(ABC):
         """Save an observation and return its ID."""
         pass
 
+    def save_observations(self, observations: Iterable[Observation]) -> List[str]:
+        """Save a stream of observations and return their IDs."""
+        return [self.save_observation(obs) for obs in observations]
+
     @abstractmethod
     def load_observations(self, session_id: str) -> List[Observation]:
         """Load observations for a session."""
@@ -29,6 +34,10 @@ class IStoragePort(ABC):
         """Save a finding draft and return its ID."""
         pass
 
+    def save_finding_drafts(self, drafts: Iterable[FindingDraft]) -> List[str]:
+        """Save several finding drafts and return their IDs."""
+        return [self.save_finding_draft(draft) for draft in drafts]
+
 
 class ILLMPort(ABC):
     """Interface for LLM provider."""
@@ -48,6 +57,59 @@ class ILLMPort(ABC):
         """Check if text passes safety validation."""
         pass
 
+    def bind_schema(
+        self,
+        schema: Dict[str, Any],
+        temperature: float = 0.0
+    ) -> Callable[[str], Dict[str, Any]]:
+        """
+        Return prompt -> result for repeated calls against one schema.
+
+        Providers override this to build their schema-specific request parts
+        (e.g. the system prompt) once instead of on every call.
+        """
+        return lambda prompt: self.generate_structured(prompt, schema, temperature)
+
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        temperature: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_structured.
+
+        Runs the sync call in a worker thread by default; providers with a
+        native async client override this.
+        """
+        return await asyncio.to_thread(self.generate_structured, prompt, schema, temperature)
+
+    async def agenerate_batch(
+        self,
+        prompts: List[str],
+        schema: Dict[str, Any],
+        temperature: float = 0.0,
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Generate one result per prompt, running up to `concurrency` requests at once."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.agenerate_structured(prompt, schema, temperature)
+
+        return list(await asyncio.gather(*(run(p) for p in prompts)))
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        schema: Dict[str, Any],
+        temperature: float = 0.0,
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Blocking wrapper around agenerate_batch (results in prompt order)."""
+        return asyncio.run(self.agenerate_batch(prompts, schema, temperature, concurrency))
+
 
 class IParserPort(ABC):
     """Interface for tool output parsers."""
@@ -62,6 +124,10 @@ class IParserPort(ABC):
         """Parse tool output into observations."""
         pass
 
+    def iter_parse(self, tool_name: str, output: str) -> Iterator[Observation]:
+        """Yield observations one at a time (parsers that can stream override this)."""
+        return iter(self.parse(tool_name, output))
+
 
 class IPolicyGuard(ABC):
     """Interface for policy enforcement."""
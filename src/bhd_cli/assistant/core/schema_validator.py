@@ -1,7 +1,8 @@
 """Schema validation for all structured outputs."""
+import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 try:
     import jsonschema
@@ -9,10 +10,62 @@ try:
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
+# fastjsonschema is an optional speedup (pip install bhd-cli[fast]) that
+# generates Python code per schema; jsonschema still reports the errors
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+def compile_validator(schema: Dict[str, Any]) -> Callable[[Any], None]:
+    """
+    Check a schema once and return data -> None, raising the best-match
+    jsonschema.ValidationError for invalid data.
+
+    With fastjsonschema, its generated code accepts valid data; anything it
+    rejects is re-checked by jsonschema, which builds the error and has the
+    final say, so results match plain jsonschema either way.
+    """
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+
+    def check(data: Any) -> None:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+        if error is not None:
+            raise error
+
+    if fastjsonschema is None:
+        return check
+    try:
+        # use_default=False: validation must never write schema defaults into data
+        fast = fastjsonschema.compile(schema, use_default=False)
+    except Exception:
+        # e.g. a relative $ref fastjsonschema cannot resolve at compile time
+        return check
+
+    def fast_check(data: Any) -> None:
+        try:
+            fast(data)
+        except fastjsonschema.JsonSchemaException:
+            check(data)
+
+    return fast_check
+
+
+def schema_key(schema: Dict[str, Any]) -> str:
+    """Content hash of a schema; equal schemas get equal keys regardless of key order."""
+    return hashlib.blake2b(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
 
 class SchemaValidator:
     """Validates data against JSON schemas."""
 
+    # Compiled validators shared by every instance (and HypothesisDrafter),
+    # keyed by schema_key() so identical schemas compile once however loaded
+    _validator_cache: Dict[str, Callable[[Any], None]] = {}
+
     def __init__(self, schemas_dir: Optional[Path] = None):
         if not JSONSCHEMA_AVAILABLE:
             raise ImportError("jsonschema library required: pip install jsonschema")
@@ -22,18 +75,31 @@ class SchemaValidator:
 
         self.schemas_dir = schemas_dir
         self._schema_cache: Dict[str, Dict[str, Any]] = {}
+        self._validators_by_name: Dict[str, Callable[[Any], None]] = {}
+
+    @classmethod
+    def compiled(cls, schema: Dict[str, Any]) -> Callable[[Any], None]:
+        """Return the shared compiled validator for a schema's content."""
+        key = schema_key(schema)
+        validator = cls._validator_cache.get(key)
+        if validator is None:
+            validator = cls._validator_cache.setdefault(key, compile_validator(schema))
+        return validator
 
     def _load_schema(self, schema_name: str) -> Dict[str, Any]:
         """Load a schema from file."""
         if schema_name in self._schema_cache:
             return self._schema_cache[schema_name]
 
-        schema_file = self.schemas_dir / f"{schema_name}.schema.json"
-        if not schema_file.exists():
-            # Try playbooks schemas dir
-            schema_file = self.schemas_dir.parent / "playbooks" / "schemas" / f"{schema_name}.schema.json"
-
-        if not schema_file.exists():
+        filename = f"{schema_name}.schema.json"
+        candidates = (
+            self.schemas_dir / filename,
+            # Playbook schemas, then the bhd-cli export bundle schema
+            self.schemas_dir.parent / "playbooks" / "schemas" / filename,
+            self.schemas_dir.parent / "integration" / "bhd_cli" / "schemas" / filename,
+        )
+        schema_file = next((c for c in candidates if c.exists()), None)
+        if schema_file is None:
             raise FileNotFoundError(f"Schema not found: {schema_name}")
 
         with open(schema_file) as f:
@@ -55,8 +121,12 @@ class SchemaValidator:
         Raises:
             jsonschema.ValidationError: If validation fails
         """
-        schema = self._load_schema(schema_name)
-        jsonschema.validate(data, schema)
+        validator = self._validators_by_name.get(schema_name)
+        if validator is None:
+            validator = self.compiled(self._load_schema(schema_name))
+            self._validators_by_name[schema_name] = validator
+
+        validator(data)
         return True
 
     def validate_observation(self, data: Dict[str, Any]) -> bool:
@@ -77,11 +147,7 @@ class SchemaValidator:
 
     def validate_export_bundle(self, data: Dict[str, Any]) -> bool:
         """Validate export bundle data."""
-        schema_file = self.schemas_dir.parent / "integration" / "bhd_cli" / "schemas" / "bundle.schema.json"
-        with open(schema_file) as f:
-            schema = json.load(f)
-        jsonschema.validate(data, schema)
-        return True
+        return self.validate(data, "bundle")
 
 
 # Global validator instance
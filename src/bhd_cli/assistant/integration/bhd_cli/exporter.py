@@ -1,7 +1,7 @@
 """Export finding drafts to bhd-cli format."""
-import json
 from typing import Any, Dict, List
 
+from ...adapters.json_codec import dumps_pretty
 from ...core.entities import FindingDraft
 
 
@@ -67,8 +67,9 @@ class BHDCLIExporter:
             }
         }
 
-        with open(output_path, "w") as f:
-            json.dump(export_data, f, indent=2, sort_keys=True)
+        # Encoded in one call (orjson when installed) and written as bytes
+        with open(output_path, "wb") as f:
+            f.write(dumps_pretty(export_data))
 
     @staticmethod
     def to_bhd_cli_import_format(drafts: List[FindingDraft]) -> str:
@@ -78,8 +79,4 @@ class BHDCLIExporter:
             for draft in drafts
         ]
 
-        return json.dumps(
-            {"findings": findings},
-            indent=2,
-            sort_keys=True
-        )
+        return dumps_pretty({"findings": findings}).decode()
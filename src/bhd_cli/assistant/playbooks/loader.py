@@ -1,12 +1,44 @@
 """Playbook loader and validator."""
 import json
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 import yaml
 
 from ..core.entities import EvidencePlan, FindingDraft
 
+# libyaml's C parser when PyYAML was built with it; same safe semantics as
+# yaml.safe_load. Shared with the selector.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Playbook evidence type -> evidence.schema.json type (unknown types map to "other")
+_EVIDENCE_TYPE_MAP = MappingProxyType({
+    "request_response": "request_response_pair",
+    "screenshot": "screenshot",
+    "config": "configuration_snapshot",
+    "banner": "banner_capture",
+    "log": "log_entry",
+    "timestamp": "metadata"
+})
+
+# Playbook finding_template levels -> lowercase schema values (default "medium")
+_IMPACT_MAP = MappingProxyType({
+    "Critical": "critical",
+    "High": "high",
+    "Medium": "medium",
+    "Low": "low",
+    "Informational": "low"
+})
+_LIKELIHOOD_MAP = MappingProxyType({
+    "High": "high",
+    "Medium": "medium",
+    "Low": "low"
+})
+
 
 class PlaybookLoader:
     """Loads and validates playbooks from YAML files."""
@@ -15,6 +47,10 @@ class PlaybookLoader:
         self.playbooks_dir = playbooks_dir
         self.schemas_dir = schemas_dir
         self._playbook_cache: Dict[str, Dict[str, Any]] = {}
+        # Filled by _scan() on first lookup: parsed YAML per file, and
+        # file stem / playbook id -> file
+        self._parsed: Optional[Dict[Path, Any]] = None
+        self._id_index: Dict[str, Path] = {}
         self._load_schemas()
 
     def _load_schemas(self) -> None:
@@ -28,26 +64,53 @@ class PlaybookLoader:
         with open(evidence_schema_path) as f:
             self.evidence_schema = json.load(f)
 
+    def _scan(self) -> None:
+        """Parse every playbook file once and index it by stem and playbook id."""
+        if self._parsed is not None:
+            return
+
+        self._parsed = {}
+        self._id_index = {}
+        for file_path in sorted(self.playbooks_dir.rglob("*.yaml")):
+            try:
+                with open(file_path) as f:
+                    playbook_data = yaml.load(f, Loader=YamlLoader)
+            except (OSError, yaml.YAMLError) as e:
+                # Unreadable files are skipped by list_playbooks; load_playbook
+                # re-raises the error for them
+                playbook_data = e
+            self._parsed[file_path] = playbook_data
+
+            self._id_index.setdefault(file_path.stem, file_path)
+            if isinstance(playbook_data, dict) and isinstance(playbook_data.get("id"), str):
+                self._id_index.setdefault(playbook_data["id"], file_path)
+
     def load_playbook(self, playbook_id: str) -> Dict[str, Any]:
-        """Load a playbook by ID from YAML file."""
+        """Load a playbook by ID from YAML file.
+
+        Raises:
+            FileNotFoundError: No playbook with this ID
+            OSError, yaml.YAMLError: The playbook file can't be read or parsed
+            ValueError: The playbook fails validation
+        """
         if playbook_id in self._playbook_cache:
             return self._playbook_cache[playbook_id]
 
-        # Try to find playbook file
-        playbook_file = None
-        for file_path in self.playbooks_dir.rglob("*.yaml"):
-            if file_path.stem == playbook_id or playbook_id in str(file_path):
-                playbook_file = file_path
-                break
+        self._scan()
+        playbook_file = self._id_index.get(playbook_id)
+        if playbook_file is None:
+            # Fall back to a partial path match (e.g. a subdirectory name)
+            playbook_file = next((p for p in self._parsed if playbook_id in str(p)), None)
 
         if not playbook_file:
             raise FileNotFoundError(f"Playbook {playbook_id} not found")
 
-        with open(playbook_file) as f:
-            playbook_data = yaml.safe_load(f)
+        playbook_data = self._parsed[playbook_file]
+        if isinstance(playbook_data, Exception):
+            raise playbook_data
 
         # Basic validation
-        if not self._validate_playbook(playbook_data):
+        if not isinstance(playbook_data, dict) or not self._validate_playbook(playbook_data):
             raise ValueError(f"Playbook {playbook_id} failed validation")
 
         self._playbook_cache[playbook_id] = playbook_data
@@ -72,32 +135,28 @@ class PlaybookLoader:
     def list_playbooks(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """List all available playbooks with optional filters."""
         playbooks = []
+        test_type_filter = filters.get("test_type") if filters else None
 
-        for file_path in self.playbooks_dir.rglob("*.yaml"):
-            try:
-                with open(file_path) as f:
-                    playbook_data = yaml.safe_load(f)
-
-                if self._validate_playbook(playbook_data):
-                    # Apply filters if provided
-                    if filters:
-                        test_type_filter = filters.get("test_type")
-                        if test_type_filter:
-                            if test_type_filter not in playbook_data.get("test_types", []):
-                                continue
-
-                    playbooks.append({
-                        "id": playbook_data["id"],
-                        "name": playbook_data["name"],
-                        "version": playbook_data["version"],
-                        "type": playbook_data["type"],
-                        "test_types": playbook_data["test_types"],
-                        "description": playbook_data.get("description", "")
-                    })
-            except Exception:
-                # Skip invalid playbooks
+        self._scan()
+        for playbook_data in self._parsed.values():
+            # Skip invalid playbooks
+            if not isinstance(playbook_data, dict) or not self._validate_playbook(playbook_data):
                 continue
 
+            # Apply filters if provided
+            if test_type_filter:
+                if test_type_filter not in playbook_data.get("test_types", []):
+                    continue
+
+            playbooks.append({
+                "id": playbook_data["id"],
+                "name": playbook_data["name"],
+                "version": playbook_data["version"],
+                "type": playbook_data["type"],
+                "test_types": playbook_data["test_types"],
+                "description": playbook_data.get("description", "")
+            })
+
         # Sort by ID for deterministic ordering
         return sorted(playbooks, key=lambda p: p["id"])
 
@@ -144,15 +203,7 @@ class PlaybookLoader:
         EvidencePlan uses: request_response_pair, screenshot, configuration_snapshot,
                           banner_capture, network_trace, log_entry, metadata, other
         """
-        type_map = {
-            "request_response": "request_response_pair",
-            "screenshot": "screenshot",
-            "config": "configuration_snapshot",
-            "banner": "banner_capture",
-            "log": "log_entry",
-            "timestamp": "metadata"
-        }
-        return type_map.get(playbook_type, "other")
+        return _EVIDENCE_TYPE_MAP.get(playbook_type, "other")
 
     def create_evidence_plan(self, playbook_data: Dict[str, Any]) -> EvidencePlan:
         """Create evidence plan from playbook."""
@@ -190,29 +241,15 @@ class PlaybookLoader:
 
         template = playbook_data["finding_template"]
 
-        # Map impact levels to lowercase for schema compliance
-        impact_map = {
-            "Critical": "critical",
-            "High": "high",
-            "Medium": "medium",
-            "Low": "low",
-            "Informational": "low"
-        }
-
-        likelihood_map = {
-            "High": "high",
-            "Medium": "medium",
-            "Low": "low"
-        }
-
         return FindingDraft(
             id=finding_id,
             title=template["title"],
             description=template["description"],
             affected_asset=affected_asset,
             evidence_refs=evidence_refs,
-            impact=impact_map.get(template["impact_level"], "medium"),
-            likelihood=likelihood_map.get(template["likelihood"], "medium"),
+            # Map levels to lowercase for schema compliance
+            impact=_IMPACT_MAP.get(template["impact_level"], "medium"),
+            likelihood=_LIKELIHOOD_MAP.get(template["likelihood"], "medium"),
             remediation=template["remediation"],
             business_impact=template["business_impact"],
             risk_tags=[],
@@ -1,10 +1,90 @@
 """Playbook selector based on observations and rules."""
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
 
 import yaml
 
 from ..core.entities import Observation
+from .loader import YamlLoader
+
+_MISSING = object()
+
+
+class _CompiledCondition(NamedTuple):
+    """One rule condition: an observation category and a data predicate."""
+    category: Any
+    matches: Callable[[Dict[str, Any]], bool]
+    data_contains: List[Dict[str, Any]]  # as written, for explain output
+
+
+class _CompiledRule(NamedTuple):
+    """A selector rule with its test types and conditions prepared for matching."""
+    rule: Dict[str, Any]
+    test_types: FrozenSet[str]
+    conditions: Tuple[_CompiledCondition, ...]
+
+
+def _compile_requirement(req: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Build data -> bool for one data_contains entry (key, value/values/contains)."""
+    key = req.get("key")
+    value = req.get("value", _MISSING)
+    values = req.get("values", _MISSING)
+    contains = req.get("contains", _MISSING)
+
+    values_set = None
+    if values is not _MISSING:
+        try:
+            values_set = frozenset(values)
+        except TypeError:
+            pass  # unhashable entries; keep list membership
+    if contains is not _MISSING:
+        contains = tuple(substr.lower() for substr in contains)
+
+    def check(data: Dict[str, Any]) -> bool:
+        if key not in data:
+            return False
+        actual = data[key]
+
+        if value is not _MISSING and actual != value:
+            return False
+
+        if values is not _MISSING:
+            try:
+                found = actual in values_set if values_set is not None else actual in values
+            except TypeError:
+                # Unhashable data value (e.g. a list); compare by equality
+                found = actual in values
+            if not found:
+                return False
+
+        if contains is not _MISSING:
+            data_str = str(actual).lower()
+            if not any(substr in data_str for substr in contains):
+                return False
+
+        return True
+
+    return check
+
+
+def _compile_condition(condition: Dict[str, Any]) -> _CompiledCondition:
+    """Prepare one condition: all of its data_contains entries must hold."""
+    data_contains = condition.get("data_contains", [])
+    checks = tuple(_compile_requirement(req) for req in data_contains)
+    return _CompiledCondition(
+        category=condition.get("category"),
+        matches=lambda data: all(check(data) for check in checks),
+        data_contains=data_contains
+    )
+
+
+def _compile_rule(rule: Dict[str, Any]) -> _CompiledRule:
+    """Prepare a rule once so selection is a loop over ready-made predicates."""
+    return _CompiledRule(
+        rule=rule,
+        test_types=frozenset(rule.get("test_types", [])),
+        conditions=tuple(_compile_condition(c) for c in rule.get("conditions", []))
+    )
 
 
 class PlaybookSelector:
@@ -13,11 +93,12 @@ class PlaybookSelector:
     def __init__(self, rules_path: Path):
         self.rules_path = rules_path
         self.rules = self._load_rules()
+        self._compiled_rules = [_compile_rule(rule) for rule in self.rules.get("rules", [])]
 
     def _load_rules(self) -> Dict[str, Any]:
         """Load selector rules from YAML."""
         with open(self.rules_path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
 
     def select_playbook(
         self,
@@ -39,11 +120,17 @@ class PlaybookSelector:
         matching_rules = []
         evaluated_rules = [] if explain else None
 
-        for rule in self.rules.get("rules", []):
+        # Bucket observations by category once; every condition looks its category up
+        by_category: Dict[Any, List[Observation]] = {}
+        for obs in observations:
+            by_category.setdefault(obs.category.value, []).append(obs)
+
+        for compiled in self._compiled_rules:
+            rule = compiled.rule
             rule_id = rule.get("id", "unknown")
 
             # Check if test type matches
-            if test_type not in rule.get("test_types", []):
+            if test_type not in compiled.test_types:
                 if explain:
                     evaluated_rules.append({
                         "rule_id": rule_id,
@@ -54,8 +141,8 @@ class PlaybookSelector:
 
             # Check if observations match rule conditions
             match_result = self._matches_conditions(
-                observations,
-                rule.get("conditions", []),
+                by_category,
+                compiled.conditions,
                 explain=explain
             )
 
@@ -99,15 +186,15 @@ class PlaybookSelector:
 
     def _matches_conditions(
         self,
-        observations: List[Observation],
-        conditions: List[Dict[str, Any]],
+        by_category: Dict[Any, List[Observation]],
+        conditions: Tuple[_CompiledCondition, ...],
         explain: bool = False
     ) -> Union[bool, tuple]:
         """Check if observations match all conditions.
 
         Args:
-            observations: List of observations to check
-            conditions: List of condition dicts to evaluate
+            by_category: Observations to check, keyed by category value
+            conditions: Compiled conditions to evaluate
             explain: If True, return (matched, failure_reasons)
 
         Returns:
@@ -122,36 +209,29 @@ class PlaybookSelector:
         failure_reasons = [] if explain else None
 
         for idx, condition in enumerate(conditions):
-            category = condition.get("category")
-            data_contains = condition.get("data_contains", [])
+            category = condition.category
 
             # Find observations of matching category
-            matching_obs = [
-                obs for obs in observations
-                if obs.category.value == category
-            ]
+            matching_obs = by_category.get(category, ())
 
             if not matching_obs:
                 if explain:
                     failure_reasons.append(
                         f"Condition {idx}: No observations with category '{category}' "
-                        f"(available: {list(set(obs.category.value for obs in observations))})"
+                        f"(available: {list(by_category)})"
                     )
                     return (False, failure_reasons)
                 return False
 
             # Check if any matching observation satisfies data_contains
-            satisfied = False
-            for obs in matching_obs:
-                if self._check_data_contains(obs.data, data_contains):
-                    satisfied = True
-                    break
+            matches = condition.matches
+            satisfied = any(matches(obs.data) for obs in matching_obs)
 
             if not satisfied:
                 if explain:
                     failure_reasons.append(
                         f"Condition {idx}: Found {len(matching_obs)} observation(s) with category '{category}', "
-                        f"but none satisfied data_contains requirements: {data_contains}"
+                        f"but none satisfied data_contains requirements: {condition.data_contains}"
                     )
                     return (False, failure_reasons)
                 return False
@@ -159,29 +239,3 @@ class PlaybookSelector:
         if explain:
             return (True, [])
         return True
-
-    def _check_data_contains(
-        self,
-        data: Dict[str, Any],
-        requirements: List[Dict[str, Any]]
-    ) -> bool:
-        """Check if data contains all required fields and values."""
-        for req in requirements:
-            key = req.get("key")
-            if key not in data:
-                return False
-
-            if "value" in req:
-                if data[key] != req["value"]:
-                    return False
-
-            if "values" in req:
-                if data[key] not in req["values"]:
-                    return False
-
-            if "contains" in req:
-                data_str = str(data[key]).lower()
-                if not any(substr.lower() in data_str for substr in req["contains"]):
-                    return False
-
-        return True
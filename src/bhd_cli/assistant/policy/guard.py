@@ -40,6 +40,14 @@ class PolicyGuard(IPolicyGuard):
         r"\binjection\s+payload.*example\b",      # Require "example"
     ]
 
+    # Compiled once at import; check_content runs on every drafted hypothesis
+    ALWAYS_BLOCKED_COMPILED = tuple(
+        re.compile(p, re.IGNORECASE) for p in ALWAYS_BLOCKED_PATTERNS
+    )
+    VALIDATION_ONLY_BLOCKED_COMPILED = tuple(
+        re.compile(p, re.IGNORECASE) for p in VALIDATION_ONLY_BLOCKED_PATTERNS
+    )
+
     def __init__(
         self,
         assistance_level: AssistanceLevel = AssistanceLevel.VALIDATION_ONLY,
@@ -71,18 +79,16 @@ class PolicyGuard(IPolicyGuard):
 
     def check_content(self, content: str, context: Dict[str, Any]) -> bool:
         """Check if content passes policy rules."""
-        content_lower = content.lower()
-
         # Check always-blocked patterns
-        for pattern in self.ALWAYS_BLOCKED_PATTERNS:
-            if re.search(pattern, content_lower, re.IGNORECASE):
+        for compiled in self.ALWAYS_BLOCKED_COMPILED:
+            if compiled.search(content):
                 self.log_decision(DecisionLogEntry(
                     timestamp=datetime.utcnow(),
                     event_type="policy_blocked",
                     assistance_level=self.assistance_level,
                     details={
                         "reason": "always_blocked_pattern",
-                        "pattern": pattern,
+                        "pattern": compiled.pattern,
                         "context": context
                     },
                     redacted=True
@@ -91,15 +97,15 @@ class PolicyGuard(IPolicyGuard):
 
         # Check level-specific patterns
         if self.assistance_level == AssistanceLevel.VALIDATION_ONLY:
-            for pattern in self.VALIDATION_ONLY_BLOCKED_PATTERNS:
-                if re.search(pattern, content_lower, re.IGNORECASE):
+            for compiled in self.VALIDATION_ONLY_BLOCKED_COMPILED:
+                if compiled.search(content):
                     self.log_decision(DecisionLogEntry(
                         timestamp=datetime.utcnow(),
                         event_type="policy_blocked",
                         assistance_level=self.assistance_level,
                         details={
                             "reason": "validation_only_blocked_pattern",
-                            "pattern": pattern,
+                            "pattern": compiled.pattern,
                             "context": context
                         },
                         redacted=True
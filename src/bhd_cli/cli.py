@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 import argparse
+import bisect
+import io
 import json
+import os
 import re
+import shlex
 import sys
-from datetime import datetime
+import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
@@ -16,6 +22,12 @@ ENG_DIR = BASE_DIR / "engagements"
 CURRENT_FILE = ENG_DIR / ".current"
 CLI_NAME = "bhd-cli"
 
+# slugify: drop anything that isn't a word char/separator, then collapse separator runs
+_SLUG_DROP_RE = re.compile(r"[^\w -]+")
+_SLUG_SEP_RE = re.compile(r"[ _-]+")
+# Typo fixes for affected targets (10,0,0,1 -> 10.0.0.1)
+_AFFECTED_FIX = str.maketrans({",": "."})
+
 
 # --------------------------
 # Utilities / Storage
@@ -25,27 +37,21 @@ def ensure_dirs():
 
 
 def now_iso():
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def slugify(name: str) -> str:
-    keep = []
-    for ch in name.strip().lower():
-        if ch.isalnum():
-            keep.append(ch)
-        elif ch in (" ", "-", "_"):
-            keep.append("-")
-    slug = "".join(keep)
-    while "--" in slug:
-        slug = slug.replace("--", "-")
+    slug = _SLUG_DROP_RE.sub("", name.strip().lower())
+    slug = _SLUG_SEP_RE.sub("-", slug)
     return slug.strip("-") or "engagement"
 
 
 def pick_current_engagement() -> Path:
-    if not CURRENT_FILE.exists():
+    try:
+        rel = CURRENT_FILE.read_text().strip()
+    except FileNotFoundError:
         print(f"No current engagement selected. Run: {CLI_NAME} init", file=sys.stderr)
         sys.exit(1)
-    rel = CURRENT_FILE.read_text().strip()
     p = (ENG_DIR / rel).resolve()
     if not p.exists():
         print(f"Current engagement folder missing. Run: {CLI_NAME} init", file=sys.stderr)
@@ -58,18 +64,19 @@ def get_all_engagement_folders() -> list[Path]:
     Get all engagement folders sorted by name for deterministic processing.
     Returns empty list if engagements directory doesn't exist or has no subdirs.
     """
-    if not ENG_DIR.exists():
+    try:
+        it = os.scandir(ENG_DIR)
+    except FileNotFoundError:
         return []
 
-    folders = []
-    for item in ENG_DIR.iterdir():
-        if item.is_dir() and item.name != ".git":
-            # Skip hidden directories and version control
-            if not item.name.startswith("."):
-                folders.append(item)
+    with it:
+        # Skip hidden directories and version control (.git); scandir's
+        # cached dirent type means is_dir() doesn't stat each entry
+        entries = [e for e in it if not e.name.startswith(".") and e.is_dir()]
 
     # Sort by folder name for deterministic ordering
-    return sorted(folders, key=lambda p: p.name)
+    entries.sort(key=lambda e: e.name)
+    return [Path(e.path) for e in entries]
 
 
 def relative_path_display(path: Path) -> str:
@@ -95,6 +102,16 @@ def save_engagement(p: Path, data: dict):
     storage.save(p, data)
 
 
+def get_work(data: dict) -> dict:
+    """Return the engagement's work section, creating it if missing."""
+    return data.setdefault("work", {})
+
+
+def get_findings(data: dict) -> list[dict]:
+    """Return the engagement's findings list (stored in place), creating it if missing."""
+    return get_work(data).setdefault("findings", [])
+
+
 def safe_input(prompt: str) -> str:
     try:
         return input(prompt)
@@ -174,24 +191,32 @@ PHASES = [
     ("Reporting", "Convert technical results into risk + remediation. This is what clients pay for."),
 ]
 
+PHASE_NAMES = [name for name, _ in PHASES]
+PHASE_WHY = dict(PHASES)
+PHASE_STATUSES = ["not_started", "in_progress", "complete"]
+
 
 def default_phase_state():
     return {name: {"status": "not_started", "updated_utc": None, "notes": []} for name, _ in PHASES}
 
 
 def phase_coaching_text(phase_name: str) -> str:
-    for name, why in PHASES:
-        if name == phase_name:
-            return why
-    return ""
+    return PHASE_WHY.get(phase_name, "")
 
 
-def get_phase_state(data: dict) -> dict:
+def get_phase_state(data: dict) -> tuple[dict, bool]:
+    """
+    Return (phases, mutated), filling in any missing phases with defaults.
+    mutated is True when defaults were inserted, i.e. the data needs saving.
+    """
     meth = data.setdefault("methodology", {})
-    phases = meth.setdefault("phases", default_phase_state())
+    mutated = "phases" not in meth
+    phases = meth.setdefault("phases", {})
     for name, _why in PHASES:
-        phases.setdefault(name, {"status": "not_started", "updated_utc": None, "notes": []})
-    return phases
+        if name not in phases:
+            phases[name] = {"status": "not_started", "updated_utc": None, "notes": []}
+            mutated = True
+    return phases, mutated
 
 
 # --------------------------
@@ -237,44 +262,65 @@ LIKELIHOOD_GUIDE = {
 }
 
 
+# (impact, likelihood) -> severity
+SEVERITY_MATRIX = {
+    ("Critical", "High"): "Critical",
+    ("Critical", "Medium"): "Critical",
+    ("Critical", "Low"): "High",
+    ("High", "High"): "Critical",
+    ("High", "Medium"): "High",
+    ("High", "Low"): "Medium",
+    ("Medium", "High"): "High",
+    ("Medium", "Medium"): "Medium",
+    ("Medium", "Low"): "Low",
+    ("Low", "High"): "Low",
+    ("Low", "Medium"): "Low",
+    ("Low", "Low"): "Low",
+    ("Informational", "High"): "Informational",
+    ("Informational", "Medium"): "Informational",
+    ("Informational", "Low"): "Informational",
+}
+
+REMEDIATION_PRIORITY = {
+    "Critical": "Immediate (0–7 days)",
+    "High": "High (7–30 days)",
+    "Medium": "Planned (30–90 days)",
+    "Low": "Backlog (90+ days)",
+    "Informational": "As appropriate",
+}
+
+
 def severity_from(impact: str, likelihood: str) -> str:
-    if impact == "Informational":
-        return "Informational"
-    if impact == "Critical":
-        return "Critical" if likelihood in ("High", "Medium") else "High"
-    if impact == "High":
-        return "Critical" if likelihood == "High" else "High" if likelihood == "Medium" else "Medium"
-    if impact == "Medium":
-        return "High" if likelihood == "High" else "Medium" if likelihood == "Medium" else "Low"
-    if impact == "Low":
-        return "Low"
-    return "Medium"
+    return SEVERITY_MATRIX.get((impact, likelihood), "Medium")
 
 
 def remediation_priority(severity: str) -> str:
-    return {
-        "Critical": "Immediate (0–7 days)",
-        "High": "High (7–30 days)",
-        "Medium": "Planned (30–90 days)",
-        "Low": "Backlog (90+ days)",
-        "Informational": "As appropriate",
-    }.get(severity, "Planned (30–90 days)")
+    return REMEDIATION_PRIORITY.get(severity, "Planned (30–90 days)")
+
+
+def _coaching_text(heading: str, guide: dict) -> str:
+    out = [heading]
+    for k, bullets in guide.items():
+        out.append(f"  {k}:")
+        out.extend(f"    - {b}" for b in bullets)
+    return "\n".join(out)
+
+
+# The guides are static, so render the coaching blocks once
+IMPACT_COACHING = _coaching_text(
+    "\nImpact coaching (what would happen to the client if abused):", IMPACT_GUIDE
+)
+LIKELIHOOD_COACHING = _coaching_text(
+    "\nLikelihood coaching (how realistic exploitation is):", LIKELIHOOD_GUIDE
+)
 
 
 def print_impact_coaching():
-    print("\nImpact coaching (what would happen to the client if abused):")
-    for k, bullets in IMPACT_GUIDE.items():
-        print(f"  {k}:")
-        for b in bullets:
-            print(f"    - {b}")
+    print(IMPACT_COACHING)
 
 
 def print_likelihood_coaching():
-    print("\nLikelihood coaching (how realistic exploitation is):")
-    for k, bullets in LIKELIHOOD_GUIDE.items():
-        print(f"  {k}:")
-        for b in bullets:
-            print(f"    - {b}")
+    print(LIKELIHOOD_COACHING)
 
 
 # --------------------------
@@ -295,49 +341,93 @@ PHASE_WORDS = {p[0].lower() for p in PHASES} | {
 }
 
 
+def _alternation(words) -> re.Pattern:
+    # Longest first so overlapping keywords prefer the more specific match
+    return re.compile("|".join(map(re.escape, sorted(words, key=len, reverse=True))))
+
+
+_BANNED_KW_RE = _alternation(BANNED_TITLE_KEYWORDS)
+_WIZARD_RE = _alternation(WIZARD_MARKERS)
+_PHASE_RE = _alternation(PHASE_WORDS)
+_WIZARD_WORDS = frozenset(WIZARD_MARKERS)
+_PHASE_WORDS = frozenset(PHASE_WORDS)
+# Catch variations: bhd-cli init, ./bhd-cli init, python3 bhd.py init, with any whitespace
+_INIT_EVIDENCE_RE = re.compile(
+    rf"(?:\./)?\s*{re.escape(CLI_NAME)}\s+init|python3\s+bhd\.py\s+init", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=None)
+def _keyword_automaton(words: frozenset):
+    """
+    Aho-Corasick automaton matching any of words in one pass over the text.
+    Returns None when pyahocorasick is not installed (regex fallback is used).
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for w in words:
+        automaton.add_word(w, w)
+    automaton.make_automaton()
+    return automaton
+
+
 def looks_like_wizard_output(s: str) -> bool:
-    s2 = s.strip().lower()
-    return any(m in s2 for m in WIZARD_MARKERS)
+    s2 = s.lower()
+    automaton = _keyword_automaton(_WIZARD_WORDS)
+    if automaton is not None:
+        return next(automaton.iter(s2), None) is not None
+    return _WIZARD_RE.search(s2) is not None
 
 
 def looks_like_phase_dump(s: str) -> bool:
-    s2 = s.strip().lower()
-    hits = 0
-    for w in PHASE_WORDS:
-        if w in s2:
-            hits += 1
+    s2 = s.lower()
+    automaton = _keyword_automaton(_PHASE_WORDS)
+    if automaton is not None:
+        hits = len({w for _end, w in automaton.iter(s2)})
+    else:
+        hits = len(set(_PHASE_RE.findall(s2)))
     return hits >= 3  # if they paste multiple phase names, it's probably a dump
 
 
+# Validation runs once per interactively entered finding and its scans are already
+# C-level (compiled regexes / Aho-Corasick). Compiling this with Cython is only
+# worth revisiting if a bulk finding import path is added.
 def validate_finding_fields(title: str, description: str, evidence: str, business_impact: str, recommendation: str) -> list[str]:
     errors = []
 
-    t = title.strip().lower()
-    if not title.strip() or len(title.strip()) < 6:
+    title = title.strip()
+    description = description.strip()
+    evidence = evidence.strip()
+    business_impact = business_impact.strip()
+    recommendation = recommendation.strip()
+
+    t = title.lower()
+    if len(title) < 6:
         errors.append("Title is too short. Make it specific (e.g., 'UPnP Enabled on Router').")
-    if t in BANNED_TITLES or any(k in t for k in BANNED_TITLE_KEYWORDS):
+    if t in BANNED_TITLES or _BANNED_KW_RE.search(t):
         errors.append("Title looks like a placeholder/process note. Findings must describe a security issue, not workflow status.")
 
-    if not description.strip() or len(description.strip()) < 20:
+    if len(description) < 20:
         errors.append("Description is too short. Describe the actual security condition and where it occurs.")
     if looks_like_phase_dump(description) or looks_like_wizard_output(description):
         errors.append("Description looks like phase/wizard output. Put the security issue, not the tool prompts.")
 
-    if not evidence.strip() or len(evidence.strip()) < 10:
+    if len(evidence) < 10:
         errors.append("Evidence is too short. Record what you observed (ports, settings, URLs, screenshots note).")
     if looks_like_wizard_output(evidence):
         errors.append("Evidence looks like wizard output. Evidence should be observations/results, not 'I ran init'.")
-    # Catch variations: bhd-cli init, ./bhd-cli init, python3 bhd.py init, with any whitespace
-    init_pattern = rf"(?:\./)?\s*{re.escape(CLI_NAME)}\s+init|python3\s+bhd\.py\s+init"
-    if re.search(init_pattern, evidence.lower(), re.IGNORECASE):
+    if _INIT_EVIDENCE_RE.search(evidence):
         errors.append("Evidence is 'init'. Replace with actual evidence (e.g., router setting screenshot note, scan results summary).")
 
-    if not business_impact.strip() or len(business_impact.strip()) < 20:
+    if len(business_impact) < 20:
         errors.append("Business Impact is too short. Explain impact in plain English (1–3 sentences).")
     if looks_like_wizard_output(business_impact):
         errors.append("Business Impact looks like tool output. Business Impact should be plain English risk to the client.")
 
-    if not recommendation.strip() or len(recommendation.strip()) < 15:
+    if len(recommendation) < 15:
         errors.append("Recommendation is too short. Provide an actionable fix (disable X, update Y, change config Z).")
     if looks_like_wizard_output(recommendation):
         errors.append("Recommendation looks like tool output. Recommendation should be how to fix the issue.")
@@ -353,9 +443,20 @@ def clear_auto_findings(data: dict):
     Remove any auto-generated findings (e.g., home-audit wizard) so re-running the wizard
     produces a clean, current snapshot instead of duplicating old results.
     """
-    work = data.setdefault("work", {})
-    findings = work.setdefault("findings", [])
-    work["findings"] = [f for f in findings if not f.get("auto_generated")]
+    work = get_work(data)
+    work["findings"] = [f for f in get_findings(data) if not f.get("auto_generated")]
+
+
+def finding_number(fid: str) -> int | None:
+    """
+    Numeric part of a finding ID (F-023 -> 23), or None if malformed.
+    Plain string checks; this runs once per finding on every list/sort.
+    """
+    if fid.startswith("F-"):
+        digits = fid[2:]
+        if digits.isdecimal():
+            return int(digits)
+    return None
 
 
 def next_finding_id(findings: list[dict]) -> str:
@@ -365,9 +466,9 @@ def next_finding_id(findings: list[dict]) -> str:
     """
     max_num = 0
     for f in findings:
-        m = re.match(r"F-(\d+)$", str(f.get("id", "")))
-        if m:
-            max_num = max(max_num, int(m.group(1)))
+        num = finding_number(str(f.get("id", "")))
+        if num is not None and num > max_num:
+            max_num = num
     return f"F-{max_num + 1:03d}"
 
 
@@ -376,9 +477,27 @@ def finding_sort_key(f: dict) -> float:
     Extract numeric ID from finding for sorting (F-001 -> 1, F-023 -> 23).
     Returns float("inf") for malformed IDs (sorts them last).
     """
-    fid = f.get("id", "")
-    m = re.match(r"^F-(\d+)$", fid)
-    return int(m.group(1)) if m else float("inf")
+    num = finding_number(f.get("id", ""))
+    return float("inf") if num is None else num
+
+
+def insert_finding(findings: list[dict], finding: dict):
+    """
+    Insert a finding in ID order. New IDs are max+1, so this appends in
+    practice but keeps malformed (hand-edited) IDs at the end.
+    """
+    bisect.insort(findings, finding, key=finding_sort_key)
+
+
+def _index_findings(findings: list[dict]) -> dict:
+    """
+    Map finding ID -> list index. The first occurrence wins if IDs are duplicated,
+    matching the previous linear-scan lookup.
+    """
+    index = {}
+    for i, f in enumerate(findings):
+        index.setdefault(f.get("id"), i)
+    return index
 
 
 # --------------------------
@@ -386,25 +505,25 @@ def finding_sort_key(f: dict) -> float:
 # --------------------------
 def cmd_engagements_list(_args):
     ensure_dirs()
-    eng_dirs = [d for d in ENG_DIR.iterdir() if d.is_dir()]
+    # scandir exposes the dirent type, so is_dir() needs no extra stat per entry
+    with os.scandir(ENG_DIR) as it:
+        eng_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
 
     if not eng_dirs:
         print(f"No engagements yet. Run: {CLI_NAME} init")
         return
 
-    current = ""
-    if CURRENT_FILE.exists():
+    try:
         current = CURRENT_FILE.read_text().strip()
-
-    # Sort by folder name for deterministic output
-    eng_dirs = sorted(eng_dirs, key=lambda d: d.name)
+    except FileNotFoundError:
+        current = ""
 
     print("=== Engagements ===")
     for eng_dir in eng_dirs:
         marker = " ← CURRENT" if eng_dir.name == current else ""
-        data = load_engagement(eng_dir)
+        data = load_engagement(Path(eng_dir.path))
         meta = data.get("meta", {})
-        findings_count = len(data.get("work", {}).get("findings", []))
+        findings_count = len(get_findings(data))
         print(f"\n{eng_dir.name}{marker}")
         print(f"  Client: {meta.get('client', 'N/A')}")
         print(f"  Project: {meta.get('project', 'N/A')}")
@@ -420,9 +539,10 @@ def cmd_engagements_switch(args):
     if not eng_path.exists():
         print(f"Engagement not found: {eng_name}", file=sys.stderr)
         print("\nAvailable engagements:")
-        for eng_dir in sorted(ENG_DIR.iterdir()):
-            if eng_dir.is_dir():
-                print(f"  - {eng_dir.name}")
+        with os.scandir(ENG_DIR) as it:
+            names = sorted(e.name for e in it if e.is_dir())
+        for name in names:
+            print(f"  - {name}")
         sys.exit(1)
 
     CURRENT_FILE.write_text(eng_name)
@@ -453,7 +573,7 @@ def cmd_init(_args):
 
     rules = safe_input("Rules of engagement notes (e.g., no DoS, time windows): ").strip()
 
-    engagement_name = f"{slugify(client)}-{slugify(project)}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    engagement_name = f"{slugify(client)}-{slugify(project)}-{time.strftime('%Y%m%d-%H%M%S')}"
     folder = ENG_DIR / engagement_name
     folder.mkdir(parents=True, exist_ok=True)
 
@@ -492,25 +612,28 @@ def cmd_show(_args):
     data = load_engagement(p)
     meta = data.get("meta", {})
     scope = data.get("scope", {})
-    work = data.get("work", {})
-
-    print("=== Current Engagement ===")
-    print(f"Folder: {p.name}")
-    print(f"Client: {meta.get('client','')}")
-    print(f"Project: {meta.get('project','')}")
-    print(f"Type: {meta.get('test_type','')}")
-    print(f"Created: {meta.get('created_utc','')}")
-    print("\n--- Scope ---")
+    work = get_work(data)
+
+    out = [
+        "=== Current Engagement ===",
+        f"Folder: {p.name}",
+        f"Client: {meta.get('client','')}",
+        f"Project: {meta.get('project','')}",
+        f"Type: {meta.get('test_type','')}",
+        f"Created: {meta.get('created_utc','')}",
+        "\n--- Scope ---",
+    ]
     for t in scope.get("in_scope", []):
-        print(f"  IN:  {t}")
+        out.append(f"  IN:  {t}")
     if scope.get("out_of_scope"):
-        print(f"  OUT: {scope.get('out_of_scope')}")
+        out.append(f"  OUT: {scope.get('out_of_scope')}")
     if scope.get("rules_of_engagement"):
-        print(f"\nROE: {scope.get('rules_of_engagement')}")
+        out.append(f"\nROE: {scope.get('rules_of_engagement')}")
 
-    print("\n--- Work ---")
-    print(f"Notes: {len(work.get('notes', []))}")
-    print(f"Findings: {len(work.get('findings', []))}")
+    out.append("\n--- Work ---")
+    out.append(f"Notes: {len(work.get('notes', []))}")
+    out.append(f"Findings: {len(work.get('findings', []))}")
+    print("\n".join(out))
 
 
 def cmd_add_target(args):
@@ -541,8 +664,7 @@ def cmd_note(args):
         print("Empty note.", file=sys.stderr)
         sys.exit(1)
 
-    work = data.setdefault("work", {})
-    notes = work.setdefault("notes", [])
+    notes = get_work(data).setdefault("notes", [])
     notes.append({"ts_utc": now_iso(), "text": note_text})
     save_engagement(p, data)
     print("Note saved.")
@@ -554,31 +676,28 @@ def cmd_note(args):
 def cmd_phase_status(_args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    phases = get_phase_state(data)
+    phases, mutated = get_phase_state(data)
 
-    print("=== Phase Status ===")
+    out = ["=== Phase Status ==="]
     for name, why in PHASES:
-        st = phases.get(name, {}).get("status", "not_started")
-        upd = phases.get(name, {}).get("updated_utc") or "-"
-        print(f"- {name}: {st} (updated {upd})")
-        print(f"  Why it matters: {why}")
-    save_engagement(p, data)
+        entry = phases.get(name) or {}
+        st = entry.get("status", "not_started")
+        upd = entry.get("updated_utc") or "-"
+        out.append(f"- {name}: {st} (updated {upd})")
+        out.append(f"  Why it matters: {why}")
+    print("\n".join(out))
+    if mutated:
+        save_engagement(p, data)
 
 
 def cmd_phase_set(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    phases = get_phase_state(data)
+    phases, _ = get_phase_state(data)
 
+    # phase and status are restricted by argparse choices
     phase_name = args.phase
-    if phase_name not in phases:
-        print(f"Unknown phase. Use: {CLI_NAME} phase status", file=sys.stderr)
-        sys.exit(1)
-
     new_status = args.status
-    if new_status not in ("not_started", "in_progress", "complete"):
-        print("Status must be: not_started | in_progress | complete", file=sys.stderr)
-        sys.exit(1)
 
     phases[phase_name]["status"] = new_status
     phases[phase_name]["updated_utc"] = now_iso()
@@ -591,13 +710,9 @@ def cmd_phase_set(args):
 def cmd_phase_note(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    phases = get_phase_state(data)
+    phases, _ = get_phase_state(data)
 
     phase_name = args.phase
-    if phase_name not in phases:
-        print(f"Unknown phase. Use: {CLI_NAME} phase status", file=sys.stderr)
-        sys.exit(1)
-
     text = args.text.strip()
     if not text:
         print("Empty phase note.", file=sys.stderr)
@@ -648,7 +763,7 @@ def cmd_finding_add(_args):
             print("\nTry again. (This is your training loop.)\n")
             continue
 
-        findings = data.setdefault("work", {}).setdefault("findings", [])
+        findings = get_findings(data)
         finding = {
             "id": next_finding_id(findings),
             "ts_utc": now_iso(),
@@ -664,7 +779,7 @@ def cmd_finding_add(_args):
             "recommendation": recommendation,
             "status": "open",
         }
-        findings.append(finding)
+        insert_finding(findings, finding)
         save_engagement(p, data)
         print(f"\nFinding saved: {finding['id']} — {finding['title']}")
         break
@@ -673,7 +788,7 @@ def cmd_finding_add(_args):
 def cmd_finding_list(_args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    findings = data.get("work", {}).get("findings", [])
+    findings = get_findings(data)
 
     if not findings:
         print("No findings yet.")
@@ -681,29 +796,24 @@ def cmd_finding_list(_args):
 
     findings_sorted = sorted(findings, key=finding_sort_key)
 
-    print("=== Findings ===")
+    out = ["=== Findings ==="]
     for f in findings_sorted:
         status = f.get('status', 'open')
-        print(f"- {f.get('id')} [{f.get('severity')}] ({status}) {f.get('title')} — {f.get('affected_target')}")
+        out.append(f"- {f.get('id')} [{f.get('severity')}] ({status}) {f.get('title')} — {f.get('affected_target')}")
+    print("\n".join(out))
 
 
 def cmd_finding_edit(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    findings = data.get("work", {}).get("findings", [])
+    findings = get_findings(data)
 
     finding_id = args.id
-    found = None
-    found_idx = None
-    for i, f in enumerate(findings):
-        if f.get("id") == finding_id:
-            found = f
-            found_idx = i
-            break
-
-    if not found:
+    found_idx = _index_findings(findings).get(finding_id)
+    if found_idx is None:
         print(f"Finding {finding_id} not found.", file=sys.stderr)
         sys.exit(1)
+    found = findings[found_idx]
 
     print(f"=== Editing {finding_id} ===")
     print("Press Enter to keep current value.\n")
@@ -716,7 +826,7 @@ def cmd_finding_edit(args):
     affected = safe_input(f"Affected [{found['affected_target']}]: ").strip()
     if affected:
         # Fix IP comma issue
-        affected = affected.replace(",", ".").strip()
+        affected = affected.translate(_AFFECTED_FIX).strip()
         found['affected_target'] = affected
 
     description = safe_input(f"Description [{found['description'][:50]}...]: ").strip()
@@ -771,8 +881,6 @@ def cmd_finding_edit(args):
             print("Edit canceled.")
             return
 
-    findings[found_idx] = found
-    data["work"]["findings"] = findings
     save_engagement(p, data)
     print(f"\nUpdated finding {finding_id}")
 
@@ -780,25 +888,21 @@ def cmd_finding_edit(args):
 def cmd_finding_delete(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    findings = data.get("work", {}).get("findings", [])
+    findings = get_findings(data)
 
     finding_id = args.id
-    found = None
-    for f in findings:
-        if f.get("id") == finding_id:
-            found = f
-            break
-
-    if not found:
+    found_idx = _index_findings(findings).get(finding_id)
+    if found_idx is None:
         print(f"Finding {finding_id} not found.", file=sys.stderr)
         sys.exit(1)
+    found = findings[found_idx]
 
     print(f"About to delete: {found['id']} - {found['title']}")
     if not yes_no("Are you sure?"):
         print("Canceled.")
         return
 
-    data["work"]["findings"] = [f for f in findings if f.get("id") != finding_id]
+    del findings[found_idx]
     save_engagement(p, data)
     print(f"Deleted finding {finding_id}")
 
@@ -806,7 +910,7 @@ def cmd_finding_delete(args):
 def cmd_finding_filter(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    findings = data.get("work", {}).get("findings", [])
+    findings = get_findings(data)
 
     filtered = findings
 
@@ -826,33 +930,33 @@ def cmd_finding_filter(args):
     # Sort filtered results by ID for deterministic output
     filtered = sorted(filtered, key=finding_sort_key)
 
-    print(f"=== Findings (filtered: {len(filtered)} of {len(findings)}) ===")
+    out = [f"=== Findings (filtered: {len(filtered)} of {len(findings)}) ==="]
     for f in filtered:
         auto = " [AUTO]" if f.get("auto_generated") else ""
-        print(f"- {f.get('id')} [{f.get('severity')}] {f.get('title')}{auto}")
-        print(f"  Target: {f.get('affected_target')}")
+        out.append(f"- {f.get('id')} [{f.get('severity')}] {f.get('title')}{auto}")
+        out.append(f"  Target: {f.get('affected_target')}")
+    print("\n".join(out))
+
+
+# Finding fields covered by `finding search`, in haystack order
+SEARCH_FIELDS = (
+    "title",
+    "description",
+    "evidence",
+    "recommendation",
+    "business_impact",
+    "affected_target",
+)
 
 
 def cmd_finding_search(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    findings = data.get("work", {}).get("findings", [])
+    findings = get_findings(data)
 
     query = args.query.lower()
-    matched = []
-
-    for f in findings:
-        searchable = " ".join([
-            f.get("title", ""),
-            f.get("description", ""),
-            f.get("evidence", ""),
-            f.get("recommendation", ""),
-            f.get("business_impact", ""),
-            f.get("affected_target", ""),
-        ]).lower()
-
-        if query in searchable:
-            matched.append(f)
+    haystacks = (" ".join([f.get(k, "") for k in SEARCH_FIELDS]).lower() for f in findings)
+    matched = [f for f, hay in zip(findings, haystacks) if query in hay]
 
     if not matched:
         print(f"No findings match '{args.query}'")
@@ -872,68 +976,59 @@ def cmd_finding_search(args):
 def cmd_finding_show(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    findings = data.get("work", {}).get("findings", [])
+    findings = get_findings(data)
 
     finding_id = args.id
-    found = None
-    for f in findings:
-        if f.get("id") == finding_id:
-            found = f
-            break
-
-    if not found:
+    found_idx = _index_findings(findings).get(finding_id)
+    if found_idx is None:
         print(f"Finding {finding_id} not found.", file=sys.stderr)
         sys.exit(1)
-
-    print(f"=== {found['id']} — {found['title']} ===\n")
-    print(f"Severity: {found.get('severity', 'N/A')}")
-    print(f"Impact Level: {found.get('impact_level', 'N/A')}")
-    print(f"Likelihood: {found.get('likelihood', 'N/A')}")
-    print(f"Remediation Priority: {found.get('remediation_priority', 'N/A')}")
-    print(f"Affected Target: {found.get('affected_target', 'N/A')}")
-    print(f"Status: {found.get('status', 'open')}")
+    found = findings[found_idx]
+
+    out = [
+        f"=== {found['id']} — {found['title']} ===\n",
+        f"Severity: {found.get('severity', 'N/A')}",
+        f"Impact Level: {found.get('impact_level', 'N/A')}",
+        f"Likelihood: {found.get('likelihood', 'N/A')}",
+        f"Remediation Priority: {found.get('remediation_priority', 'N/A')}",
+        f"Affected Target: {found.get('affected_target', 'N/A')}",
+        f"Status: {found.get('status', 'open')}",
+    ]
     if found.get("auto_generated"):
-        print(f"Auto-Generated: Yes")
-    print(f"Created: {found.get('ts_utc', 'N/A')}\n")
+        out.append("Auto-Generated: Yes")
+    out.append(f"Created: {found.get('ts_utc', 'N/A')}\n")
 
-    print("Description:")
-    print(f"  {found.get('description', 'N/A')}\n")
+    out.append("Description:")
+    out.append(f"  {found.get('description', 'N/A')}\n")
 
-    print("Evidence:")
-    print(f"  {found.get('evidence', 'N/A')}\n")
+    out.append("Evidence:")
+    out.append(f"  {found.get('evidence', 'N/A')}\n")
 
-    print("Business Impact:")
-    print(f"  {found.get('business_impact', 'N/A')}\n")
+    out.append("Business Impact:")
+    out.append(f"  {found.get('business_impact', 'N/A')}\n")
 
-    print("Recommendation:")
-    print(f"  {found.get('recommendation', 'N/A')}")
+    out.append("Recommendation:")
+    out.append(f"  {found.get('recommendation', 'N/A')}")
+    print("\n".join(out))
 
 
 def cmd_finding_status(args):
     p = pick_current_engagement()
     data = load_engagement(p)
-    findings = data.get("work", {}).get("findings", [])
+    findings = get_findings(data)
 
     finding_id = args.id
     new_status = args.status
 
-    found = None
-    found_idx = None
-    for i, f in enumerate(findings):
-        if f.get("id") == finding_id:
-            found = f
-            found_idx = i
-            break
-
-    if not found:
+    found_idx = _index_findings(findings).get(finding_id)
+    if found_idx is None:
         print(f"Finding {finding_id} not found.", file=sys.stderr)
         sys.exit(1)
+    found = findings[found_idx]
 
     old_status = found.get("status", "open")
     found["status"] = new_status
 
-    findings[found_idx] = found
-    data["work"]["findings"] = findings
     save_engagement(p, data)
 
     print(f"Updated {finding_id} status: {old_status} → {new_status}")
@@ -943,13 +1038,14 @@ def cmd_finding_status(args):
 # Home Audit (auto-findings)
 # --------------------------
 def add_finding_auto(data: dict, title: str, affected: str, description: str,
-                     impact: str, likelihood: str, evidence: str, biz_impact: str, recommendation: str):
+                     impact: str, likelihood: str, evidence: str, biz_impact: str, recommendation: str,
+                     ts: str | None = None):
     sev = severity_from(impact, likelihood)
     prio = remediation_priority(sev)
-    findings = data.setdefault("work", {}).setdefault("findings", [])
+    findings = get_findings(data)
     finding = {
         "id": next_finding_id(findings),
-        "ts_utc": now_iso(),
+        "ts_utc": ts or now_iso(),
         "title": title,
         "affected_target": affected,
         "description": description,
@@ -963,10 +1059,244 @@ def add_finding_auto(data: dict, title: str, affected: str, description: str,
         "status": "open",
         "auto_generated": True,
     }
-    findings.append(finding)
+    insert_finding(findings, finding)
+
+
+HOME_WIFI_MODES = ["WPA3", "WPA2", "WPA/WPA2 mixed", "WEP", "Open/None", "Unknown"]
+HOME_DNS_FILTERS = ["None", "Router DNS filtering", "Pi-hole/AdGuard", "NextDNS", "Other/Unknown"]
+HOME_PASSWORD_STRENGTHS = ["Unique strong", "Okay but reused", "Weak/default/suspected", "Unknown"]
+
+# Answer keys for `home-audit run --answers`; values are the choices the wizard offers
+HOME_AUDIT_CHOICES = {
+    "wifi_mode": HOME_WIFI_MODES,
+    "dns_filter": HOME_DNS_FILTERS,
+    "pass_strength": HOME_PASSWORD_STRENGTHS,
+    "exposed_services": ["No", "Yes", "Unknown"],
+}
+HOME_AUDIT_FLAGS = ("wps_enabled", "upnp_enabled", "remote_admin", "guest_net", "iot_isolated", "port_fw")
+HOME_AUDIT_TEXT = ("router_make", "router_ip", "fw_ver", "device_count")
+
+
+def prompt_home_answers() -> dict:
+    """Collect home-audit answers interactively."""
+    print("=== Home Audit Wizard (auto-generates findings) ===")
+    answers = {}
+    answers["router_make"] = safe_input("Router make/model (e.g., TP-Link Archer AX55): ").strip()
+    answers["router_ip"] = safe_input("Router IP (e.g., 192.168.1.1): ").strip()
+    fw_known = yes_no("Do you know the router firmware version?")
+    answers["fw_ver"] = safe_input("Firmware version (or 'unknown'): ").strip() if fw_known else "unknown"
+
+    answers["wifi_mode"] = choose_from("Wi-Fi security mode:", HOME_WIFI_MODES)
+    answers["wps_enabled"] = yes_no("Is WPS enabled?")
+    answers["upnp_enabled"] = yes_no("Is UPnP enabled?")
+    answers["remote_admin"] = yes_no("Is remote administration enabled (manage router from the internet)?")
+    answers["guest_net"] = yes_no("Is a guest Wi-Fi network enabled?")
+    answers["iot_isolated"] = yes_no("Are IoT devices isolated/segmented from main devices (separate VLAN/SSID or client isolation)?")
+    answers["dns_filter"] = choose_from("DNS filtering in use:", HOME_DNS_FILTERS)
+    answers["pass_strength"] = choose_from("Router admin password strength:", HOME_PASSWORD_STRENGTHS)
+    answers["port_fw"] = yes_no("Any port forwards configured?")
+    answers["exposed_services"] = choose_yes_no_unknown("Any services exposed to the internet (WAN) that you know of?")
 
+    answers["device_count"] = safe_input("Approx number of devices on network (rough): ").strip()
+    return answers
 
-def cmd_home_audit_run(_args):
+
+def load_home_answers(path: Path) -> dict:
+    """
+    Load home-audit answers from a JSON file (same keys as the wizard).
+    Exits with a list of problems if the file is unreadable or incomplete.
+    """
+    try:
+        answers = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        print(f"Could not read answers file {path}: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not isinstance(answers, dict):
+        print(f"Answers file {path} must contain a JSON object.", file=sys.stderr)
+        sys.exit(1)
+
+    errors = []
+    for key, options in HOME_AUDIT_CHOICES.items():
+        if answers.get(key) not in options:
+            errors.append(f"{key}: expected one of {', '.join(options)}")
+    for key in HOME_AUDIT_FLAGS:
+        if not isinstance(answers.get(key), bool):
+            errors.append(f"{key}: expected true or false")
+    for key in HOME_AUDIT_TEXT:
+        if not isinstance(answers.get(key, ""), str):
+            errors.append(f"{key}: expected a string")
+    if errors:
+        print(f"Invalid answers file {path}:", file=sys.stderr)
+        for err in errors:
+            print(f"  - {err}", file=sys.stderr)
+        sys.exit(1)
+    return answers
+
+
+# Auto-finding rules for the home audit, checked in order against the answers.
+# String fields are str.format_map templates over the answers plus {affected}.
+HOME_AUDIT_RULES = (
+    {
+        "trigger": lambda a: a["fw_ver"].lower() in ("unknown", ""),
+        "title": "Router Firmware Version Unknown / Not Verified",
+        "affected": "{affected}",
+        "description": "Router firmware version was not confirmed during the audit, which makes it harder to assess exposure to known security issues.",
+        "impact": "Informational", "likelihood": "Medium",
+        "evidence": "Firmware version reported: {fw_ver}",
+        "biz_impact": "Unpatched firmware is a common root cause of router compromise and persistent network exposure.",
+        "recommendation": "Check firmware version in admin UI; update to latest stable release from vendor; enable auto-update if supported.",
+    },
+    {
+        "trigger": lambda a: a["wifi_mode"] in ("Open/None", "WEP"),
+        "title": "Insecure Wi-Fi Encryption Mode ({wifi_mode})",
+        "affected": "Wi-Fi Network (via {router_make})",
+        "description": "Wireless encryption is configured as {wifi_mode}, which is not considered secure.",
+        "impact": "High", "likelihood": "High",
+        "evidence": "Wi-Fi mode selected: {wifi_mode}",
+        "biz_impact": "Attackers nearby can intercept traffic, join the network, and access internal devices.",
+        "recommendation": "Switch to WPA3 (preferred) or WPA2-AES; disable legacy modes; rotate Wi-Fi password.",
+    },
+    {
+        "trigger": lambda a: a["wifi_mode"] in ("WPA/WPA2 mixed", "Unknown"),
+        "title": "Weak/Unverified Wi-Fi Security Mode ({wifi_mode})",
+        "affected": "Wi-Fi Network (via {router_make})",
+        "description": "Wi-Fi security mode is {wifi_mode}. Mixed/unknown modes can allow weaker fallback behavior.",
+        "impact": "Medium", "likelihood": "Medium",
+        "evidence": "Wi-Fi mode selected: {wifi_mode}",
+        "biz_impact": "Increases risk of downgrade/legacy compatibility weaknesses and unauthorized access attempts.",
+        "recommendation": "Set Wi-Fi to WPA3 if available; otherwise WPA2-AES only; disable legacy compatibility options.",
+    },
+    {
+        "trigger": lambda a: a["wps_enabled"],
+        "title": "WPS Enabled",
+        "affected": "{affected}",
+        "description": "Wi-Fi Protected Setup (WPS) is enabled. WPS can increase the risk of unauthorized Wi-Fi access depending on router behavior and configuration.",
+        "impact": "Medium", "likelihood": "Medium",
+        "evidence": "WPS reported enabled",
+        "biz_impact": "Increases chance of unauthorized access to the wireless network, which can lead to internal device compromise.",
+        "recommendation": "Disable WPS; rely on strong WPA2/WPA3 passphrase; rotate Wi-Fi password after change.",
+    },
+    {
+        "trigger": lambda a: a["upnp_enabled"],
+        "title": "UPnP Enabled on Router",
+        "affected": "{affected}",
+        "description": "UPnP is enabled. UPnP allows devices to request port mappings automatically, which can unintentionally expose internal services to the internet.",
+        "impact": "Medium", "likelihood": "Medium",
+        "evidence": "UPnP reported enabled",
+        "biz_impact": "Increases risk of internal devices being exposed externally without explicit review, enabling remote compromise pathways.",
+        "recommendation": "Disable UPnP; create explicit port forwards only when necessary; periodically review WAN exposure.",
+    },
+    {
+        "trigger": lambda a: a["remote_admin"],
+        "title": "Remote Administration Enabled",
+        "affected": "{affected}",
+        "description": "Remote administration is enabled, allowing router management from the internet. This increases exposure to credential attacks and router CVEs.",
+        "impact": "High", "likelihood": "Medium",
+        "evidence": "Remote admin reported enabled",
+        "biz_impact": "Attackers can target the router login remotely; compromise can grant persistent control of the home network.",
+        "recommendation": "Disable remote admin; if required, restrict to VPN-only access; enforce strong unique admin password and MFA if supported.",
+    },
+    {
+        "trigger": lambda a: a["pass_strength"] == "Weak/default/suspected",
+        "title": "Router Admin Credential Risk ({pass_strength})",
+        "affected": "{affected}",
+        "description": "Router admin password was assessed as '{pass_strength}'. Weak, reused, or unverified admin credentials increase compromise risk.",
+        "impact": "High", "likelihood": "High",
+        "evidence": "Password strength selected: {pass_strength}",
+        "biz_impact": "Compromised router credentials can lead to DNS hijacking, traffic interception, and persistent access to the network.",
+        "recommendation": "Set a unique strong admin password (password manager); enable MFA if available; disable admin access from Wi-Fi guest networks.",
+    },
+    {
+        "trigger": lambda a: a["pass_strength"] in ("Okay but reused", "Unknown"),
+        "title": "Router Admin Credential Risk ({pass_strength})",
+        "affected": "{affected}",
+        "description": "Router admin password was assessed as '{pass_strength}'. Weak, reused, or unverified admin credentials increase compromise risk.",
+        "impact": "Medium", "likelihood": "Medium",
+        "evidence": "Password strength selected: {pass_strength}",
+        "biz_impact": "Compromised router credentials can lead to DNS hijacking, traffic interception, and persistent access to the network.",
+        "recommendation": "Set a unique strong admin password (password manager); enable MFA if available; disable admin access from Wi-Fi guest networks.",
+    },
+    {
+        "trigger": lambda a: not a["guest_net"],
+        "title": "Guest Network Not Enabled",
+        "affected": "Wi-Fi Network (via {router_make})",
+        "description": "Guest Wi-Fi is not enabled. Without a guest network, visitors often share the main network, increasing exposure of personal devices and IoT assets.",
+        "impact": "Low", "likelihood": "Medium",
+        "evidence": "Guest network reported disabled",
+        "biz_impact": "Visitors’ devices may introduce malware or insecure services into the same network as sensitive devices.",
+        "recommendation": "Enable guest Wi-Fi; isolate guests from LAN; use strong password; rotate periodically.",
+    },
+    {
+        "trigger": lambda a: not a["iot_isolated"],
+        "title": "IoT Devices Not Segmented/Isolated",
+        "affected": "Home Network",
+        "description": "IoT devices are not isolated from main devices. IoT devices commonly have weaker security and can become pivot points.",
+        "impact": "Medium", "likelihood": "Medium",
+        "evidence": "IoT isolation reported: No",
+        "biz_impact": "Compromise of one IoT device can enable lateral movement to personal computers, NAS devices, and phones.",
+        "recommendation": "Create separate IoT SSID/VLAN; block IoT → LAN by default; allow only required outbound access.",
+    },
+    {
+        "trigger": lambda a: a["dns_filter"] == "None",
+        "title": "No DNS Filtering / Blocking in Place",
+        "affected": "Home Network",
+        "description": "No DNS filtering is configured. DNS filtering can reduce exposure to known malicious domains and phishing infrastructure.",
+        "impact": "Low", "likelihood": "Medium",
+        "evidence": "DNS filtering selected: None",
+        "biz_impact": "Increases likelihood of successful phishing/malware callbacks and ad/tracker exposure.",
+        "recommendation": "Consider NextDNS / Pi-hole / router DNS filtering; enable blocklists; enforce on all clients where possible.",
+    },
+    {
+        "trigger": lambda a: a["port_fw"],
+        "title": "Port Forwards Present (Review Needed)",
+        "affected": "{affected}",
+        "description": "Port forwards are configured. Port forwards can expose internal services externally and should be reviewed for necessity and secure configuration.",
+        "impact": "Medium", "likelihood": "Medium",
+        "evidence": "Port forwards reported: Yes",
+        "biz_impact": "Exposed internal services increase the likelihood of remote compromise if services are unpatched or weakly authenticated.",
+        "recommendation": "List current port forwards; remove unused; restrict source IPs if possible; prefer VPN for remote access.",
+    },
+    {
+        "trigger": lambda a: a["exposed_services"] == "Yes",
+        "title": "Known Services Exposed to Internet (WAN)",
+        "affected": "Home Network Perimeter",
+        "description": "One or more services are known to be exposed to the internet. Any exposed service should be assessed for patching, authentication, and necessity.",
+        "impact": "High", "likelihood": "Medium",
+        "evidence": "WAN exposure reported: Yes",
+        "biz_impact": "Internet-exposed services are frequently targeted and can lead to full network compromise if vulnerable.",
+        "recommendation": "Minimize exposure; keep services patched; enforce strong auth; consider VPN-only access; monitor logs.",
+    },
+    {
+        "trigger": lambda a: a["exposed_services"] == "Unknown",
+        "title": "Internet Exposure Not Verified",
+        "affected": "Home Network Perimeter",
+        "description": "External (WAN) exposure was not verified during the audit. Verifying WAN exposure reduces blind spots.",
+        "impact": "Informational", "likelihood": "Medium",
+        "evidence": "WAN exposure reported: Unknown",
+        "biz_impact": "Unverified exposure can hide unnecessary open services that attackers routinely scan for.",
+        "recommendation": "Perform an external exposure review (ISP modem/router, port forwards, UPnP); document any exposed ports/services.",
+    },
+)
+
+
+def add_home_findings(data: dict, answers: dict, ts: str):
+    """Add the auto-generated findings implied by a set of home-audit answers."""
+    ctx = dict(answers)
+    ctx["router_make"] = answers.get("router_make", "").strip()
+    ctx["router_ip"] = answers.get("router_ip", "").strip()
+    ctx["fw_ver"] = answers.get("fw_ver", "").strip() or "unknown"
+    ctx["affected"] = f"Home Router {ctx['router_make']} ({ctx['router_ip']})"
+
+    for rule in HOME_AUDIT_RULES:
+        if rule["trigger"](ctx):
+            add_finding_auto(
+                data,
+                **{k: v.format_map(ctx) for k, v in rule.items() if k != "trigger"},
+                ts=ts,
+            )
+
+
+def cmd_home_audit_run(args):
     p = pick_current_engagement()
     data = load_engagement(p)
 
@@ -979,211 +1309,34 @@ def cmd_home_audit_run(_args):
     if test_type != "home":
         print("WARNING: This engagement test_type is not 'home'. Home audit can still run, but check your scope/ROE.\n")
 
-    print("=== Home Audit Wizard (auto-generates findings) ===")
-    router_make = safe_input("Router make/model (e.g., TP-Link Archer AX55): ").strip()
-    router_ip = safe_input("Router IP (e.g., 192.168.1.1): ").strip()
-    fw_known = yes_no("Do you know the router firmware version?")
-    fw_ver = safe_input("Firmware version (or 'unknown'): ").strip() if fw_known else "unknown"
-    if not fw_ver.strip():
-        fw_ver = "unknown"
-
-    wifi_mode = choose_from("Wi-Fi security mode:", ["WPA3", "WPA2", "WPA/WPA2 mixed", "WEP", "Open/None", "Unknown"])
-    wps_enabled = yes_no("Is WPS enabled?")
-    upnp_enabled = yes_no("Is UPnP enabled?")
-    remote_admin = yes_no("Is remote administration enabled (manage router from the internet)?")
-    guest_net = yes_no("Is a guest Wi-Fi network enabled?")
-    iot_isolated = yes_no("Are IoT devices isolated/segmented from main devices (separate VLAN/SSID or client isolation)?")
-    dns_filter = choose_from("DNS filtering in use:", ["None", "Router DNS filtering", "Pi-hole/AdGuard", "NextDNS", "Other/Unknown"])
-    pass_strength = choose_from("Router admin password strength:", ["Unique strong", "Okay but reused", "Weak/default/suspected", "Unknown"])
-    port_fw = yes_no("Any port forwards configured?")
-    exposed_services = choose_yes_no_unknown("Any services exposed to the internet (WAN) that you know of?")
-
-    device_count = safe_input("Approx number of devices on network (rough): ").strip() or "unknown"
-
-    affected = f"Home Router {router_make} ({router_ip})"
-
-    # Firmware unknown
-    if fw_ver.strip().lower() in ("unknown", ""):
-        add_finding_auto(
-            data,
-            "Router Firmware Version Unknown / Not Verified",
-            affected,
-            "Router firmware version was not confirmed during the audit, which makes it harder to assess exposure to known security issues.",
-            "Informational", "Medium",
-            f"Firmware version reported: {fw_ver}",
-            "Unpatched firmware is a common root cause of router compromise and persistent network exposure.",
-            "Check firmware version in admin UI; update to latest stable release from vendor; enable auto-update if supported."
-        )
-
-    # Wi-Fi mode
-    if wifi_mode in ("Open/None", "WEP"):
-        add_finding_auto(
-            data,
-            f"Insecure Wi-Fi Encryption Mode ({wifi_mode})",
-            f"Wi-Fi Network (via {router_make})",
-            f"Wireless encryption is configured as {wifi_mode}, which is not considered secure.",
-            "High", "High",
-            f"Wi-Fi mode selected: {wifi_mode}",
-            "Attackers nearby can intercept traffic, join the network, and access internal devices.",
-            "Switch to WPA3 (preferred) or WPA2-AES; disable legacy modes; rotate Wi-Fi password."
-        )
-    elif wifi_mode in ("WPA/WPA2 mixed", "Unknown"):
-        add_finding_auto(
-            data,
-            f"Weak/Unverified Wi-Fi Security Mode ({wifi_mode})",
-            f"Wi-Fi Network (via {router_make})",
-            f"Wi-Fi security mode is {wifi_mode}. Mixed/unknown modes can allow weaker fallback behavior.",
-            "Medium", "Medium",
-            f"Wi-Fi mode selected: {wifi_mode}",
-            "Increases risk of downgrade/legacy compatibility weaknesses and unauthorized access attempts.",
-            "Set Wi-Fi to WPA3 if available; otherwise WPA2-AES only; disable legacy compatibility options."
-        )
-
-    # WPS
-    if wps_enabled:
-        add_finding_auto(
-            data,
-            "WPS Enabled",
-            affected,
-            "Wi-Fi Protected Setup (WPS) is enabled. WPS can increase the risk of unauthorized Wi-Fi access depending on router behavior and configuration.",
-            "Medium", "Medium",
-            "WPS reported enabled",
-            "Increases chance of unauthorized access to the wireless network, which can lead to internal device compromise.",
-            "Disable WPS; rely on strong WPA2/WPA3 passphrase; rotate Wi-Fi password after change."
-        )
-
-    # UPnP
-    if upnp_enabled:
-        add_finding_auto(
-            data,
-            "UPnP Enabled on Router",
-            affected,
-            "UPnP is enabled. UPnP allows devices to request port mappings automatically, which can unintentionally expose internal services to the internet.",
-            "Medium", "Medium",
-            "UPnP reported enabled",
-            "Increases risk of internal devices being exposed externally without explicit review, enabling remote compromise pathways.",
-            "Disable UPnP; create explicit port forwards only when necessary; periodically review WAN exposure."
-        )
-
-    # Remote admin
-    if remote_admin:
-        add_finding_auto(
-            data,
-            "Remote Administration Enabled",
-            affected,
-            "Remote administration is enabled, allowing router management from the internet. This increases exposure to credential attacks and router CVEs.",
-            "High", "Medium",
-            "Remote admin reported enabled",
-            "Attackers can target the router login remotely; compromise can grant persistent control of the home network.",
-            "Disable remote admin; if required, restrict to VPN-only access; enforce strong unique admin password and MFA if supported."
-        )
-
-    # Admin password strength
-    if pass_strength in ("Weak/default/suspected", "Okay but reused", "Unknown"):
-        imp = "High" if pass_strength == "Weak/default/suspected" else "Medium"
-        lik = "High" if pass_strength == "Weak/default/suspected" else "Medium"
-        add_finding_auto(
-            data,
-            f"Router Admin Credential Risk ({pass_strength})",
-            affected,
-            f"Router admin password was assessed as '{pass_strength}'. Weak, reused, or unverified admin credentials increase compromise risk.",
-            imp, lik,
-            f"Password strength selected: {pass_strength}",
-            "Compromised router credentials can lead to DNS hijacking, traffic interception, and persistent access to the network.",
-            "Set a unique strong admin password (password manager); enable MFA if available; disable admin access from Wi-Fi guest networks."
-        )
-
-    # Guest network missing
-    if not guest_net:
-        add_finding_auto(
-            data,
-            "Guest Network Not Enabled",
-            f"Wi-Fi Network (via {router_make})",
-            "Guest Wi-Fi is not enabled. Without a guest network, visitors often share the main network, increasing exposure of personal devices and IoT assets.",
-            "Low", "Medium",
-            "Guest network reported disabled",
-            "Visitors’ devices may introduce malware or insecure services into the same network as sensitive devices.",
-            "Enable guest Wi-Fi; isolate guests from LAN; use strong password; rotate periodically."
-        )
-
-    # IoT segmentation
-    if not iot_isolated:
-        add_finding_auto(
-            data,
-            "IoT Devices Not Segmented/Isolated",
-            "Home Network",
-            "IoT devices are not isolated from main devices. IoT devices commonly have weaker security and can become pivot points.",
-            "Medium", "Medium",
-            "IoT isolation reported: No",
-            "Compromise of one IoT device can enable lateral movement to personal computers, NAS devices, and phones.",
-            "Create separate IoT SSID/VLAN; block IoT → LAN by default; allow only required outbound access."
-        )
-
-    # DNS filtering
-    if dns_filter == "None":
-        add_finding_auto(
-            data,
-            "No DNS Filtering / Blocking in Place",
-            "Home Network",
-            "No DNS filtering is configured. DNS filtering can reduce exposure to known malicious domains and phishing infrastructure.",
-            "Low", "Medium",
-            "DNS filtering selected: None",
-            "Increases likelihood of successful phishing/malware callbacks and ad/tracker exposure.",
-            "Consider NextDNS / Pi-hole / router DNS filtering; enable blocklists; enforce on all clients where possible."
-        )
-
-    # Port forwards / WAN exposure
-    if port_fw:
-        add_finding_auto(
-            data,
-            "Port Forwards Present (Review Needed)",
-            affected,
-            "Port forwards are configured. Port forwards can expose internal services externally and should be reviewed for necessity and secure configuration.",
-            "Medium", "Medium",
-            "Port forwards reported: Yes",
-            "Exposed internal services increase the likelihood of remote compromise if services are unpatched or weakly authenticated.",
-            "List current port forwards; remove unused; restrict source IPs if possible; prefer VPN for remote access."
-        )
-
-    if exposed_services == "Yes":
-        add_finding_auto(
-            data,
-            "Known Services Exposed to Internet (WAN)",
-            "Home Network Perimeter",
-            "One or more services are known to be exposed to the internet. Any exposed service should be assessed for patching, authentication, and necessity.",
-            "High", "Medium",
-            "WAN exposure reported: Yes",
-            "Internet-exposed services are frequently targeted and can lead to full network compromise if vulnerable.",
-            "Minimize exposure; keep services patched; enforce strong auth; consider VPN-only access; monitor logs."
-        )
-    elif exposed_services == "Unknown":
-        add_finding_auto(
-            data,
-            "Internet Exposure Not Verified",
-            "Home Network Perimeter",
-            "External (WAN) exposure was not verified during the audit. Verifying WAN exposure reduces blind spots.",
-            "Informational", "Medium",
-            "WAN exposure reported: Unknown",
-            "Unverified exposure can hide unnecessary open services that attackers routinely scan for.",
-            "Perform an external exposure review (ISP modem/router, port forwards, UPnP); document any exposed ports/services."
-        )
+    if getattr(args, "answers", None):
+        answers = load_home_answers(Path(args.answers))
+    else:
+        answers = prompt_home_answers()
+
+    # One timestamp for every finding, phase update and note from this run
+    now = now_iso()
+    add_home_findings(data, answers, now)
 
     # Phase auto-updates (keeps methodology realistic)
-    phases = get_phase_state(data)
+    phases, _ = get_phase_state(data)
     phases["Pre-Engagement"]["status"] = "complete"
-    phases["Pre-Engagement"]["updated_utc"] = now_iso()
+    phases["Pre-Engagement"]["updated_utc"] = now
 
     for ph in ("Reconnaissance", "Scanning", "Enumeration", "Vulnerability Analysis", "Reporting"):
         if phases.get(ph, {}).get("status") == "not_started":
             phases[ph]["status"] = "in_progress"
-            phases[ph]["updated_utc"] = now_iso()
+            phases[ph]["updated_utc"] = now
 
     # Summary note
+    fw_ver = answers.get("fw_ver", "").strip() or "unknown"
+    device_count = answers.get("device_count", "").strip() or "unknown"
     note = (
-        f"Home audit completed. Router={router_make} ({router_ip}), FW={fw_ver}, "
-        f"WiFi={wifi_mode}, Devices~{device_count}, DNS={dns_filter}."
+        f"Home audit completed. Router={answers.get('router_make', '').strip()} "
+        f"({answers.get('router_ip', '').strip()}), FW={fw_ver}, "
+        f"WiFi={answers['wifi_mode']}, Devices~{device_count}, DNS={answers['dns_filter']}."
     )
-    data.setdefault("work", {}).setdefault("notes", []).append({"ts_utc": now_iso(), "text": note})
+    get_work(data).setdefault("notes", []).append({"ts_utc": now, "text": note})
 
     save_engagement(p, data)
     print("\nHome audit complete. Findings were added automatically.")
@@ -1403,129 +1556,202 @@ def cmd_export_pdf(args):
 # --------------------------
 # Report
 # --------------------------
+REPORT_TABLE_ROW = "| %s | %s | %s | %s | %s |"
+
+REPORT_FINDING_HEAD = """### %(id)s — %(title)s
+
+- **Severity:** %(severity)s
+- **Impact Level:** %(impact_level)s
+- **Likelihood:** %(likelihood)s
+- **Remediation Priority:** %(remediation_priority)s
+- **Affected Target:** %(affected_target)s"""
+
+REPORT_FINDING_BODY = """
+**Description**
+%(description)s
+
+**Evidence**
+%(evidence)s
+
+**Business Impact**
+%(business_impact)s
+
+**Recommendation**
+%(recommendation)s
+"""
+
+
 def cmd_report(_args):
     p = pick_current_engagement()
     data = load_engagement(p)
 
     meta = data.get("meta", {})
     scope = data.get("scope", {})
-    phases = get_phase_state(data)
-    work = data.get("work", {})
+    phases, _ = get_phase_state(data)
+    work = get_work(data)
     findings = work.get("findings", [])
     notes = work.get("notes", [])
 
-    # Sort findings by numeric ID ascending for deterministic output
+    # Sort findings by numeric ID ascending for deterministic output. Findings are
+    # inserted in ID order, so this is a single linear pass unless hand-edited
     findings = sorted(findings, key=finding_sort_key)
 
-    sev_counts = {"Critical": 0, "High": 0, "Medium": 0, "Low": 0, "Informational": 0}
-    for f in findings:
-        sev = f.get("severity", "Medium")
-        sev_counts[sev] = sev_counts.get(sev, 0) + 1
-
-    report = []
-    report.append(f"# Penetration Test Report — {meta.get('client','')}")
-    report.append("")
-    report.append(f"**Project:** {meta.get('project','')}")
-    report.append(f"**Test Type:** {meta.get('test_type','')}")
-    report.append(f"**Created (UTC):** {meta.get('created_utc','')}")
-    report.append("")
-
-    report.append("## Executive Summary")
-    report.append("")
-    report.append(
+    # Counter yields 0 for severities with no findings
+    sev_counts = Counter(f.get("severity", "Medium") for f in findings)
+
+    # Stream lines into one buffer instead of growing a list and joining it
+    buf = io.StringIO()
+
+    def w(line: str = ""):
+        buf.write(line)
+        buf.write("\n")
+
+    w(f"# Penetration Test Report — {meta.get('client','')}")
+    w()
+    w(f"**Project:** {meta.get('project','')}")
+    w(f"**Test Type:** {meta.get('test_type','')}")
+    w(f"**Created (UTC):** {meta.get('created_utc','')}")
+    w()
+
+    w("## Executive Summary")
+    w()
+    w(
         f"This assessment identified **{len(findings)}** total findings. "
         f"Severity breakdown: "
-        f"Critical {sev_counts.get('Critical',0)}, "
-        f"High {sev_counts.get('High',0)}, "
-        f"Medium {sev_counts.get('Medium',0)}, "
-        f"Low {sev_counts.get('Low',0)}, "
-        f"Informational {sev_counts.get('Informational',0)}."
+        f"Critical {sev_counts['Critical']}, "
+        f"High {sev_counts['High']}, "
+        f"Medium {sev_counts['Medium']}, "
+        f"Low {sev_counts['Low']}, "
+        f"Informational {sev_counts['Informational']}."
     )
-    report.append("")
+    w()
 
-    report.append("## Scope")
-    report.append("")
-    report.append("### In-Scope Targets")
+    w("## Scope")
+    w()
+    w("### In-Scope Targets")
     for t in scope.get("in_scope", []):
-        report.append(f"- {t}")
+        w(f"- {t}")
     if scope.get("out_of_scope"):
-        report.append("")
-        report.append("### Out of Scope")
-        report.append(f"- {scope.get('out_of_scope')}")
+        w()
+        w("### Out of Scope")
+        w(f"- {scope.get('out_of_scope')}")
     if scope.get("rules_of_engagement"):
-        report.append("")
-        report.append("### Rules of Engagement")
-        report.append(scope.get("rules_of_engagement"))
-
-    report.append("")
-    report.append("## Methodology")
-    report.append("")
-    report.append("The engagement followed a phased methodology. Phase status at the time of reporting:")
-    report.append("")
+        w()
+        w("### Rules of Engagement")
+        w(scope.get("rules_of_engagement"))
+
+    w()
+    w("## Methodology")
+    w()
+    w("The engagement followed a phased methodology. Phase status at the time of reporting:")
+    w()
     for name, why in PHASES:
-        st = phases.get(name, {}).get("status", "not_started")
-        report.append(f"- **{name}** — {st}  \n  _{why}_")
-        pnotes = phases.get(name, {}).get("notes", [])
-        for n in pnotes:
-            report.append(f"  - {n.get('ts_utc','')}: {n.get('text','')}")
-    report.append("")
-
-    report.append("## Findings Summary")
-    report.append("")
+        entry = phases.get(name) or {}
+        st = entry.get("status", "not_started")
+        w(f"- **{name}** — {st}  \n  _{why}_")
+        for n in entry.get("notes", ()):
+            w(f"  - {n.get('ts_utc','')}: {n.get('text','')}")
+    w()
+
+    w("## Findings Summary")
+    w()
     if not findings:
-        report.append("_No findings were recorded._")
+        w("_No findings were recorded._")
     else:
-        report.append("| ID | Severity | Priority | Title | Affected Target |")
-        report.append("|---|---|---|---|---|")
+        w("| ID | Severity | Priority | Title | Affected Target |")
+        w("|---|---|---|---|---|")
         for f in findings:
-            report.append(
-                f"| {f.get('id','')} | {f.get('severity','')} | {f.get('remediation_priority','')} | "
-                f"{f.get('title','')} | {f.get('affected_target','')} |"
-            )
-    report.append("")
-
-    report.append("## Detailed Findings")
-    report.append("")
+            w(REPORT_TABLE_ROW % (
+                f.get("id", ""),
+                f.get("severity", ""),
+                f.get("remediation_priority", ""),
+                f.get("title", ""),
+                f.get("affected_target", ""),
+            ))
+    w()
+
+    w("## Detailed Findings")
+    w()
     if not findings:
-        report.append("_No detailed findings._")
+        w("_No detailed findings._")
     else:
         for f in findings:
-            report.append(f"### {f.get('id','')} — {f.get('title','Untitled')}")
-            report.append("")
-            report.append(f"- **Severity:** {f.get('severity','')}")
-            report.append(f"- **Impact Level:** {f.get('impact_level','')}")
-            report.append(f"- **Likelihood:** {f.get('likelihood','')}")
-            report.append(f"- **Remediation Priority:** {f.get('remediation_priority','')}")
-            report.append(f"- **Affected Target:** {f.get('affected_target','')}")
+            fields = {
+                "id": f.get("id", ""),
+                "title": f.get("title", "Untitled"),
+                "severity": f.get("severity", ""),
+                "impact_level": f.get("impact_level", ""),
+                "likelihood": f.get("likelihood", ""),
+                "remediation_priority": f.get("remediation_priority", ""),
+                "affected_target": f.get("affected_target", ""),
+                "description": f.get("description", ""),
+                "evidence": f.get("evidence", ""),
+                "business_impact": f.get("business_impact", ""),
+                "recommendation": f.get("recommendation", ""),
+            }
+            w(REPORT_FINDING_HEAD % fields)
             if f.get("auto_generated"):
-                report.append(f"- **Auto-Generated:** Yes")
-            report.append("")
-            report.append("**Description**")
-            report.append(f.get("description", ""))
-            report.append("")
-            report.append("**Evidence**")
-            report.append(f.get("evidence", ""))
-            report.append("")
-            report.append("**Business Impact**")
-            report.append(f.get("business_impact", ""))
-            report.append("")
-            report.append("**Recommendation**")
-            report.append(f.get("recommendation", ""))
-            report.append("")
-
-    report.append("## Engagement Notes")
-    report.append("")
+                w("- **Auto-Generated:** Yes")
+            w(REPORT_FINDING_BODY % fields)
+
+    w("## Engagement Notes")
+    w()
     if not notes:
-        report.append("_No general notes were recorded._")
+        w("_No general notes were recorded._")
     else:
         for n in notes:
-            report.append(f"- **{n.get('ts_utc','')}** — {n.get('text','')}")
+            w(f"- **{n.get('ts_utc','')}** — {n.get('text','')}")
 
     out = p / "report.md"
-    out.write_text("\n".join(report))
+    out.write_text(buf.getvalue())
     print(f"Generated report: {out}")
 
 
+# --------------------------
+# Shell
+# --------------------------
+def cmd_shell(_args):
+    """Run commands interactively, reusing one parser and storage cache."""
+    parser = build_parser()
+    # Commands in one session keep reloading the same engagement
+    storage.enable_cache()
+    print(f"{CLI_NAME} shell — type a command without '{CLI_NAME}', 'exit' to quit.")
+    while True:
+        try:
+            line = input(f"{CLI_NAME}> ").strip()
+        except EOFError:
+            print()
+            return
+        except KeyboardInterrupt:
+            print()
+            continue
+
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            return
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Could not parse command: {e}", file=sys.stderr)
+            continue
+        if argv[0] == "shell":
+            print("Already in the shell.", file=sys.stderr)
+            continue
+
+        # argparse errors and commands that sys.exit() or fail end the command,
+        # not the shell. Their partial edits may sit in memory, so drop the
+        # storage cache and let the next command reload from disk.
+        try:
+            args = parser.parse_args(argv)
+            args.func(args)
+        except SystemExit:
+            storage.clear_cache()
+        except Exception as e:
+            storage.clear_cache()
+            print(f"Error: {e}", file=sys.stderr)
+
+
 # --------------------------
 # CLI Parser
 # --------------------------
@@ -1572,12 +1798,15 @@ Assistant features (observation ingestion, playbook suggestions, evidence planni
     phase_sub.add_parser("status", help="Show phase status with coaching").set_defaults(func=cmd_phase_status)
 
     p_pset = phase_sub.add_parser("set", help="Set a phase status")
-    p_pset.add_argument("phase", help="Phase name (use phase status to copy exact name)")
-    p_pset.add_argument("status", help="not_started | in_progress | complete")
+    p_pset.add_argument("phase", choices=PHASE_NAMES, metavar="phase",
+                        help="Phase name (use phase status to copy exact name)")
+    p_pset.add_argument("status", choices=PHASE_STATUSES, metavar="status",
+                        help="not_started | in_progress | complete")
     p_pset.set_defaults(func=cmd_phase_set)
 
     p_pnote = phase_sub.add_parser("note", help="Add a note to a phase")
-    p_pnote.add_argument("phase", help="Phase name (use phase status to copy exact name)")
+    p_pnote.add_argument("phase", choices=PHASE_NAMES, metavar="phase",
+                         help="Phase name (use phase status to copy exact name)")
     p_pnote.add_argument("text", help="Note text")
     p_pnote.set_defaults(func=cmd_phase_note)
 
@@ -1618,7 +1847,10 @@ Assistant features (observation ingestion, playbook suggestions, evidence planni
     # Home audit group
     p_home = sub.add_parser("home-audit", help="Run a home security audit questionnaire")
     home_sub = p_home.add_subparsers(dest="home_cmd", required=True)
-    home_sub.add_parser("run", help="Run home audit wizard and auto-create findings").set_defaults(func=cmd_home_audit_run)
+    p_home_run = home_sub.add_parser("run", help="Run home audit wizard and auto-create findings")
+    p_home_run.add_argument("--answers", metavar="PATH",
+                            help="JSON file with wizard answers (skips the interactive prompts)")
+    p_home_run.set_defaults(func=cmd_home_audit_run)
 
     # Export group
     p_export = sub.add_parser("export", help="Export engagement data")
@@ -1634,6 +1866,7 @@ Assistant features (observation ingestion, playbook suggestions, evidence planni
 
     sub.add_parser("report", help="Generate report.md for the current engagement").set_defaults(func=cmd_report)
     sub.add_parser("version", help="Show version information").set_defaults(func=cmd_version)
+    sub.add_parser("shell", help="Run several commands in one interactive session").set_defaults(func=cmd_shell)
 
     return parser
 
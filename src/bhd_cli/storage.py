@@ -10,9 +10,99 @@ Architecture:
 - Future: SQLiteStorage can be plugged in without breaking changes
 """
 import json
+import mmap
+import os
+import re
+import sys
 from pathlib import Path
 from typing import Optional
 
+# orjson is an optional speedup (pip install bhd-cli[fast]); output is the same
+# bytes either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_FID_RE = re.compile(r"F-(\d+)$")
+
+# Engagements with more findings than this are saved as compact JSON by default;
+# indentation roughly doubles serialize time and file size on large engagements
+PRETTY_MAX_FINDINGS = 50
+
+
+def _dumps(data: dict, pretty: bool = True, sort_keys: bool = False) -> bytes:
+    """Serialize engagement data as JSON (indented if pretty).
+
+    Non-ASCII text is escaped (\\u2014) as json.dumps does; orjson can't
+    escape, so its output is only used when it is pure ASCII.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        payload = orjson.dumps(data, option=option)
+        if payload.isascii():
+            return payload
+    if pretty:
+        return json.dumps(data, indent=2, sort_keys=sort_keys).encode()
+    return json.dumps(data, separators=(",", ":"), sort_keys=sort_keys).encode()
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse engagement.json bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# engagement.json files at least this large are parsed straight from a read-only
+# mmap (orjson only), skipping the read() copy; smaller files are cheaper to read
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _load_file(f: Path, size: int) -> dict:
+    """Read and parse a JSON file, via mmap when it is large and orjson is available."""
+    if orjson is None or size < MMAP_MIN_BYTES:
+        return _loads(f.read_bytes())
+    with open(f, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        with memoryview(m) as view:
+            return orjson.loads(view)
+
+
+# Enum-like finding fields repeated across every finding
+_INTERNED_FINDING_FIELDS = ("severity", "impact_level", "likelihood", "remediation_priority", "status")
+
+
+def _intern_enums(data: dict) -> dict:
+    """
+    Intern the repeated enum-like strings (finding severity/status etc. and
+    phase status) so every finding shares one object per value.
+    """
+    if not isinstance(data, dict):
+        return data
+    work = data.get("work")
+    findings = work.get("findings") if isinstance(work, dict) else None
+    if isinstance(findings, list):
+        for f in findings:
+            # Malformed entries are left for the commands to report, as before
+            if not isinstance(f, dict):
+                continue
+            for k in _INTERNED_FINDING_FIELDS:
+                v = f.get(k)
+                if type(v) is str:
+                    f[k] = sys.intern(v)
+    methodology = data.get("methodology")
+    phases = methodology.get("phases") if isinstance(methodology, dict) else None
+    if isinstance(phases, dict):
+        for phase in phases.values():
+            if not isinstance(phase, dict):
+                continue
+            v = phase.get("status")
+            if type(v) is str:
+                phase["status"] = sys.intern(v)
+    return data
+
 
 class EngagementStorage:
     """
@@ -27,7 +117,7 @@ class EngagementStorage:
         """Load engagement data from storage."""
         raise NotImplementedError
 
-    def save(self, engagement_path: Path, data: dict) -> None:
+    def save(self, engagement_path: Path, data: dict, pretty: Optional[bool] = None) -> None:
         """Save engagement data to storage."""
         raise NotImplementedError
 
@@ -35,6 +125,12 @@ class EngagementStorage:
         """Export engagement data to a standalone JSON file."""
         raise NotImplementedError
 
+    def enable_cache(self) -> None:
+        """Let repeated loads in a long-lived process reuse parsed engagements."""
+
+    def clear_cache(self) -> None:
+        """Forget any in-memory engagement state so the next load reads storage."""
+
 
 class JSONStorage(EngagementStorage):
     """
@@ -45,10 +141,19 @@ class JSONStorage(EngagementStorage):
     data format.
     """
 
+    def __init__(self, cache: bool = False):
+        # Parsed engagement.json keyed by file path, validated by (mtime_ns, size).
+        # Off unless enabled: a one-shot CLI run loads each file once anyway
+        self._cache: Optional[dict[Path, tuple[tuple[int, int], dict]]] = {} if cache else None
+
     def load(self, engagement_path: Path) -> dict:
         """
         Load engagement data from engagement.json.
 
+        With the cache enabled, repeated loads of an unchanged file return the
+        same dict that was last loaded or saved, without a copy. A caller that
+        mutates it and then doesn't save must call clear_cache().
+
         Args:
             engagement_path: Path to engagement folder
 
@@ -56,22 +161,62 @@ class JSONStorage(EngagementStorage):
             Dictionary with engagement data, or empty dict if file doesn't exist
         """
         f = engagement_path / "engagement.json"
-        if not f.exists():
+        try:
+            st = f.stat()
+        except FileNotFoundError:
             return {}
-        return json.loads(f.read_text())
+        if self._cache is None:
+            return _intern_enums(_load_file(f, st.st_size))
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(f)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data = _intern_enums(_load_file(f, st.st_size))
+        self._cache[f] = (key, data)
+        return data
 
-    def save(self, engagement_path: Path, data: dict) -> None:
+    def enable_cache(self) -> None:
+        """Start caching parsed engagements (kept if already enabled)."""
+        if self._cache is None:
+            self._cache = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached engagements; the next load() re-reads the file."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def save(self, engagement_path: Path, data: dict, pretty: Optional[bool] = None) -> None:
         """
         Save engagement data to engagement.json.
 
+        The file is written to a temp sibling, fsynced and renamed over the
+        original, so an interrupted save never leaves a truncated engagement.
+
         Args:
             engagement_path: Path to engagement folder
             data: Engagement data dictionary
+            pretty: Indent the JSON. Defaults to True unless the engagement has
+                more than PRETTY_MAX_FINDINGS findings.
         """
         f = engagement_path / "engagement.json"
-        # Preserve deterministic output: indent=2, but don't sort keys globally
+        tmp = f.with_name(f.name + ".tmp")
+        if pretty is None:
+            pretty = len(data.get("work", {}).get("findings", [])) <= PRETTY_MAX_FINDINGS
+        # Preserve deterministic output: don't sort keys globally
         # (preserve insertion order for better readability)
-        f.write_text(json.dumps(data, indent=2, sort_keys=False))
+        payload = _dumps(data, pretty)
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(payload)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, f)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        if self._cache is not None:
+            st = f.stat()
+            self._cache[f] = ((st.st_mtime_ns, st.st_size), data)
 
     def export_json(self, engagement_path: Path, export_path: Path) -> None:
         """
@@ -115,7 +260,7 @@ class JSONStorage(EngagementStorage):
             export["work"]["findings"] = sorted_findings
 
         # Write with sorted keys for deterministic output
-        export_path.write_text(json.dumps(export, indent=2, sort_keys=True))
+        export_path.write_bytes(_dumps(export, sort_keys=True))
 
     @staticmethod
     def _finding_sort_key(f: dict) -> float:
@@ -123,9 +268,8 @@ class JSONStorage(EngagementStorage):
         Extract numeric ID from finding for sorting (F-001 -> 1, F-023 -> 23).
         Returns float("inf") for malformed IDs (sorts them last).
         """
-        import re
         fid = f.get("id", "")
-        m = re.match(r"^F-(\d+)$", fid)
+        m = _FID_RE.match(fid)
         return int(m.group(1)) if m else float("inf")
 
 
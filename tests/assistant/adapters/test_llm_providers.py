@@ -0,0 +1,157 @@
+"""Tests for cloud LLM provider helpers (no network access)."""
+from bhd_cli.assistant.adapters.llm import prompts
+from bhd_cli.assistant.adapters.llm.anthropic_provider import AnthropicProvider
+
+
+def test_anthropic_client_is_created_lazily_and_reused():
+    """The client is built on first access and cached afterwards."""
+    provider = AnthropicProvider(api_key="test-key")
+    assert provider._client is None
+
+    sentinel = object()
+    provider._client = sentinel
+    assert provider.client is sentinel
+
+
+def test_system_prompt_is_memoized(monkeypatch):
+    """Equal schemas share one rendered prompt regardless of key order."""
+    monkeypatch.setattr(prompts, "_rendered", {})
+    schema_a = {"type": "object", "required": ["id"]}
+    schema_b = {"required": ["id"], "type": "object"}
+
+    first = prompts.render_system_prompt(schema_a)
+    second = prompts.render_system_prompt(schema_b)
+
+    assert first is second
+    assert len(prompts._rendered) == 1
+    assert '"required": [\n    "id"\n  ]' in first
+
+
+def test_system_prompt_keeps_schema_property_order(monkeypatch):
+    """The prompt lists the schema as designed, matching the original inline rendering."""
+    import json
+
+    monkeypatch.setattr(prompts, "_rendered", {})
+    schema = {"type": "object", "properties": {"title": {}, "description": {}, "confidence": {}}}
+
+    prompt = prompts.render_system_prompt(schema)
+
+    assert json.dumps(schema, indent=2) in prompt
+    assert prompt.startswith(
+        "You are a security analysis assistant. You MUST respond with ONLY valid JSON "
+        "that matches this schema:\n\n{"
+    )
+
+
+def test_validate_safety_is_case_insensitive():
+    """Every provider flags dangerous phrases in any case; ordinary text passes."""
+    from bhd_cli.assistant.adapters.llm.mock_provider import MockLLMProvider
+    from bhd_cli.assistant.adapters.llm.ollama import OllamaProvider
+
+    for provider in (AnthropicProvider(api_key="test-key"), OllamaProvider(), MockLLMProvider()):
+        assert provider.validate_safety("Check that SMB signing is enforced.")
+        assert not provider.validate_safety("Drop a Reverse Shell on the host")
+        assert not provider.validate_safety("contains MALWARE samples")
+
+
+def test_ollama_reuses_pooled_session(monkeypatch):
+    """Requests go through the provider's session, not a fresh connection each call."""
+    from bhd_cli.assistant.adapters.llm.ollama import OllamaProvider
+
+    provider = OllamaProvider(base_url="http://ollama.test")
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        content = b'{"response": "{\\"ok\\": true}"}'
+
+    def fake_post(url, json, timeout):
+        calls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(provider.session, "post", fake_post)
+    for _ in range(2):
+        assert provider.generate_structured("p", {"type": "object"}) == {"ok": True}
+    assert calls == ["http://ollama.test/api/generate"] * 2
+    provider.close()
+
+
+def test_bind_schema_renders_system_prompt_once(monkeypatch):
+    """A bound provider sends the same prepared system prompt with every prompt."""
+    from bhd_cli.assistant.adapters.llm import ollama
+    from bhd_cli.assistant.adapters.llm.ollama import OllamaProvider
+
+    provider = OllamaProvider(base_url="http://ollama.test")
+    renders, payloads = [], []
+
+    def fake_render(schema):
+        renders.append(schema)
+        return "SYSTEM"
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        content = b'{"response": "{\\"ok\\": true}"}'
+
+    def fake_post(url, json, timeout):
+        payloads.append(json)
+        return FakeResponse()
+
+    monkeypatch.setattr(ollama, "render_system_prompt", fake_render)
+    monkeypatch.setattr(provider.session, "post", fake_post)
+
+    generate = provider.bind_schema({"type": "object"})
+    assert [generate("a"), generate("b")] == [{"ok": True}] * 2
+    assert len(renders) == 1
+    assert [(p["prompt"], p["system"]) for p in payloads] == [("a", "SYSTEM"), ("b", "SYSTEM")]
+    provider.close()
+
+
+def test_ollama_availability_probe_is_cached(monkeypatch):
+    """Providers for the same server share one probe until the TTL expires."""
+    from types import SimpleNamespace
+
+    from bhd_cli.assistant.adapters.llm import ollama
+    from bhd_cli.assistant.adapters.llm.ollama import OllamaProvider
+
+    probes = []
+    clock = [1000.0]
+    monkeypatch.setattr(ollama, "_availability", {})
+    monkeypatch.setattr(ollama, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(OllamaProvider, "_probe", lambda self: probes.append(self.base_url) or True)
+
+    assert OllamaProvider(base_url="http://ollama.test").is_available()
+    assert OllamaProvider(base_url="http://ollama.test").is_available()
+    assert probes == ["http://ollama.test"]
+
+    clock[0] += ollama.AVAILABILITY_TTL
+    assert OllamaProvider(base_url="http://ollama.test").is_available()
+    assert len(probes) == 2
+
+
+def test_ollama_session_requests_compressed_responses():
+    """The pooled session advertises gzip, so long generations arrive compressed."""
+    from bhd_cli.assistant.adapters.llm.ollama import OllamaProvider
+
+    provider = OllamaProvider()
+    assert "gzip" in provider.session.headers["Accept-Encoding"]
+    provider.close()
+
+
+def test_mock_provider_returns_independent_copies():
+    """Mutating one mock response does not leak into the next."""
+    from bhd_cli.assistant.adapters.llm.mock_provider import MockLLMProvider
+
+    provider = MockLLMProvider()
+    first = provider.generate_structured("p", {})
+    first["risk_tags"].append("changed")
+    first["title"] = "changed"
+
+    second = provider.generate_structured("p", {})
+    assert second["risk_tags"] == ["exposure", "network", "validation-needed"]
+    assert second["title"] == "Mock Hypothesis: Service Exposure Risk"
@@ -336,3 +336,111 @@ def test_nmap_parser_telnet_canonicalization():
     assert obs.data["service"] == "telnet"
     assert obs.data["port"] == 23
     assert "telnet" in obs.tags
+
+
+def test_nmap_parser_streams_file(tmp_path):
+    """Test that iter_parse_file streams the same observations parse() returns."""
+    xml_file = tmp_path / "scan.xml"
+    xml_file.write_bytes(SAMPLE_NMAP_XML.encode())
+    parser = NmapParser()
+
+    streamed = parser.iter_parse_file(xml_file)
+    assert not isinstance(streamed, list)
+
+    def summary(observations):
+        return [(o.id, o.source_artifact, o.data) for o in observations]
+
+    expected = summary(parser.parse("nmap", SAMPLE_NMAP_XML))
+    assert summary(streamed) == expected
+    assert summary(parser.parse_file(xml_file)) == expected
+
+
+def test_nmap_parser_file_honours_declared_encoding(tmp_path):
+    """Test that files are decoded using the XML declaration's encoding."""
+    xml = SAMPLE_NMAP_XML.replace('<?xml version="1.0"?>', '<?xml version="1.0" encoding="ISO-8859-1"?>')
+    xml = xml.replace("example.com", "café.example")
+    xml_file = tmp_path / "scan.xml"
+    xml_file.write_bytes(xml.encode("latin-1"))
+
+    observations = NmapParser().parse_file(xml_file)
+
+    assert observations[0].data["hostname"] == "café.example"
+
+
+def test_nmap_parser_stdlib_fallback_matches(monkeypatch):
+    """Test that the ElementTree fallback yields the same observations as lxml."""
+    import importlib
+    import sys
+
+    import bhd_cli.assistant.adapters.parsers.nmap_parser as nmap_mod
+
+    def summary(module):
+        return [(o.id, o.data) for o in module.NmapParser().parse("nmap", SAMPLE_NMAP_XML)]
+
+    expected = summary(nmap_mod)
+    monkeypatch.setitem(sys.modules, "lxml", None)
+    try:
+        fallback = importlib.reload(nmap_mod)
+        assert fallback.HAVE_LXML is False
+        assert summary(fallback) == expected
+    finally:
+        monkeypatch.undo()
+        importlib.reload(nmap_mod)
+
+
+def test_nmap_parser_does_not_resolve_external_entities(tmp_path):
+    """Test that a scan file can't pull local files in through an external entity."""
+    from bhd_cli.assistant.adapters.parsers import nmap_parser as nmap_mod
+
+    secret = tmp_path / "secret.txt"
+    secret.write_text("TOP-SECRET")
+    doctype = f'<!DOCTYPE nmaprun [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>\n'
+    xml = SAMPLE_NMAP_XML.replace(
+        "<nmaprun", doctype + "<nmaprun", 1
+    ).replace('product="OpenSSH"', 'product="&xxe;"', 1)
+    assert "&xxe;" in xml
+
+    with pytest.raises(ValueError):
+        NmapParser().parse("nmap", xml)
+
+    # Worker processes parse serialized hosts with the same hardening
+    host_xml = (
+        f'<!DOCTYPE host [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>'
+        "<host><hostnames><hostname>&xxe;</hostname></hostnames></host>"
+    ).encode()
+    try:
+        host = nmap_mod.ET.fromstring(host_xml, nmap_mod._HOST_XML_PARSER)
+    except nmap_mod.ET.ParseError:
+        return
+    assert b"TOP-SECRET" not in nmap_mod.ET.tostring(host)
+
+
+def test_nmap_parser_prefers_ipv4_address():
+    """Test that the IPv4 address wins even when IPv6 is listed first."""
+    xml = SAMPLE_NMAP_XML.replace(
+        '<address addr="192.168.1.1" addrtype="ipv4"/>',
+        '<address addr="fe80::1" addrtype="ipv6"/>\n<address addr="192.168.1.1" addrtype="ipv4"/>'
+    )
+
+    observations = NmapParser().parse("nmap", xml)
+
+    assert {obs.data["host"] for obs in observations} == {"192.168.1.1"}
+
+
+def test_nmap_parser_workers_match_serial_output():
+    """Test that parsing a large scan in worker processes keeps results and order."""
+    host_template = SAMPLE_NMAP_XML.split("<host>", 1)[1].split("</host>", 1)[0]
+    hosts = "".join(
+        f"<host>{host_template.replace('192.168.1.1', f'10.0.{i // 256}.{i % 256}')}</host>"
+        for i in range(200)
+    )
+    xml = SAMPLE_NMAP_XML.split("<host>", 1)[0] + hosts + "</nmaprun>"
+
+    def summary(observations):
+        return [(o.id, o.category, o.tags, o.data) for o in observations]
+
+    serial = summary(NmapParser().parse("nmap", xml))
+    parallel = summary(NmapParser(workers=2).parse("nmap", xml))
+
+    assert len(serial) == 600
+    assert parallel == serial
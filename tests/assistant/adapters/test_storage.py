@@ -1,4 +1,5 @@
 """Tests for JSON storage adapter."""
+import json
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -7,6 +8,20 @@ from bhd_cli.assistant.core.entities import Observation, ObservationCategory, Fi
 from bhd_cli.assistant.adapters.storage.json_store import JSONStorageAdapter
 
 
+def _port_observation(i: int, **overrides) -> Observation:
+    """Build the open-port observation obs-{i} from scan-1, with data {"port": i}."""
+    values = dict(
+        id=f"obs-{i}",
+        source_artifact="scan-1",
+        category=ObservationCategory.PORT,
+        tags=["open"],
+        confidence=0.95,
+        data={"port": i}
+    )
+    values.update(overrides)
+    return Observation(**values)
+
+
 def test_save_and_load_observation(tmp_path):
     """Test that observations can be saved and loaded correctly."""
     storage = JSONStorageAdapter(tmp_path)
@@ -152,3 +167,258 @@ def test_save_finding_draft(tmp_path):
     assert saved_data["title"] == "Test Finding"
     assert saved_data["impact"] == "high"
     assert saved_data["likelihood"] == "medium"
+
+
+def test_save_observations_is_all_or_nothing(tmp_path):
+    """Test that a stream failing part way leaves earlier saves untouched."""
+    storage = JSONStorageAdapter(tmp_path)
+
+    assert storage.save_observations(_port_observation(i) for i in range(2)) == ["obs-0", "obs-1"]
+
+    def failing_stream():
+        yield _port_observation(2)
+        raise ValueError("Invalid Nmap XML")
+
+    with pytest.raises(ValueError):
+        storage.save_observations(failing_stream())
+
+    assert [o.id for o in storage.load_observations(session_id="s")] == ["obs-0", "obs-1"]
+
+
+def test_save_observations_writes_in_chunks(tmp_path, monkeypatch):
+    """Test that bulk saves spanning several write chunks keep every record in order."""
+    from bhd_cli.assistant.adapters.storage import json_store
+
+    monkeypatch.setattr(json_store, "WRITE_CHUNK_SIZE", 256)
+    storage = JSONStorageAdapter(tmp_path)
+    observations = [_port_observation(i) for i in range(20)]
+
+    class RecordingFile:
+        def __init__(self, f):
+            self._f = f
+            self.writes = []
+
+        def write(self, data):
+            self.writes.append(len(data))
+            return self._f.write(data)
+
+        def __getattr__(self, name):
+            return getattr(self._f, name)
+
+    fp = storage._obs_fp = RecordingFile(storage._observations_fp())
+
+    assert storage.save_observations(observations) == [f"obs-{i}" for i in range(20)]
+    # Records are coalesced: a handful of chunk-sized writes, not one per record
+    assert 1 < len(fp.writes) < len(observations)
+    assert all(size >= 256 for size in fp.writes[:-1])
+    assert [o.data["port"] for o in storage.load_observations(session_id="s")] == list(range(20))
+
+
+def test_load_observations_reads_large_logs_through_mmap(tmp_path, monkeypatch):
+    """Test that logs above MMAP_MIN_BYTES are split line by line off an mmap."""
+    from bhd_cli.assistant.adapters.storage import json_store
+
+    storage = JSONStorageAdapter(tmp_path)
+    storage.save_observations(_port_observation(i) for i in range(5))
+    expected = [o.to_dict() for o in storage.load_observations(session_id="s")]
+
+    mapped = []
+    real_mmap = json_store.mmap.mmap
+
+    class LineOnlyMap:
+        """Only readline() reaches the mapping; slicing out a whole copy would fail."""
+
+        def __init__(self, *args, **kwargs):
+            self._m = real_mmap(*args, **kwargs)
+            self.readline = self._m.readline
+            self.madvise = self._m.madvise
+            mapped.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self._m.close()
+
+    monkeypatch.setattr(json_store, "MMAP_MIN_BYTES", 1)
+    monkeypatch.setattr(json_store.mmap, "mmap", LineOnlyMap)
+
+    assert [o.to_dict() for o in storage.load_observations(session_id="s")] == expected
+    assert len(mapped) == 1
+
+    # An empty log can't be mapped; it still loads as no records
+    storage.observations_file.write_bytes(b"")
+    assert storage.load_observations(session_id="s") == []
+
+
+def test_save_observation_with_non_str_keys(tmp_path):
+    """Test that data orjson can't encode (int keys) falls back to the stdlib encoder."""
+    from bhd_cli.assistant.adapters import json_codec
+
+    data = {443: "https", 80: {22: ["ssh"]}}
+    expected = json.loads(json.dumps(data, sort_keys=True, separators=(",", ":")))
+    assert json_codec.loads(json_codec.dumps_line(data)) == expected
+    assert json_codec.dumps_sorted(data) == json_codec.dumps_line(data).rstrip(b"\n")
+
+    storage = JSONStorageAdapter(tmp_path)
+    storage.save_observation(_port_observation(1, data=data))
+
+    assert storage.load_observations(session_id="s")[0].data == expected
+
+
+def test_save_finding_drafts(tmp_path):
+    """Test that bulk-saved drafts are appended in order."""
+    import json
+
+    storage = JSONStorageAdapter(tmp_path)
+    drafts = [
+        FindingDraft(
+            id=f"finding-{i}",
+            title=f"Finding {i}",
+            affected_asset="test-asset",
+            description="Test description",
+            impact="low",
+            likelihood="low",
+            evidence_refs=[],
+            remediation="Test remediation",
+            business_impact="Test business impact"
+        )
+        for i in range(3)
+    ]
+
+    assert storage.save_finding_drafts(drafts) == ["finding-0", "finding-1", "finding-2"]
+
+    with open(storage.findings_file) as f:
+        saved = [json.loads(line) for line in f]
+    assert [d["title"] for d in saved] == ["Finding 0", "Finding 1", "Finding 2"]
+
+
+def test_observation_appends_reuse_one_handle(tmp_path):
+    """Test that appends share a buffered handle that flush()/close() write through."""
+    storage = JSONStorageAdapter(tmp_path)
+    handles = set()
+
+    for i in range(3):
+        storage.save_observation(_port_observation(i))
+        handles.add(storage._obs_fp)
+
+    assert len(handles) == 1
+    handle = handles.pop()
+
+    storage.flush()
+    assert len(storage.observations_file.read_bytes().splitlines()) == 3
+
+    storage.close()
+    assert handle.closed
+    assert [o.id for o in storage.load_observations(session_id="s")] == ["obs-0", "obs-1", "obs-2"]
+
+
+def test_load_observations_parses_log_in_one_pass(tmp_path):
+    """Test that hand-written JSONL lines (any spacing, trailing newlines) still load."""
+    storage = JSONStorageAdapter(tmp_path)
+    storage.observations_file.write_text(
+        '{"id": "obs-1", "source_artifact": "a", "category": "port", "tags": ["x,y"],'
+        ' "confidence": 0.5, "data": {"note": "line\\nbreak"}}\n'
+        '{"id":"obs-2","source_artifact":"a","category":"service","tags":[],"confidence":1.0,"data":{}}\n\n'
+    )
+
+    loaded = storage.load_observations(session_id="s")
+
+    assert [o.id for o in loaded] == ["obs-1", "obs-2"]
+    assert loaded[0].tags == ["x,y"]
+    assert loaded[0].data["note"] == "line\nbreak"
+
+
+def test_created_at_stored_as_epoch_microseconds(tmp_path):
+    """Test that naive timestamps are stored as integers and ISO records still load."""
+    import json
+    from datetime import timezone
+
+    storage = JSONStorageAdapter(tmp_path)
+    naive = datetime(2026, 2, 17, 10, 30, 0, 123456)
+    aware = datetime(2026, 2, 17, 10, 30, 0, tzinfo=timezone.utc)
+    for i, created_at in enumerate((naive, aware)):
+        storage.save_observation(_port_observation(i, data={}, created_at=created_at))
+    storage.flush()
+    with open(storage.observations_file, "a") as f:
+        f.write('{"id":"obs-old","source_artifact":"a","category":"port","tags":[],'
+                '"confidence":0.5,"data":{},"created_at":"2025-01-02T03:04:05"}\n')
+
+    records = [json.loads(line) for line in storage.observations_file.read_text().splitlines()]
+    assert records[0]["created_at_us"] == 1771324200123456
+    assert "created_at" not in records[0]
+    assert records[1]["created_at"] == aware.isoformat()
+
+    loaded = storage.load_observations(session_id="s")
+    assert [o.created_at for o in loaded] == [naive, aware, datetime(2025, 1, 2, 3, 4, 5)]
+
+
+def test_observation_from_trusted_matches_constructor():
+    """Test that the trusted factory builds the same observation as the constructor."""
+    fields = dict(
+        id="obs-1",
+        source_artifact="scan-1",
+        category=ObservationCategory.PORT,
+        tags=["open"],
+        confidence=0.95,
+        data={"port": 22},
+        created_at=datetime(2026, 2, 17, 10, 30, 0)
+    )
+
+    assert Observation.from_trusted(**fields) == Observation(**fields)
+    assert Observation.from_trusted(**{**fields, "created_at": None}).created_at is not None
+
+    with pytest.raises(TypeError):
+        Observation.from_trusted(**{k: v for k, v in fields.items() if k != "data"})
+    with pytest.raises(TypeError):
+        Observation.from_trusted(**fields, extra=1)
+
+
+def test_every_observation_field_round_trips(tmp_path):
+    """Test that storage writes and restores each dataclass field of Observation."""
+    import dataclasses
+
+    obs = Observation(
+        id="obs-1",
+        source_artifact="scan-1",
+        category=ObservationCategory.SERVICE,
+        tags=["open", "tcp"],
+        confidence=0.5,
+        data={"port": 22, "service": "ssh"},
+        created_at=datetime(2026, 2, 17, 10, 30, 0)
+    )
+    storage = JSONStorageAdapter(tmp_path)
+    storage.save_observation(obs)
+
+    loaded = storage.load_observations(session_id="s")[0]
+    for f in dataclasses.fields(Observation):
+        assert getattr(loaded, f.name) == getattr(obs, f.name), f.name
+
+
+def test_save_observations_fsyncs_once_per_batch(tmp_path, monkeypatch):
+    """Test that a bulk save syncs once, and not at all with sync=False."""
+    from bhd_cli.assistant.adapters.storage import json_store
+
+    synced = []
+    monkeypatch.setattr(json_store.os, "fsync", synced.append)
+    storage = JSONStorageAdapter(tmp_path)
+
+    def batch(n):
+        return (_port_observation(i) for i in range(n))
+
+    storage.save_observations(batch(10))
+    assert len(synced) == 1
+
+    storage.save_observations(batch(10), sync=False)
+    assert len(synced) == 1
+
+
+def test_loaded_tags_are_shared_strings(tmp_path):
+    """Test that repeated tags load as one shared string object."""
+    storage = JSONStorageAdapter(tmp_path)
+    storage.save_observations(_port_observation(i, tags=["open", "tcp"]) for i in range(3))
+
+    loaded = storage.load_observations(session_id="s")
+
+    assert loaded[0].tags == ["open", "tcp"]
+    assert all(obs.tags[1] is loaded[0].tags[1] for obs in loaded)
@@ -116,3 +116,32 @@ def test_exporter_handles_empty_evidence():
     result = BHDCLIExporter.finding_draft_to_bhd_cli(draft)
 
     assert result["evidence"] == ""
+
+
+def test_export_json_matches_stdlib_layout(tmp_path):
+    """Test that export files parse back and keep the indented, key-sorted layout."""
+    import json
+
+    draft = FindingDraft(
+        id="finding-123",
+        title="Test Finding",
+        affected_asset="café-server",
+        description="Test description — “quoted”",
+        impact="high",
+        likelihood="medium",
+        evidence_refs=["ev-1"],
+        remediation="Test remediation",
+        business_impact="Test business impact"
+    )
+    output = tmp_path / "export.json"
+
+    BHDCLIExporter.export_json([draft], str(output))
+    data = json.loads(output.read_bytes())
+
+    assert data["findings"] == [BHDCLIExporter.finding_draft_to_bhd_cli(draft)]
+    assert output.read_text() == json.dumps(data, indent=2, sort_keys=True)
+    assert output.read_bytes().isascii()
+    assert '"caf\\u00e9-server"' in output.read_text()
+    assert BHDCLIExporter.to_bhd_cli_import_format([draft]) == json.dumps(
+        {"findings": data["findings"]}, indent=2, sort_keys=True
+    )
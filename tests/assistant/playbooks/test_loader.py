@@ -1,5 +1,6 @@
 """Tests for playbook loader."""
 import pytest
+import yaml
 from pathlib import Path
 
 from bhd_cli.assistant.playbooks.loader import PlaybookLoader
@@ -135,3 +136,54 @@ def test_playbook_version_format(loader):
         parts = version.split(".")
         assert len(parts) == 3, f"{pb_info['id']} version must be X.Y.Z format"
         assert all(part.isdigit() for part in parts), f"{pb_info['id']} version parts must be numbers"
+
+
+def test_loader_parses_each_file_once(tmp_path, schemas_dir, playbooks_dir, monkeypatch):
+    """Test that listing and loading share one indexed parse of the library."""
+    import shutil
+
+    from bhd_cli.assistant.playbooks import loader as loader_module
+
+    library = tmp_path / "library"
+    shutil.copytree(playbooks_dir, library)
+    # Playbooks are found by id even when the file is named differently
+    (library / "idor_validation.yaml").rename(library / "renamed.yaml")
+    (library / "broken.yaml").write_text("id: [unclosed\n")
+
+    parses = []
+    real_load = loader_module.yaml.load
+    monkeypatch.setattr(
+        loader_module.yaml, "load",
+        lambda stream, Loader: parses.append(stream.name) or real_load(stream, Loader=Loader)
+    )
+
+    loader = PlaybookLoader(library, schemas_dir)
+    listed = loader.list_playbooks()
+    for pb_info in listed:
+        loader.load_playbook(pb_info["id"])
+    loader.list_playbooks({"test_type": "web"})
+
+    assert "idor_validation" in [p["id"] for p in listed]
+    assert loader.load_playbook("renamed")["id"] == "idor_validation"
+    assert len(parses) == len(list(library.glob("*.yaml")))
+    with pytest.raises(yaml.YAMLError):
+        loader.load_playbook("broken")
+
+
+def test_loader_uses_safe_yaml_loader():
+    """Test that the (possibly C-accelerated) loader is a safe loader."""
+
+    from bhd_cli.assistant.playbooks import loader as loader_module
+    from bhd_cli.assistant.playbooks import selector as selector_module
+
+    assert selector_module.YamlLoader is loader_module.YamlLoader
+    assert loader_module.YamlLoader in (getattr(yaml, "CSafeLoader", None), yaml.SafeLoader)
+    with pytest.raises(yaml.constructor.ConstructorError):
+        yaml.load("!!python/object/apply:os.system ['true']", Loader=loader_module.YamlLoader)
+
+
+def test_evidence_type_mapping():
+    """Test that playbook evidence types map to schema types, unknown ones to "other"."""
+    assert PlaybookLoader._map_evidence_type("config") == "configuration_snapshot"
+    assert PlaybookLoader._map_evidence_type("request_response") == "request_response_pair"
+    assert PlaybookLoader._map_evidence_type("pcap") == "other"
@@ -344,3 +344,55 @@ def test_selector_telnet_service(selector):
 
     result = selector.select_playbook(observations, "network")
     assert result == "exposed_admin_interfaces"
+
+
+def test_selector_compiled_requirements(tmp_path):
+    """Test compiled data_contains checks: case-insensitive contains, values lists."""
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text("""
+rules:
+  - id: mixed_case_banner
+    test_types: [network]
+    conditions:
+      - category: service
+        data_contains:
+          - key: banner
+            contains: ["OpenSSH"]
+          - key: port
+            values: [22, 2222]
+    playbook_id: exposed_admin_interfaces
+    priority: 10
+default_playbook: null
+""")
+    selector = PlaybookSelector(rules_path)
+
+    def service(data):
+        return [Observation(
+            id="obs-1", source_artifact="scan-1", category=ObservationCategory.SERVICE,
+            tags=[], confidence=1.0, data=data
+        )]
+
+    assert selector.select_playbook(service({"banner": "SSH-2.0-openssh_8.9", "port": 2222}), "network") == "exposed_admin_interfaces"
+    assert selector.select_playbook(service({"banner": "SSH-2.0-openssh_8.9", "port": 80}), "network") is None
+    # Unhashable data values are compared by equality rather than raising
+    assert selector.select_playbook(service({"banner": "openssh", "port": [22]}), "network") is None
+
+
+def test_selector_explain_lists_available_categories_in_order(selector):
+    """Test that a missing category reports the observed categories in first-seen order."""
+    observations = [
+        Observation(
+            id=f"obs-{i}", source_artifact="scan-1", category=category,
+            tags=[], confidence=1.0, data={}
+        )
+        for i, category in enumerate([
+            ObservationCategory.TECHNOLOGY,
+            ObservationCategory.EXPOSURE,
+            ObservationCategory.TECHNOLOGY,
+        ])
+    ]
+
+    result = selector.select_playbook(observations, "network", explain=True)
+
+    reasons = [r for rule in result["evaluated_rules"] for r in rule.get("failure_reasons", [])]
+    assert any("(available: ['technology', 'exposure'])" in r for r in reasons)
@@ -132,3 +132,24 @@ def test_evaluation_serialization():
     assert "reasons" in result_dict
     assert "context" in result_dict
     assert isinstance(result_dict["reasons"], list)
+
+
+def test_deep_lab_granted_only_for_lab_authorized_self():
+    """Test every context: deep_lab needs lab/ctf, authorization and self-owned targets."""
+    from itertools import product
+
+    for env, authorized, owner in product(Environment, (False, True), TargetOwner):
+        context = AssistContext(
+            environment=env,
+            authorization=authorized,
+            target_owner=owner,
+            requested_level=EffectiveAssistLevel.DEEP_LAB
+        )
+
+        result = evaluate_assist_level(context)
+
+        expected = (
+            env in (Environment.LAB, Environment.CTF) and authorized and owner == TargetOwner.SELF
+        )
+        assert (result.effective_level == EffectiveAssistLevel.DEEP_LAB) == expected
+        assert len(result.reasons) == 1
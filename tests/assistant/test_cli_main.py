@@ -0,0 +1,93 @@
+"""Tests for the bhd-assist CLI entrypoint."""
+import json
+
+import pytest
+
+from bhd_cli.assistant.cli import main as cli_main
+
+
+def test_main_dispatches_to_command(capsys):
+    """Test that the invoked command's arguments are parsed and its handler runs."""
+    cli_main.main(["playbook-select", "--playbook-id", "smb_signing"])
+
+    out = json.loads(capsys.readouterr().out)
+    assert out["status"] == "selected"
+    assert out["playbook_id"] == "smb_signing"
+
+
+def test_main_builds_only_invoked_command_arguments(monkeypatch, capsys):
+    """Test that other commands' argument builders are skipped."""
+    built = []
+    commands = {
+        name: (help_text, lambda p, name=name, add=add: (built.append(name), add(p)), handler)
+        for name, (help_text, add, handler) in cli_main.COMMANDS.items()
+    }
+    monkeypatch.setattr(cli_main, "COMMANDS", commands)
+
+    cli_main.main(["export", "--output", "out.json"])
+
+    assert built == ["export"]
+    assert json.loads(capsys.readouterr().out)["output_file"] == "out.json"
+
+
+def test_main_rejects_unknown_command(capsys):
+    """Test that an unknown command still lists every valid choice."""
+    with pytest.raises(SystemExit):
+        cli_main.main(["bogus"])
+
+    err = capsys.readouterr().err
+    assert "hypothesis-draft" in err and "suggest-playbooks" in err
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["playbook-select"], {
+        "status": "selected",
+        "playbook_id": "auto",
+        "message": "Playbook selection stub"
+    }),
+    (["playbook-select", "--playbook-id", 'odd "id" é'], {
+        "status": "selected",
+        "playbook_id": 'odd "id" é',
+        "message": "Playbook selection stub"
+    }),
+    (["export", "--output", "out.json"], {
+        "status": "exported",
+        "output_file": "out.json",
+        "format": "bhd-cli",
+        "findings_count": 0,
+        "message": "Export stub - no drafts to export"
+    }),
+])
+def test_stub_responses_match_json_dumps(capsys, argv, expected):
+    """Test that pre-rendered stub responses are byte-identical to json.dumps output."""
+    cli_main.main(argv)
+
+    assert capsys.readouterr().out == json.dumps(expected, indent=2, sort_keys=True) + "\n"
+
+
+def test_output_falls_back_to_text_streams(monkeypatch):
+    """Test that output still works when stdout has no byte buffer."""
+    import io
+
+    out = io.StringIO()
+    monkeypatch.setattr("sys.stdout", out)
+
+    cli_main.main(["export"])
+
+    assert json.loads(out.getvalue())["output_file"] == "findings_export.json"
+
+
+def test_output_uses_text_path_on_non_utf8_stdout(monkeypatch):
+    """Test that non-UTF-8 consoles get text output, not raw UTF-8 bytes."""
+    import io
+
+    for encoding, via_bytes in (("utf-8", True), ("UTF8", True), ("cp1252", False), ("ascii", False)):
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding=encoding, errors="backslashreplace")
+        monkeypatch.setattr("sys.stdout", out)
+
+        cli_main._write("café".encode())
+        out.flush()
+
+        expected = "café\n".encode(encoding, errors="backslashreplace")
+        assert raw.getvalue() == ("café\n".encode() if via_bytes else expected)
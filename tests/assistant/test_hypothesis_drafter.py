@@ -1,4 +1,5 @@
 """Tests for hypothesis drafter with schema validation."""
+import json
 import pytest
 from pathlib import Path
 
@@ -223,3 +224,124 @@ def test_drafter_schema_validation(drafter, sample_observations):
         assert isinstance(hyp["risk_tags"], list)
         assert isinstance(hyp["confidence"], (int, float))
         assert 0 <= hyp["confidence"] <= 1
+
+
+def test_drafter_repairs_invalid_response(policy_guard, sample_observations):
+    """Test that a schema-invalid response triggers a repair prompt with the error."""
+    class OnceInvalidProvider(MockLLMProvider):
+        def generate_structured(self, prompt, schema, temperature=0.0):
+            result = super().generate_structured(prompt, schema, temperature)
+            if self.attempt_count == 1:
+                del result["rationale"]
+            return result
+
+    provider = OnceInvalidProvider()
+    drafter = HypothesisDrafter(llm_provider=provider, policy_guard=policy_guard)
+
+    hypothesis = drafter._draft_single_hypothesis(sample_observations, EffectiveAssistLevel.STANDARD)
+
+    assert hypothesis is not None
+    assert provider.attempt_count == 2
+    assert "PREVIOUS ATTEMPT FAILED VALIDATION" in provider.last_prompt
+    assert "'rationale' is a required property" in provider.last_prompt
+
+
+def test_drafter_batches_clusters_into_one_call(policy_guard):
+    """Test that clusters share one LLM call and unmatched clusters are redrafted."""
+    import re
+
+    class BatchProvider(MockLLMProvider):
+        def __init__(self):
+            super().__init__()
+            self.schemas = []
+
+        def generate_structured(self, prompt, schema, temperature=0.0):
+            self.schemas.append(schema)
+            single = super().generate_structured(prompt, schema, temperature)
+            if "hypotheses" not in schema.get("properties", {}):
+                return single
+            blocks = re.findall(r'id: "(\w+)"\nrelated_observations: (\[.*?\])', prompt)
+            items = [
+                dict(single, id=hyp_id, related_observations=json.loads(obs_ids))
+                for hyp_id, obs_ids in blocks
+            ]
+            # Reordered, one invalid, one citing the wrong cluster, one duplicate
+            items.reverse()
+            del items[0]["rationale"]
+            items[1]["related_observations"] = ["obs-9"]
+            items.append(dict(items[2], title="Duplicate"))
+            return {"hypotheses": items}
+
+    observations = [
+        Observation(
+            id=f"obs-{i}",
+            source_artifact="scan-1",
+            category=ObservationCategory.SERVICE,
+            tags=["service"],
+            confidence=1.0,
+            data={"host": f"10.0.0.{i}", "port": 22}
+        )
+        for i in range(4)
+    ]
+    context = AssistContext(
+        environment=Environment.LAB,
+        authorization=True,
+        target_owner=TargetOwner.SELF,
+        requested_level=EffectiveAssistLevel.STANDARD
+    )
+
+    provider = BatchProvider()
+    drafter = HypothesisDrafter(llm_provider=provider, policy_guard=policy_guard)
+    result = drafter.draft_hypotheses(observations, context, max_hypotheses=4)
+
+    # One batched call for all four clusters, one retry each for the two bad items
+    assert [s is drafter.batch_schema for s in provider.schemas] == [True, False, False]
+    expected_ids = [drafter._hypothesis_id([obs]) for obs in observations]
+    ids = [h["id"] for h in result["hypotheses"]]
+    assert ids == [expected_ids[0], expected_ids[1], "mock123456789abc", "mock123456789abc"]
+    assert [h["related_observations"] for h in result["hypotheses"][:2]] == [["obs-0"], ["obs-1"]]
+    assert "Duplicate" not in [h["title"] for h in result["hypotheses"]]
+
+    # Providers that ignore the batch format fall back to per-cluster calls
+    plain = MockLLMProvider()
+    drafter = HypothesisDrafter(llm_provider=plain, policy_guard=policy_guard)
+    result = drafter.draft_hypotheses(observations[:3], context, max_hypotheses=3)
+    assert len(result["hypotheses"]) == 3
+    assert plain.attempt_count == 4
+
+
+def test_drafter_clusters_keep_first_seen_order(drafter):
+    """Test that clusters come out in first-seen order, keyed by host or hostname."""
+    def obs(obs_id, category, data):
+        return Observation(
+            id=obs_id, source_artifact="scan-1", category=category,
+            tags=[], confidence=1.0, data=data
+        )
+
+    observations = [
+        obs("a", ObservationCategory.SERVICE, {"host": "10.0.0.1"}),
+        obs("b", ObservationCategory.EXPOSURE, {"hostname": "web01"}),
+        obs("c", ObservationCategory.SERVICE, {"hostname": "10.0.0.1"}),
+        obs("d", ObservationCategory.SERVICE, {}),
+        obs("e", ObservationCategory.EXPOSURE, {"host": "web01", "hostname": "other"}),
+    ]
+
+    clusters = drafter._cluster_observations(observations)
+
+    assert [[o.id for o in cluster] for cluster in clusters] == [["a", "c"], ["b", "e"], ["d"]]
+
+
+def test_prompt_data_matches_json_dumps_layout():
+    """Test that observation data in prompts keeps json.dumps(indent=2) layout."""
+    import json
+
+    from bhd_cli.assistant.core.hypothesis_drafter import _dumps_data
+
+    data = {"host": "10.0.0.1", "port": 22, "scripts": {"banner": ["a", "b"]}, "empty": {}}
+    assert _dumps_data(data) == json.dumps(data, indent=2)
+    # Non-string keys still serialize (coerced, as json.dumps does)
+    assert _dumps_data({1: "x"}) == json.dumps({1: "x"}, indent=2)
+    # Non-ASCII text is escaped, as json.dumps does, with or without orjson
+    data = {"hostname": "café.example", "banner": "SSH — ready"}
+    assert _dumps_data(data) == json.dumps(data, indent=2)
+    assert "\\u00e9" in _dumps_data(data)
@@ -1,4 +1,6 @@
 """Tests for LLM provider router."""
+import asyncio
+
 import pytest
 
 from bhd_cli.assistant.adapters.llm.router import LLMRouter
@@ -38,6 +40,10 @@ def test_router_no_providers_available():
 
     with pytest.raises(RuntimeError, match="No LLM providers available"):
         router.generate_structured("test prompt", schema)
+    with pytest.raises(RuntimeError, match="No LLM providers available"):
+        asyncio.run(router.agenerate_structured("test prompt", schema))
+    with pytest.raises(RuntimeError, match="No LLM providers available"):
+        asyncio.run(router.agenerate_race("test prompt", schema, k=2))
 
 
 def test_router_all_providers_fail():
@@ -66,3 +72,164 @@ def test_router_provider_order():
 
     # Should use mock2 first (as specified in order)
     assert router.get_last_used_provider() == "mock2"
+
+
+def test_router_agenerate_structured_falls_back():
+    """Test async generation uses the same fallback order as the sync path."""
+    router = LLMRouter(provider_order=["mock1", "mock2"])
+
+    router.providers["mock1"] = MockLLMProvider(should_fail=True)
+    router.providers["mock2"] = MockLLMProvider(should_fail=False)
+
+    result = asyncio.run(router.agenerate_structured("test prompt", {"type": "object"}))
+
+    assert router.get_last_used_provider() == "mock2"
+    assert "id" in result
+
+
+def test_router_generate_batch_returns_results_in_prompt_order():
+    """Test batch generation returns one result per prompt, in order."""
+    router = LLMRouter(provider_order=["mock1"])
+    mock = MockLLMProvider(should_fail=False)
+    router.providers["mock1"] = mock
+
+    prompts = [f"prompt {i}" for i in range(5)]
+    results = router.generate_batch(prompts, {"type": "object"}, concurrency=2)
+
+    assert len(results) == 5
+    assert all("id" in r for r in results)
+    assert mock.attempt_count == 5
+
+
+def test_router_caches_deterministic_responses():
+    """Test repeated temperature-0 prompts are served from the LRU cache."""
+    router = LLMRouter(provider_order=["mock1"], cache_size=2)
+    mock = MockLLMProvider(should_fail=False)
+    router.providers["mock1"] = mock
+    schema = {"type": "object"}
+
+    first = router.generate_structured("test prompt", schema)
+    first["id"] = "mutated"
+    second = router.generate_structured("test prompt", schema)
+
+    assert mock.attempt_count == 1
+    assert second["id"] != "mutated"
+    assert router.cache_stats() == {"size": 1, "maxsize": 2, "hits": 1, "misses": 1}
+
+    router.generate_structured("test prompt", schema, temperature=0.7)
+    router.generate_structured("other prompt", schema)
+    router.generate_structured("third prompt", schema)
+    router.generate_structured("test prompt", schema)
+    assert mock.attempt_count == 5
+
+    router.clear_cache()
+    assert router.cache_stats()["size"] == 0
+
+
+def test_router_does_not_cache_schema_invalid_responses():
+    """Test that a response failing its schema is fetched again on retry."""
+    class OnceInvalidProvider(MockLLMProvider):
+        def generate_structured(self, prompt, schema, temperature=0.0):
+            result = super().generate_structured(prompt, schema, temperature)
+            if self.attempt_count == 1:
+                del result["title"]
+            return result
+
+    router = LLMRouter(provider_order=["mock1"])
+    provider = OnceInvalidProvider()
+    router.providers["mock1"] = provider
+    schema = {"type": "object", "required": ["title"]}
+
+    assert "title" not in router.generate_structured("test prompt", schema)
+    assert "title" in router.generate_structured("test prompt", schema)
+    assert "title" in router.generate_structured("test prompt", schema)
+    assert provider.attempt_count == 2
+
+
+def test_router_instantiates_providers_lazily():
+    """Test providers are built on first use and only as far down the order as needed."""
+    built = []
+
+    def factory(name):
+        def build():
+            built.append(name)
+            return MockLLMProvider(should_fail=False)
+        return build
+
+    router = LLMRouter(provider_order=["mock1", "mock2"])
+    router._factories = {"mock1": factory("mock1"), "mock2": factory("mock2")}
+    assert built == []
+
+    router.generate_structured("test prompt", {"type": "object"})
+    router.generate_structured("other prompt", {"type": "object"})
+
+    assert built == ["mock1"]
+    assert router.get_available_providers() == ["mock1", "mock2"]
+
+
+class _SlowProvider(MockLLMProvider):
+    """Mock provider that answers after a delay (or fails after it)."""
+
+    def __init__(self, delay, should_fail=False):
+        super().__init__(should_fail=should_fail)
+        self.delay = delay
+        self.cancelled = False
+
+    async def agenerate_structured(self, prompt, schema, temperature=0.0):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.generate_structured(prompt, schema, temperature)
+
+
+def test_router_race_returns_first_success_and_cancels_rest():
+    """Test racing returns the fastest successful provider and cancels the others."""
+    router = LLMRouter(provider_order=["slow", "failing", "fast"])
+    slow = _SlowProvider(5)
+    router.providers["slow"] = slow
+    router.providers["failing"] = _SlowProvider(0, should_fail=True)
+    router.providers["fast"] = _SlowProvider(0.01)
+
+    result = asyncio.run(router.agenerate_race("test prompt", {"type": "object"}, k=3))
+
+    assert "id" in result
+    assert router.get_last_used_provider() == "fast"
+    assert slow.cancelled
+
+
+def test_router_race_falls_back_past_k():
+    """Test providers beyond the raced k are tried in order when all racers fail."""
+    router = LLMRouter(provider_order=["a", "b", "c"])
+    router.providers["a"] = _SlowProvider(0, should_fail=True)
+    router.providers["b"] = _SlowProvider(0, should_fail=True)
+    router.providers["c"] = _SlowProvider(0)
+
+    asyncio.run(router.agenerate_race("test prompt", {"type": "object"}, k=2))
+    assert router.get_last_used_provider() == "c"
+
+    router.providers["c"] = _SlowProvider(0, should_fail=True)
+    router.clear_cache()
+    with pytest.raises(RuntimeError, match="All LLM providers failed"):
+        asyncio.run(router.agenerate_race("other prompt", {"type": "object"}, k=2))
+
+
+def test_router_race_probes_only_k_providers_off_the_event_loop():
+    """Test racing builds providers only until k are found, in worker threads."""
+    import threading
+
+    built = []
+
+    def factory(name):
+        def build():
+            built.append((name, threading.current_thread() is threading.main_thread()))
+            return _SlowProvider(0)
+        return build
+
+    router = LLMRouter(provider_order=["a", "b", "c"])
+    router._factories = {name: factory(name) for name in ("a", "b", "c")}
+
+    asyncio.run(router.agenerate_race("test prompt", {"type": "object"}, k=2))
+
+    assert built == [("a", False), ("b", False)]
@@ -0,0 +1,101 @@
+"""Tests for the shared schema validator."""
+import jsonschema
+import pytest
+
+from bhd_cli.assistant.core.entities import ExportBundle
+from bhd_cli.assistant.core.schema_validator import SchemaValidator
+
+
+def test_export_bundle_validator_is_compiled_once():
+    """Test that bundle validation goes through the cached validator."""
+    validator = SchemaValidator()
+    bundle = ExportBundle(engagement_id="eng-1").to_dict()
+
+    assert validator.validate_export_bundle(bundle)
+    compiled = validator._validators_by_name["bundle"]
+    assert validator.validate_export_bundle(bundle)
+    assert validator._validators_by_name["bundle"] is compiled
+
+    with pytest.raises(jsonschema.ValidationError):
+        validator.validate_export_bundle({**bundle, "bundle_version": "2.0"})
+
+
+def test_identical_schemas_share_one_compiled_validator(monkeypatch):
+    """Test that validators are keyed by schema content, not name or key order."""
+    from bhd_cli.assistant.core import schema_validator
+    from bhd_cli.assistant.core.hypothesis_drafter import HypothesisDrafter
+
+    monkeypatch.setattr(SchemaValidator, "_validator_cache", {})
+    compiles = []
+    real_compile = schema_validator.compile_validator
+    monkeypatch.setattr(
+        schema_validator, "compile_validator",
+        lambda schema: compiles.append(schema) or real_compile(schema)
+    )
+
+    schema_a = {"type": "object", "required": ["id"]}
+    schema_b = {"required": ["id"], "type": "object"}
+    assert SchemaValidator.compiled(schema_a) is SchemaValidator.compiled(schema_b)
+    assert len(compiles) == 1
+
+    # The drafter and separate validator instances share the hypothesis validator
+    drafter = HypothesisDrafter(llm_provider=None, policy_guard=None)
+    first, second = SchemaValidator(), SchemaValidator()
+    assert first.compiled(first._load_schema("hypothesis")) is drafter._validate
+    assert second.compiled(second._load_schema("hypothesis")) is drafter._validate
+    assert len(compiles) == 2
+
+
+def test_fast_validator_defers_rejections_to_jsonschema(monkeypatch):
+    """Test that data the fast path rejects is re-checked, and errors come from jsonschema."""
+    from types import SimpleNamespace
+
+    from bhd_cli.assistant.core import schema_validator
+
+    class FastError(Exception):
+        pass
+
+    def fake_compile(schema, use_default=True):
+        assert use_default is False
+
+        def fast(data):
+            # Stricter than the schema: rejects everything but exact matches
+            if data != {"name": "ok"}:
+                raise FastError(data)
+        return fast
+
+    monkeypatch.setattr(
+        schema_validator, "fastjsonschema",
+        SimpleNamespace(compile=fake_compile, JsonSchemaException=FastError)
+    )
+    validate = schema_validator.compile_validator({
+        "type": "object",
+        "required": ["name"],
+        "properties": {"name": {"type": "string"}}
+    })
+
+    validate({"name": "ok"})
+    validate({"name": "also valid"})
+    with pytest.raises(jsonschema.ValidationError, match="'name' is a required property"):
+        validate({})
+
+
+def test_validation_leaves_input_unchanged():
+    """Test that validating never fills in schema defaults on the caller's dict."""
+    import copy
+
+    validator = SchemaValidator()
+    hypothesis = {
+        "id": "hyp-1",
+        "related_observations": ["obs-1"],
+        "title": "t",
+        "description": "d",
+        "risk_tags": [],
+        "confidence": 0.5,
+        "rationale": "r",
+    }
+    before = copy.deepcopy(hypothesis)
+
+    assert validator.validate_hypothesis(hypothesis)
+    assert hypothesis == before
+    assert "requires_validation" not in hypothesis
@@ -0,0 +1,144 @@
+"""Unit tests for pure helper functions in bhd_cli.cli."""
+from bhd_cli.cli import (
+    finding_number,
+    finding_sort_key,
+    insert_finding,
+    next_finding_id,
+    now_iso,
+    remediation_priority,
+    severity_from,
+    slugify,
+    validate_finding_fields,
+)
+
+
+def test_slugify_collapses_separators():
+    """Spaces, dashes and underscores collapse into a single dash."""
+    assert slugify("  Acme  Corp__Web--App  ") == "acme-corp-web-app"
+
+
+def test_slugify_drops_punctuation_and_keeps_unicode():
+    """Punctuation is removed; non-ASCII letters are kept."""
+    assert slugify("Tyler's Home.Net") == "tylers-homenet"
+    assert slugify("Café Niño") == "café-niño"
+
+
+def test_slugify_empty_fallback():
+    """Names with no usable characters fall back to 'engagement'."""
+    assert slugify("!!!") == "engagement"
+    assert slugify("") == "engagement"
+
+
+def test_next_finding_id():
+    """Next ID is one past the highest well-formed F-### ID."""
+    assert next_finding_id([]) == "F-001"
+    findings = [{"id": "F-002"}, {"id": "F-010"}, {"id": "bogus"}, {}]
+    assert next_finding_id(findings) == "F-011"
+
+
+def test_finding_number():
+    """Only well-formed F-### IDs yield a number."""
+    assert finding_number("F-023") == 23
+    assert finding_number("F-1000") == 1000
+    assert finding_number("F-") is None
+    assert finding_number("F-2a") is None
+    assert finding_number("f-002") is None
+    assert finding_number("bogus") is None
+
+
+def test_insert_finding_keeps_id_order():
+    """New findings land in ID order, with malformed IDs kept last."""
+    findings = [{"id": "F-001"}, {"id": "F-003"}, {"id": "bogus"}]
+    insert_finding(findings, {"id": "F-002"})
+    insert_finding(findings, {"id": "F-004"})
+    assert [f["id"] for f in findings] == ["F-001", "F-002", "F-003", "F-004", "bogus"]
+
+
+def test_now_iso_format():
+    """Timestamps are second-resolution UTC in ISO 8601 with a Z suffix."""
+    import re
+
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", now_iso())
+
+
+def test_finding_sort_key():
+    """Malformed IDs sort after numeric ones."""
+    findings = [{"id": "F-010"}, {"id": "x"}, {"id": "F-002"}]
+    assert [f["id"] for f in sorted(findings, key=finding_sort_key)] == ["F-002", "F-010", "x"]
+
+
+def test_validate_finding_fields_accepts_real_finding():
+    """A specific, well-described finding passes validation."""
+    errors = validate_finding_fields(
+        "UPnP Enabled on Router",
+        "UPnP is enabled on the edge router and allows automatic port mappings.",
+        "Router admin UI shows UPnP: On",
+        "Internal devices can be exposed to the internet without review.",
+        "Disable UPnP in the router admin UI.",
+    )
+    assert errors == []
+
+
+def test_validate_finding_fields_flags_placeholders():
+    """Placeholder titles, phase dumps, wizard text and init evidence are rejected."""
+    errors = validate_finding_fields(
+        "Recon phase notes",
+        "Reconnaissance done, scanning done, enumeration in progress.",
+        "ran ./bhd-cli   init",
+        "Client name: Acme, project name: test",
+        "Fix it",
+    )
+    joined = "\n".join(errors)
+    assert "placeholder/process note" in joined
+    assert "phase/wizard output" in joined
+    assert "Evidence is 'init'" in joined
+    assert "Business Impact looks like tool output" in joined
+    assert "Recommendation is too short" in joined
+
+
+def test_severity_matrix():
+    """Severity follows the impact x likelihood matrix; unknown input is Medium."""
+    assert severity_from("Critical", "Low") == "High"
+    assert severity_from("High", "High") == "Critical"
+    assert severity_from("Medium", "Low") == "Low"
+    assert severity_from("Informational", "High") == "Informational"
+    assert severity_from("Bogus", "High") == "Medium"
+    assert remediation_priority("Critical") == "Immediate (0–7 days)"
+    assert remediation_priority("Bogus") == "Planned (30–90 days)"
+
+
+def test_keyword_checks_without_ahocorasick(monkeypatch):
+    """Wizard/phase detection on the regex fallback gives the exact expected answers."""
+    import bhd_cli.cli as cli
+
+    scanned = []
+
+    class Spy:
+        """Delegates to a compiled pattern and records that the fallback ran."""
+
+        def __init__(self, name, pattern):
+            self.name, self.pattern = name, pattern
+
+        def search(self, text):
+            scanned.append(self.name)
+            return self.pattern.search(text)
+
+        def findall(self, text):
+            scanned.append(self.name)
+            return self.pattern.findall(text)
+
+    monkeypatch.setattr(cli, "_keyword_automaton", lambda words: None)
+    monkeypatch.setattr(cli, "_WIZARD_RE", Spy("wizard", cli._WIZARD_RE))
+    monkeypatch.setattr(cli, "_PHASE_RE", Spy("phase", cli._PHASE_RE))
+
+    samples = [
+        "Client name: Acme",
+        "plain description of an exposed service",
+        "Reconnaissance, scanning and enumeration were done",
+        "scanning scanning scanning",
+        "Scanning and enumeration only",
+    ]
+    results = [(cli.looks_like_wizard_output(s), cli.looks_like_phase_dump(s)) for s in samples]
+
+    assert results == [(True, False), (False, False), (False, True), (False, False), (False, False)]
+    assert scanned == ["wizard", "phase"] * len(samples)
@@ -312,3 +312,205 @@ def test_osint_test_type(tmp_path):
     # Verify JSON structure
     loaded_data = json.loads((eng1_dir / "engagement.json").read_text())
     assert loaded_data["meta"]["test_type"] == "osint", "Test type should be 'osint'"
+
+
+def _make_engagement_with_findings(tmp_path, ids):
+    """Create a current engagement containing minimal findings with the given IDs."""
+    eng_dir = tmp_path / "engagements"
+    eng1_dir = eng_dir / "test-findings-20260301-000000"
+    eng1_dir.mkdir(parents=True)
+    findings = [
+        {"id": fid, "title": f"Finding {fid}", "severity": "Medium", "status": "open",
+         "affected_target": "10.0.0.1", "description": "desc", "evidence": "ev",
+         "business_impact": "bi", "recommendation": "rec"}
+        for fid in ids
+    ]
+    engagement_data = {
+        "meta": {"client": "c", "project": "p", "test_type": "network"},
+        "scope": {"in_scope": ["10.0.0.1"]},
+        "work": {"findings": findings, "notes": []},
+    }
+    (eng1_dir / "engagement.json").write_text(json.dumps(engagement_data, indent=2))
+    (eng_dir / ".current").write_text("test-findings-20260301-000000")
+    return eng1_dir
+
+
+def test_finding_status_and_delete(tmp_path):
+    """Test finding status update and delete act on the requested ID only."""
+    eng1_dir = _make_engagement_with_findings(tmp_path, ["F-001", "F-002", "F-003"])
+
+    result = subprocess.run(
+        [sys.executable, "-m", "bhd_cli.cli", "finding", "status", "F-002", "remediated"],
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path),
+    )
+    assert result.returncode == 0, f"finding status failed: {result.stderr}"
+    assert "F-002 status: open → remediated" in result.stdout
+
+    result = subprocess.run(
+        [sys.executable, "-m", "bhd_cli.cli", "finding", "delete", "F-001"],
+        input="y\n",
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path),
+    )
+    assert result.returncode == 0, f"finding delete failed: {result.stderr}"
+
+    findings = json.loads((eng1_dir / "engagement.json").read_text())["work"]["findings"]
+    assert [f["id"] for f in findings] == ["F-002", "F-003"]
+    assert findings[0]["status"] == "remediated"
+
+    result = subprocess.run(
+        [sys.executable, "-m", "bhd_cli.cli", "finding", "show", "F-001"],
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path),
+    )
+    assert result.returncode == 1
+    assert "Finding F-001 not found." in result.stderr
+
+
+def test_phase_status_only_saves_when_backfilling(tmp_path):
+    """Test phase status backfills missing phases once, then leaves the file alone."""
+    eng1_dir = _make_engagement_with_findings(tmp_path, [])
+    eng_file = eng1_dir / "engagement.json"
+
+    def run_phase_status():
+        result = subprocess.run(
+            [sys.executable, "-m", "bhd_cli.cli", "phase", "status"],
+            capture_output=True,
+            text=True,
+            cwd=str(tmp_path),
+        )
+        assert result.returncode == 0, f"phase status failed: {result.stderr}"
+        assert "- Reporting: not_started" in result.stdout
+
+    run_phase_status()
+    phases = json.loads(eng_file.read_text())["methodology"]["phases"]
+    assert "Pre-Engagement" in phases
+    first_mtime = eng_file.stat().st_mtime_ns
+
+    run_phase_status()
+    assert eng_file.stat().st_mtime_ns == first_mtime
+
+
+def test_report_generation(tmp_path):
+    """Test report renders summary counts, sorted findings and ends with a newline."""
+    eng1_dir = _make_engagement_with_findings(tmp_path, ["F-010", "F-002"])
+
+    result = subprocess.run(
+        [sys.executable, "-m", "bhd_cli.cli", "report"],
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path),
+    )
+    assert result.returncode == 0, f"report failed: {result.stderr}"
+
+    report = (eng1_dir / "report.md").read_text()
+    assert report.startswith("# Penetration Test Report — c\n")
+    assert "**2** total findings" in report
+    assert "Medium 2," in report
+    assert report.index("### F-002") < report.index("### F-010")
+    assert report.endswith("_No general notes were recorded._\n")
+
+
+def test_home_audit_answers_file_matches_wizard(tmp_path):
+    """Test home-audit --answers creates the same findings as the interactive wizard."""
+    eng1_dir = _make_engagement_with_findings(tmp_path, [])
+    eng_file = eng1_dir / "engagement.json"
+
+    def run_home_audit(*extra, stdin=None):
+        result = subprocess.run(
+            [sys.executable, "-m", "bhd_cli.cli", "home-audit", "run", *extra],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            cwd=str(tmp_path),
+        )
+        assert result.returncode == 0, f"home-audit run failed: {result.stderr}"
+        findings = json.loads(eng_file.read_text())["work"]["findings"]
+        return [(f["id"], f["title"], f["severity"]) for f in findings]
+
+    # make, ip, fw known?, wifi=WPA/WPA2 mixed, wps, upnp, remote, guest, iot,
+    # dns=None, password=Okay but reused, port forwards, exposed=Unknown, devices
+    wizard = run_home_audit(stdin="Acme R1\n192.168.1.1\nn\n3\ny\ny\nn\nn\ny\n1\n2\nn\n3\n12\n")
+
+    answers = tmp_path / "answers.json"
+    answers.write_text(json.dumps({
+        "router_make": "Acme R1", "router_ip": "192.168.1.1", "fw_ver": "unknown",
+        "wifi_mode": "WPA/WPA2 mixed", "wps_enabled": True, "upnp_enabled": True,
+        "remote_admin": False, "guest_net": False, "iot_isolated": True,
+        "dns_filter": "None", "pass_strength": "Okay but reused", "port_fw": False,
+        "exposed_services": "Unknown", "device_count": "12",
+    }))
+    batch = run_home_audit("--answers", str(answers))
+
+    assert batch == wizard
+    assert [fid for fid, _, _ in batch] == ["F-001", "F-002", "F-003", "F-004", "F-005", "F-006", "F-007", "F-008"]
+
+
+def test_home_audit_answers_file_rejects_bad_values(tmp_path):
+    """Test home-audit --answers reports invalid answers without touching the engagement."""
+    eng1_dir = _make_engagement_with_findings(tmp_path, [])
+    before = (eng1_dir / "engagement.json").read_text()
+    answers = tmp_path / "answers.json"
+    answers.write_text(json.dumps({"wifi_mode": "WPA9", "wps_enabled": "yes"}))
+
+    result = subprocess.run(
+        [sys.executable, "-m", "bhd_cli.cli", "home-audit", "run", "--answers", str(answers)],
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path),
+    )
+    assert result.returncode == 1
+    assert "wifi_mode: expected one of" in result.stderr
+    assert "wps_enabled: expected true or false" in result.stderr
+    assert (eng1_dir / "engagement.json").read_text() == before
+
+
+def test_shell_runs_commands_until_exit(tmp_path):
+    """Test the shell runs several commands and survives errors and bad input."""
+    _make_engagement_with_findings(tmp_path, ["F-001"])
+
+    result = subprocess.run(
+        [sys.executable, "-m", "bhd_cli.cli", "shell"],
+        input="version\n\nfinding show F-999\nnot-a-command\nfinding list\nexit\nversion\n",
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path),
+    )
+    assert result.returncode == 0, f"shell failed: {result.stderr}"
+    assert result.stdout.count("bhd-cli 1.") == 1
+    assert "Finding F-999 not found." in result.stderr
+    assert "invalid choice: 'not-a-command'" in result.stderr
+    assert "- F-001 [Medium] (open) Finding F-001" in result.stdout
+
+
+def test_shell_failed_command_does_not_leak_into_next_save(tmp_path):
+    """Test that a shell command that fails part way never has its edits saved later."""
+    eng1_dir = _make_engagement_with_findings(tmp_path, [])
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({
+        "router_make": "Acme R1", "router_ip": "192.168.1.1", "fw_ver": "unknown",
+        "wifi_mode": "WPA/WPA2 mixed", "wps_enabled": True, "upnp_enabled": True,
+        "remote_admin": False, "guest_net": False, "iot_isolated": True,
+        "dns_filter": "None", "pass_strength": "Okay but reused", "port_fw": False,
+        "exposed_services": "Unknown", "device_count": "12",
+    }))
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"wifi_mode": "WPA9"}))
+
+    result = subprocess.run(
+        [sys.executable, "-m", "bhd_cli.cli", "shell"],
+        input=f"home-audit run --answers {good}\nhome-audit run --answers {bad}\nnote after\nexit\n",
+        capture_output=True,
+        text=True,
+        cwd=str(tmp_path),
+    )
+    assert result.returncode == 0, f"shell failed: {result.stderr}"
+    assert "wifi_mode: expected one of" in result.stderr
+
+    work = json.loads((eng1_dir / "engagement.json").read_text())["work"]
+    assert len(work["findings"]) == 8
+    assert [n["text"] for n in work["notes"]][-1] == "after"
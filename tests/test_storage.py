@@ -0,0 +1,179 @@
+"""Tests for the bhd-cli engagement storage layer."""
+import json
+
+import pytest
+
+import bhd_cli.storage as storage_mod
+from bhd_cli.storage import JSONStorage
+
+
+def test_load_missing_returns_empty(tmp_path):
+    """Loading a folder without engagement.json returns an empty dict."""
+    assert JSONStorage().load(tmp_path) == {}
+
+
+def test_load_is_cached_until_file_changes(tmp_path, monkeypatch):
+    """With the cache on, unchanged files are parsed once; external edits are picked up."""
+    parses = []
+    real_load_file = storage_mod._load_file
+    monkeypatch.setattr(
+        storage_mod, "_load_file", lambda f, size: parses.append(f) or real_load_file(f, size)
+    )
+    store = JSONStorage(cache=True)
+    f = tmp_path / "engagement.json"
+    f.write_text(json.dumps({"meta": {"client": "a"}}))
+
+    first = store.load(tmp_path)
+    assert store.load(tmp_path) is first
+    assert len(parses) == 1
+
+    f.write_text(json.dumps({"meta": {"client": "bb"}}))
+    assert store.load(tmp_path)["meta"]["client"] == "bb"
+
+
+def test_load_is_uncached_by_default(tmp_path, monkeypatch):
+    """A one-shot storage parses on every load and hands out independent dicts."""
+    parses = []
+    real_load_file = storage_mod._load_file
+    monkeypatch.setattr(
+        storage_mod, "_load_file", lambda f, size: parses.append(f) or real_load_file(f, size)
+    )
+    store = JSONStorage()
+    store.save(tmp_path, {"work": {"findings": [{"id": "F-001"}]}})
+
+    loaded = store.load(tmp_path)
+    loaded["work"]["findings"].clear()
+    assert store.load(tmp_path) == {"work": {"findings": [{"id": "F-001"}]}}
+    assert len(parses) == 2
+
+
+def test_clear_cache_drops_unsaved_edits(tmp_path):
+    """Cached loads share the saved dict; clear_cache() goes back to the file."""
+    store = JSONStorage()
+    store.enable_cache()
+    saved = {"work": {"findings": []}}
+    store.save(tmp_path, saved)
+    assert store.load(tmp_path) is saved
+
+    saved["work"]["findings"].append({"id": "F-002"})
+    store.clear_cache()
+    assert store.load(tmp_path) == {"work": {"findings": []}}
+
+
+def test_save_round_trip(tmp_path):
+    """Saved data is readable by a fresh storage instance."""
+    data = {"meta": {"client": "c"}, "work": {"findings": []}}
+    JSONStorage().save(tmp_path, data)
+    assert JSONStorage().load(tmp_path) == data
+
+
+def test_save_without_orjson_matches_stdlib(tmp_path, monkeypatch):
+    """The stdlib fallback writes the same indented, insertion-ordered JSON."""
+    monkeypatch.setattr(storage_mod, "orjson", None)
+    data = {"z": 1, "a": {"nested": ["x", "y"]}}
+    JSONStorage().save(tmp_path, data)
+    assert (tmp_path / "engagement.json").read_text() == json.dumps(data, indent=2)
+    assert JSONStorage().load(tmp_path) == data
+
+
+def test_save_replaces_atomically(tmp_path):
+    """Saving overwrites the existing file and leaves no temp file behind."""
+    store = JSONStorage()
+    store.save(tmp_path, {"v": 1})
+    store.save(tmp_path, {"v": 2})
+    assert json.loads((tmp_path / "engagement.json").read_text()) == {"v": 2}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["engagement.json"]
+
+
+def test_large_engagements_saved_compact(tmp_path):
+    """Engagements over the findings threshold are written without indentation."""
+    from bhd_cli.storage import PRETTY_MAX_FINDINGS
+
+    store = JSONStorage()
+    data = {"work": {"findings": [{"id": f"F-{i:03d}"} for i in range(PRETTY_MAX_FINDINGS + 1)]}}
+    store.save(tmp_path, data)
+    raw = (tmp_path / "engagement.json").read_text()
+    assert "\n" not in raw
+    assert json.loads(raw) == data
+
+    store.save(tmp_path, data, pretty=True)
+    assert "\n  " in (tmp_path / "engagement.json").read_text()
+
+
+def test_export_json_sorted_keys(tmp_path):
+    """Exports are indented with keys sorted for deterministic output."""
+    store = JSONStorage()
+    store.save(tmp_path, {"meta": {"z": 1, "a": 2}, "scope": {"in_scope": []}})
+    export_path = tmp_path / "export.json"
+    store.export_json(tmp_path, export_path)
+    raw = export_path.read_text()
+    assert raw.index('"a"') < raw.index('"z"')
+    assert raw.startswith('{\n  "meta"')
+    assert json.loads(raw)["scope"] == {"in_scope": []}
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_non_ascii_bytes_do_not_depend_on_orjson(tmp_path, monkeypatch, pretty):
+    """Saves and exports escape non-ASCII text whether or not orjson is installed."""
+    data = {
+        "meta": {"client": "Café Ltd"},
+        "work": {"findings": [{"id": "F-001", "remediation_priority": "P1 — Fix now"}]},
+    }
+
+    def written(orjson_module):
+        monkeypatch.setattr(storage_mod, "orjson", orjson_module)
+        out = tmp_path / ("orjson" if orjson_module else "stdlib")
+        out.mkdir()
+        store = JSONStorage()
+        store.save(out, data, pretty=pretty)
+        store.export_json(out, out / "export.json")
+        return (out / "engagement.json").read_bytes(), (out / "export.json").read_bytes()
+
+    fast = written(storage_mod.orjson)
+    plain = written(None)
+
+    assert fast == plain
+    assert plain[0] == json.dumps(
+        data, **({"indent": 2} if pretty else {"separators": (",", ":")})
+    ).encode()
+    assert all(raw.isascii() for raw in plain)
+    assert b"\\u2014" in plain[0]
+
+
+def test_load_interns_enum_fields(tmp_path):
+    """Repeated severity/status values share one string object after load."""
+    findings = [{"id": f"F-00{i}", "severity": "Hi" + "gh", "status": "op" + "en"} for i in range(3)]
+    data = {"work": {"findings": findings}, "methodology": {"phases": {"Scanning": {"status": "in_progress"}}}}
+    (tmp_path / "engagement.json").write_text(json.dumps(data))
+
+    loaded = JSONStorage().load(tmp_path)
+    severities = [f["severity"] for f in loaded["work"]["findings"]]
+    assert all(s is severities[0] for s in severities)
+    assert loaded["work"]["findings"][2]["status"] is loaded["work"]["findings"][0]["status"]
+    assert loaded == data
+
+
+@pytest.mark.skipif(storage_mod.orjson is None, reason="mmap path requires orjson")
+def test_load_large_file_via_mmap(tmp_path, monkeypatch):
+    """Files over the mmap threshold parse to the same data."""
+    monkeypatch.setattr(storage_mod, "MMAP_MIN_BYTES", 1)
+    data = {"meta": {"client": "m"}, "work": {"findings": [{"id": "F-001", "severity": "Low"}]}}
+    (tmp_path / "engagement.json").write_text(json.dumps(data))
+    assert JSONStorage().load(tmp_path) == data
+
+
+def test_load_tolerates_malformed_entries(tmp_path):
+    """Non-dict findings/phases and odd container types load as they did before interning."""
+    data = {
+        "work": {"findings": ["not-a-dict", None, {"id": "F-001", "severity": "Low"}]},
+        "methodology": {"phases": {"Recon": "done", "Scanning": {"status": "in_progress"}}},
+    }
+    (tmp_path / "engagement.json").write_text(json.dumps(data))
+    assert JSONStorage().load(tmp_path) == data
+
+    odd = {"work": {"findings": {"F-001": {}}}, "methodology": ["x"]}
+    (tmp_path / "engagement.json").write_text(json.dumps(odd))
+    assert JSONStorage().load(tmp_path) == odd
+
+    (tmp_path / "engagement.json").write_text("[1, 2]")
+    assert JSONStorage().load(tmp_path) == [1, 2]